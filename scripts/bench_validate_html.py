@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Benchmark + regression gate for validate_html.py.
+
+Generates deterministic synthetic pages (100 KB, 1 MB, 10 MB) built from the
+tech-demo card markup: deep div nesting, many inline SVGs and long text runs.
+Each page is written to a temporary file and validated from there in
+full-read and streaming mode, exactly as check_file() runs, so the peak Python
+memory (tracemalloc) of both modes includes the text read from the file.
+Throughput (best of N) and peak memory are compared with the baseline in
+tests/validate_bench_baseline.json, which is committed with the code it
+measures (re-record it with --update-baseline when the validator changes).
+A throughput drop or memory growth beyond the tolerance exits with 1; cases
+without a baseline are not a pass and exit with 2.
+
+Usage:
+  python3 scripts/bench_validate_html.py                   # compare with baseline
+  python3 scripts/bench_validate_html.py --update-baseline # record a new baseline
+  python3 scripts/bench_validate_html.py --sizes 100k,1m --write-corpus /tmp/corpus
+"""
+import sys
+import os
+import json
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import validate_html  # noqa: E402
+
+# Tracked, so the gate compares against the same numbers on every checkout
+BASELINE_PATH = os.path.join(validate_html.ROOT_DIR, "tests", "validate_bench_baseline.json")
+# Bumped whenever what is measured changes; older baselines are ignored
+BASELINE_VERSION = 2
+SIZES = {'100k': 100 * 1024, '1m': 1024 ** 2, '10m': 10 * 1024 ** 2}
+MODES = ('full', 'stream')
+DEFAULT_TOLERANCE = 0.25
+
+# Carbon-style icon paths, as used for the tech-demo card buttons
+ICON_PATHS = [
+    "M11 11v10h10V11Zm8 8h-6v-6h6Z",
+    "M30 13v-2h-4V8a2 2 0 0 0-2-2h-3V2h-2v4h-6V2h-2v4H8a2 2 0 0 0-2 2v3H2v2h4v6H2v2h4v3a2 2 0 0 0 2 2h3v4h2v-4h6v4h2v-4h3a2 2 0 0 0 2-2v-3h4v-2h-4v-6Zm-6 11H8V8h16Z",
+    "M19 27H5V13h4v-2H5c-1.1 0-2 .9-2 2v6H0v2h3v6c0 1.1.9 2 2 2h14c1.1 0 2-.9 2-2v-4h-2v4z",
+    "M12 30H4a2.002 2.002 0 0 1-2-2V4a2.002 2.002 0 0 1 2-2h24a2.002 2.002 0 0 1 2 2v8h-2V4H4v24h8Z",
+]
+COLORS = ['blue', 'emerald', 'purple', 'amber', 'rose', 'cyan']
+WORDS = ("agent voice latency routing booking support pipeline revenue session "
+         "escalation onboarding metric socket glass render layout").split()
+
+CARD_TEMPLATE = """                <!-- Card: {title} -->
+                <div class="relative group h-full socket-card-container">
+                    <svg class="absolute inset-0 w-full h-full z-0 pointer-events-none text-slate-300" overflow="visible">
+                        <defs>
+                            <linearGradient id="grad-{uid}" x1="0%" y1="0%" x2="100%" y2="100%">
+                                <stop offset="0%" stop-color="rgba(255,255,255,0.1)" />
+                                <stop offset="100%" stop-color="transparent" />
+                            </linearGradient>
+                        </defs>
+                        <path class="socket-path" fill="url(#grad-{uid})" vector-effect="non-scaling-stroke" />
+                    </svg>
+                    <div class="absolute top-0 right-0 w-14 h-14 z-20 flex items-center justify-center">
+                        <div class="absolute inset-0 rounded-full bg-white/10 backdrop-blur-xl"></div>
+                        <div class="relative z-30" style="transform: translateZ(1px);">
+                            <svg class="w-6 h-6 text-white/90" viewBox="0 0 32 32"><path fill="currentColor" d="{icon}"></path></svg>
+                        </div>
+                    </div>
+                    <div class="relative h-full p-4 lg:p-8 flex flex-col z-10 pointer-events-none">
+                        <div class="flex flex-col mb-4 border-b border-white/5 pb-2 mr-16">
+                            <h3 class="text-sm font-normal text-white tracking-wide">{title}</h3>
+                            <p class="text-xs text-slate-500 mt-0.5">{subtitle}</p>
+                        </div>
+                        <div class="grid grid-cols-3 gap-y-3 gap-x-4 text-[10px] w-full">{rows}
+                        </div>
+                    </div>
+                </div>
+"""
+
+ROW_TEMPLATE = """
+                            <div class="text-slate-400 flex items-center">{label}</div>
+                            <div class="text-white text-right font-mono">{value}</div>
+                            <div class="flex items-center"><div class="h-1 w-full bg-slate-800 rounded-full overflow-hidden"><div class="h-full bg-{color}-500 w-[{width}%]"></div></div></div>"""
+
+
+def words(rng, n):
+    return ' '.join(rng.choice(WORDS) for _ in range(n))
+
+
+def card_block(rng, uid):
+    rows = ''.join(ROW_TEMPLATE.format(label=words(rng, 1).title(), value=rng.randint(1, 999),
+                                       color=rng.choice(COLORS), width=rng.randint(1, 100))
+                   for _ in range(6))
+    return CARD_TEMPLATE.format(title=words(rng, 2).title(), subtitle=words(rng, 2), uid=uid,
+                                icon=rng.choice(ICON_PATHS), rows=rows)
+
+
+def nesting_block(rng, depth):
+    opens = ''.join(f'{"  " * i}<div class="layer-{i}">\n' for i in range(depth))
+    closes = ''.join(f'{"  " * i}</div>\n' for i in reversed(range(depth)))
+    return opens + f'<span>{words(rng, 8)}</span>\n' + closes
+
+
+def text_block(rng, chars):
+    text = words(rng, chars // 7)
+    return f'<p class="text-slate-400 leading-relaxed">{text}</p>\n'
+
+
+def generate_page(target_bytes, seed=0):
+    """Deterministic synthetic page of roughly target_bytes (always balanced)."""
+    rng = random.Random(seed)
+    head = ('<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+            '<title>Validator benchmark</title>\n<link rel="stylesheet" href="/assets/css/styles.css">\n'
+            '</head>\n<body>\n<main class="relative overflow-hidden bg-slate-950">\n')
+    tail = '</main>\n<script type="module" src="/assets/js/tech-demo-main.js"></script>\n</body>\n</html>\n'
+    parts = [head]
+    size = len(head) + len(tail)
+    section = 0
+    while size < target_bytes:
+        block = [f'<section id="bench-{section}" class="relative py-24">\n'
+                 f'<div class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">\n']
+        for card in range(6):
+            block.append(card_block(rng, f"{section}-{card}"))
+        block.append('</div>\n')
+        block.append(nesting_block(rng, rng.randint(20, 60)))
+        block.append(text_block(rng, rng.randint(2000, 8000)))
+        block.append('</section>\n')
+        chunk = ''.join(block)
+        parts.append(chunk)
+        size += len(chunk)
+        section += 1
+    parts.append(tail)
+    return ''.join(parts)
+
+
+def run_once(path, mode):
+    return validate_html.check_file(path, stream=mode == 'stream')
+
+
+def measure(path, mode, repeat):
+    """
+    Best-of-N throughput in MB/s plus tracemalloc peak (KB) of one extra run.
+    Both modes read the page from `path` inside the traced run, so the full
+    read's page string counts just like the streamed chunks do.
+    """
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run_once(path, mode)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    run_once(path, mode)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    nbytes = os.path.getsize(path)
+    return {
+        'bytes': nbytes,
+        'seconds': round(best, 6),
+        'mb_per_s': round(nbytes / best / 1024 ** 2, 3),
+        'peak_kb': round(peak / 1024, 1),
+        'errors': len(result['errors']) + (result['critical'] is not None),
+    }
+
+
+def compare(current, baseline, tolerance):
+    """Returns a list of regression messages (empty if within tolerance)."""
+    problems = []
+    if current['mb_per_s'] < baseline['mb_per_s'] * (1 - tolerance):
+        problems.append(f"throughput {current['mb_per_s']} MB/s < baseline {baseline['mb_per_s']} MB/s")
+    if current['peak_kb'] > baseline['peak_kb'] * (1 + tolerance):
+        problems.append(f"peak memory {current['peak_kb']} KB > baseline {baseline['peak_kb']} KB")
+    return problems
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Benchmark validate_html.py against a stored baseline.")
+    parser.add_argument("--sizes", default=','.join(SIZES), help=f"Comma-separated page sizes ({', '.join(SIZES)})")
+    parser.add_argument("--modes", default=','.join(MODES), help=f"Comma-separated modes ({', '.join(MODES)})")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case (best is kept)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed relative slowdown / memory growth before failing")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Write this run as the new baseline")
+    parser.add_argument("--write-corpus", metavar="DIR", help="Also write the generated pages to DIR")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    sizes = [s.strip() for s in args.sizes.split(',') if s.strip()]
+    modes = [m.strip() for m in args.modes.split(',') if m.strip()]
+    unknown = [s for s in sizes if s not in SIZES] + [m for m in modes if m not in MODES]
+    if unknown:
+        print(f"Error: unknown size/mode: {', '.join(unknown)}")
+        sys.exit(2)
+
+    try:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        stored = {}
+    baseline = stored.get('cases', {}) if stored.get('version') == BASELINE_VERSION else {}
+
+    print("----------------------------------------")
+    print("⏱  Validator Benchmark                  ")
+    print("----------------------------------------")
+
+    results = {}
+    failure = False
+    unbaselined = []
+    corpus_dir = args.write_corpus or tempfile.mkdtemp(prefix="validate_bench_")
+    os.makedirs(corpus_dir, exist_ok=True)
+    for size in sizes:
+        path = os.path.join(corpus_dir, f"bench_{size}.html")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(generate_page(SIZES[size]))
+        for mode in modes:
+            key = f"{size}/{mode}"
+            current = measure(path, mode, args.repeat)
+            results[key] = current
+            line = (f"{key:<12} {current['mb_per_s']:>8.2f} MB/s  peak {current['peak_kb']:>9.1f} KB"
+                    f"  ({current['seconds'] * 1000:.1f} ms)")
+            if current['errors']:
+                print(f"❌ {line}  corpus page produced {current['errors']} validation errors")
+                failure = True
+                continue
+            if args.update_baseline:
+                print(f"   {line}")
+                continue
+            if key not in baseline:
+                print(f"⏭  {line}  no baseline, not compared")
+                unbaselined.append(key)
+                continue
+            problems = compare(current, baseline[key], args.tolerance)
+            if problems:
+                print(f"❌ {line}  REGRESSION: {'; '.join(problems)}")
+                failure = True
+            else:
+                print(f"✅ {line}")
+        if not args.write_corpus:
+            os.remove(path)
+    if not args.write_corpus:
+        os.rmdir(corpus_dir)
+
+    print("----------------------------------------")
+    if args.update_baseline:
+        baseline.update(results)
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({'version': BASELINE_VERSION, 'cases': baseline}, f, indent=2)
+        print(f"📌  Baseline written to {os.path.relpath(args.baseline, validate_html.ROOT_DIR)}")
+
+    if failure:
+        print("❌  Benchmark regression detected.")
+        sys.exit(1)
+    if unbaselined:
+        print(f"⚠️  Not compared: no baseline for {', '.join(unbaselined)}. "
+              f"Run with --update-baseline to record one.")
+        sys.exit(2)
+    print("✅  Benchmark within tolerance.")
+    sys.exit(0)
@@ -12,7 +12,7 @@ with open(file_path, 'r') as f:
 # This implies that BEFORE Card 5, we have an extra closing div?
 # Or Card 4 Closed Too Many?
 
-# In `apply_math_socket.py`:
+# In `apply_math_socket.py` (removed; cards are now rendered by render_cards.py):
 # `output_buffer += '</div>\n                    </div>\n                </div>'`
 # This adds 3 closing divs.
 
@@ -35,7 +35,7 @@ start_idx = content.find(last_marker)
 # `output_buffer += content[last_idx:]`
 # If `last_idx` didn't skip the OLD closing divs, we duplicated them.
 
-# In `apply_math_socket.py`:
+# In `apply_math_socket.py` (removed; cards are now rendered by render_cards.py):
 # `last_idx = boundary_idx + len(ending_seq)`
 # depending on what `ending_seq` matched.
 
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Nesting-depth profile of a page, answering depth queries without re-scanning.
+
+One tokenization (span_index.tokenize(); raw-text contents, void and
+self-closing tags skipped) yields, per tag name and for all tags together
+('*'), the "water level" after every open / close tag of that name. The
+profile is stored as array-backed columns per tag:
+
+  pos, end   offsets of each open / close tag
+  depth      level after the tag (opens minus closes so far; may go negative)
+  deficit    deepest the level has been below zero so far (non-decreasing)
+  match      index of the matching close / open tag, -1 if there is none
+
+plus the line start offsets and an id -> (tag, index) table. Profiles live in
+.cache/depth_profiles/<sha256 of the page>.bin, so an unchanged page is never
+tokenized twice. Depth at an offset or line, the first place a level goes
+negative and where an element closes are then binary searches (O(log n)).
+Offsets are str indices into the decoded page, as in span_index.py.
+
+The whole-page "water level" check is validate_html.py's div-balance rule
+(--only div-balance); this module answers where a level changes.
+
+Usage:
+  python3 scripts/depth_profile.py deploy/tech-demo.html                        # per-tag summary
+  python3 scripts/depth_profile.py deploy/tech-demo.html --line 791 [--tag div]
+  python3 scripts/depth_profile.py deploy/tech-demo.html --offset 52000 --tag div
+  python3 scripts/depth_profile.py deploy/tech-demo.html --first-negative --tag div
+  python3 scripts/depth_profile.py deploy/tech-demo.html --close agent-grid     # id, or a line number
+"""
+import sys
+import os
+import json
+import bisect
+import hashlib
+import argparse
+from array import array
+
+from span_index import ID_ATTR_PATTERN, ROOT_DIR, hash_content, tokenize
+
+PROFILE_DIR = os.path.join(ROOT_DIR, ".cache", "depth_profiles")
+# Profiles kept on disk (oldest are removed first)
+PROFILE_CACHE_MAX = 32
+ALL_TAGS = '*'
+COLUMN_NAMES = ('pos', 'end', 'depth', 'deficit', 'match')
+# 32-bit signed columns: offsets, levels and indices of pages well below 2 GB
+TYPECODE = 'i'
+
+
+def profiler_version():
+    """Hash of this module and its tokenizer. A change invalidates every stored profile."""
+    h = hashlib.sha256()
+    for module_path in (os.path.abspath(__file__), os.path.join(os.path.dirname(os.path.abspath(__file__)), "span_index.py")):
+        with open(module_path, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+class Column:
+    """Depth events of one tag name (or of all tags)."""
+    def __init__(self, arrays=None):
+        arrays = arrays or {}
+        for name in COLUMN_NAMES:
+            setattr(self, name, arrays.get(name, array(TYPECODE)))
+        # '*' only: index of the tag name of each event in DepthProfile.tag_names
+        self.tags = arrays.get('tags', array(TYPECODE))
+
+    def arrays(self):
+        found = {name: getattr(self, name) for name in COLUMN_NAMES}
+        if len(self.tags):
+            found['tags'] = self.tags
+        return found
+
+    def level_at(self, offset):
+        """Level after every tag starting at or before `offset`."""
+        i = bisect.bisect_right(self.pos, offset)
+        return self.depth[i - 1] if i else 0
+
+    def first_negative(self):
+        """Index of the first tag after which the level is below zero, or None."""
+        i = bisect.bisect_right(self.deficit, 0)
+        return i if i < len(self.deficit) else None
+
+    def is_open(self, i):
+        return self.depth[i] > (self.depth[i - 1] if i else 0)
+
+
+class DepthProfile:
+    def __init__(self, length, line_starts, tag_names, columns, ids):
+        self.length = length
+        self.line_starts = line_starts  # offset of the first character of each line
+        self.tag_names = tag_names
+        self.columns = columns          # tag -> Column ('*' for all tags)
+        self.ids = ids                  # id -> [tag, index in that tag's column]
+
+    def column(self, tag=ALL_TAGS):
+        return self.columns.get(tag.lower() if tag != ALL_TAGS else tag) or Column()
+
+    def line_of(self, offset):
+        return bisect.bisect_right(self.line_starts, offset)
+
+    def line_end(self, line):
+        """Offset of the last character of a 1-based line."""
+        if line < len(self.line_starts):
+            return self.line_starts[line] - 1
+        return self.length - 1
+
+    def depth_at(self, offset, tag=ALL_TAGS):
+        return self.column(tag).level_at(offset)
+
+    def depth_at_line(self, line, tag=ALL_TAGS):
+        """Level at the end of a 1-based line."""
+        return self.column(tag).level_at(self.line_end(line))
+
+    def first_negative(self, tag=ALL_TAGS):
+        """(start, end) of the first close tag that takes the level below zero, or None."""
+        column = self.column(tag)
+        i = column.first_negative()
+        return None if i is None else (column.pos[i], column.end[i])
+
+    def close_of_index(self, tag, i):
+        column = self.column(tag)
+        j = column.match[i]
+        return None if j < 0 else (column.pos[j], column.end[j])
+
+    def close_of_id(self, element_id):
+        """(start, end) of the close tag of the element with this id; KeyError if the id is unknown."""
+        tag, i = self.ids[element_id]
+        return self.close_of_index(tag, i)
+
+    def element_on_line(self, line):
+        """(tag, index in its column) of the first element opened on a 1-based line, or None."""
+        everything = self.column()
+        start = self.line_starts[line - 1] if 0 < line <= len(self.line_starts) else self.length
+        i = bisect.bisect_left(everything.pos, start)
+        while i < len(everything.pos) and everything.pos[i] <= self.line_end(line):
+            if everything.is_open(i):
+                tag = self.tag_names[everything.tags[i]]
+                return tag, bisect.bisect_left(self.columns[tag].pos, everything.pos[i])
+            i += 1
+        return None
+
+
+def build_profile(content):
+    """Tokenizes the page once and fills every column."""
+    line_starts = array(TYPECODE, [0])
+    line_starts.extend(i + 1 for i, ch in enumerate(content) if ch == '\n')
+
+    tag_names = []
+    tag_numbers = {}
+    columns = {ALL_TAGS: Column()}
+    open_stacks = {ALL_TAGS: []}
+    ids = {}
+
+    def add(column, stack, is_open, start, end):
+        index = len(column.pos)
+        level = (column.depth[-1] if index else 0) + (1 if is_open else -1)
+        column.pos.append(start)
+        column.end.append(end)
+        column.depth.append(level)
+        column.deficit.append(max(column.deficit[-1] if index else 0, -level))
+        column.match.append(-1)
+        if is_open:
+            stack.append(index)
+        elif stack:
+            opened = stack.pop()
+            column.match[opened] = index
+            column.match[index] = opened
+        return index
+
+    for kind, tag, start, end in tokenize(content):
+        if kind in ('comment', 'void'):
+            continue
+        if tag not in columns:
+            tag_numbers[tag] = len(tag_names)
+            tag_names.append(tag)
+            columns[tag] = Column()
+            open_stacks[tag] = []
+        is_open = kind == 'open'
+        index = add(columns[tag], open_stacks[tag], is_open, start, end)
+        add(columns[ALL_TAGS], open_stacks[ALL_TAGS], is_open, start, end)
+        columns[ALL_TAGS].tags.append(tag_numbers[tag])
+        if is_open and 'id' in content[start:end].lower():
+            m = ID_ATTR_PATTERN.search(content, start, end)
+            if m:
+                ids.setdefault(m.group(1) if m.group(1) is not None else m.group(2), [tag, index])
+
+    return DepthProfile(len(content), line_starts, tag_names, columns, ids)
+
+
+def profile_path(content_hash):
+    return os.path.join(PROFILE_DIR, content_hash + ".bin")
+
+
+def save_profile(profile, content_hash):
+    """One file: a JSON header line, then the raw column arrays in header order."""
+    layout = [['lines', len(profile.line_starts)]]
+    blobs = [profile.line_starts]
+    for tag, column in profile.columns.items():
+        for name, values in column.arrays().items():
+            layout.append([f"{tag} {name}", len(values)])
+            blobs.append(values)
+    header = {
+        'profiler': profiler_version(),
+        'length': profile.length,
+        'tag_names': profile.tag_names,
+        'ids': profile.ids,
+        'layout': layout,
+        'typecode': TYPECODE,
+    }
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    path = profile_path(content_hash)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(json.dumps(header).encode('utf-8') + b"\n")
+        for values in blobs:
+            values.tofile(f)
+    os.replace(tmp_path, path)
+
+    stored = sorted((entry.path for entry in os.scandir(PROFILE_DIR) if entry.name.endswith('.bin')),
+                    key=os.path.getmtime)
+    for old_path in stored[:-PROFILE_CACHE_MAX]:
+        os.remove(old_path)
+
+
+def load_profile(content_hash):
+    """The stored profile for this content hash, or None (missing, or written by another profiler version)."""
+    try:
+        with open(profile_path(content_hash), 'rb') as f:
+            header = json.loads(f.readline())
+            if header.get('profiler') != profiler_version() or header.get('typecode') != TYPECODE:
+                return None
+            data = f.read()
+    except (OSError, ValueError):
+        return None
+
+    size = array(TYPECODE).itemsize
+    offset = 0
+    line_starts = None
+    columns = {}
+    for name, count in header['layout']:
+        values = array(TYPECODE)
+        values.frombytes(data[offset:offset + count * size])
+        offset += count * size
+        if name == 'lines':
+            line_starts = values
+        else:
+            tag, field = name.split(' ')
+            columns.setdefault(tag, {})[field] = values
+    return DepthProfile(header['length'], line_starts, header['tag_names'],
+                        {tag: Column(arrays) for tag, arrays in columns.items()}, header['ids'])
+
+
+def profile_for(content):
+    """(profile, True if it came from the cache). Builds and stores it on a miss."""
+    content_hash = hash_content(content)
+    profile = load_profile(content_hash)
+    if profile is not None:
+        return profile, True
+    profile = build_profile(content)
+    save_profile(profile, content_hash)
+    return profile, False
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Nesting-depth queries over a cached per-tag depth profile.")
+    parser.add_argument("file_path", help="Page to profile")
+    parser.add_argument("--tag", default=ALL_TAGS, help="Tag name to query (default: all tags together)")
+    query = parser.add_mutually_exclusive_group()
+    query.add_argument("--line", type=int, help="Depth at the end of this line")
+    query.add_argument("--offset", type=int, help="Depth at this character offset")
+    query.add_argument("--first-negative", action="store_true", help="Where the depth first drops below zero")
+    query.add_argument("--close", metavar="ID_OR_LINE",
+                       help="Where the element with this id (or the first one opened on this line) closes")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    try:
+        with open(args.file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except FileNotFoundError:
+        print(f"Error: File {args.file_path} not found.")
+        sys.exit(1)
+
+    profile, cached = profile_for(content)
+    label = f"<{args.tag}>" if args.tag != ALL_TAGS else "all tags"
+
+    if args.line is not None:
+        if not 0 < args.line <= len(profile.line_starts):
+            print(f"Error: {args.file_path} has {len(profile.line_starts)} lines.")
+            sys.exit(1)
+        print(f"Line {args.line}: depth {profile.depth_at_line(args.line, args.tag)} ({label})")
+        if args.tag == ALL_TAGS:
+            levels = {tag: profile.depth_at_line(args.line, tag) for tag in profile.tag_names}
+            print("  " + ", ".join(f"{tag} {level}" for tag, level in levels.items() if level))
+    elif args.offset is not None:
+        print(f"Offset {args.offset} (line {profile.line_of(args.offset)}): depth {profile.depth_at(args.offset, args.tag)} ({label})")
+    elif args.first_negative:
+        found = profile.first_negative(args.tag)
+        if found is None:
+            print(f"✅ Depth never goes negative ({label}).")
+        else:
+            print(f"❌ Depth first goes negative at line {profile.line_of(found[0])} ({label}): {content[found[0]:found[1]]}")
+            sys.exit(1)
+    elif args.close is not None:
+        if args.close.isdigit():
+            element = profile.element_on_line(int(args.close))
+            if element is None:
+                print(f"Error: No element opens on line {args.close}.")
+                sys.exit(1)
+            tag, index = element
+            opened = profile.column(tag).pos[index]
+            closed = profile.close_of_index(tag, index)
+        else:
+            if args.close not in profile.ids:
+                print(f"Error: Element with id='{args.close}' not found.")
+                sys.exit(1)
+            tag, index = profile.ids[args.close]
+            opened = profile.column(tag).pos[index]
+            closed = profile.close_of_id(args.close)
+        if closed is None:
+            print(f"❌ <{tag}> from line {profile.line_of(opened)} is never closed.")
+            sys.exit(1)
+        print(f"<{tag}> from line {profile.line_of(opened)} closes at line {profile.line_of(closed[0])} (offset {closed[0]}).")
+    else:
+        print(f"{args.file_path}: {len(profile.line_starts)} lines, {len(profile.column().pos)} tags"
+              + (" (cached profile)" if cached else ""))
+        print(f"  {'tag':<12} {'opens':>6} {'closes':>6} {'final':>6}  first negative")
+        for tag in sorted(profile.tag_names, key=lambda name: -len(profile.column(name).pos)):
+            column = profile.column(tag)
+            opens = sum(1 for i in range(len(column.pos)) if column.is_open(i))
+            closes = len(column.pos) - opens
+            negative = profile.first_negative(tag)
+            where = "-" if negative is None else f"line {profile.line_of(negative[0])}"
+            print(f"  {tag:<12} {opens:>6} {closes:>6} {column.depth[-1]:>6}  {where}")
+    sys.exit(0)
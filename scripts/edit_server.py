@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+Edit-coalescing server for deploy pages.
+
+One local process owns every page it is asked to edit: the text lives in memory,
+queued operations are applied in arrival order, and the file is written once
+per batch (all edits that arrive within FLUSH_DELAY of the first pending one),
+under the page flock the other editing tools take too (undo_journal.page_lock())
+and via an atomic rename. A page changed on disk behind the
+server's back is reloaded if nothing is pending, and the batch is rejected
+(never written over the other change) if something is.
+
+Protocol: one JSON object per line over the Unix socket, one JSON reply per line.
+  {"file": "deploy/tech-demo.html", "ops": [
+      {"op": "replace_id", "id": "agent-grid", "content": "<div id=\\"agent-grid\\">...</div>"},
+      {"op": "replace", "old": "pb-2 mr-12", "new": "pb-4 mr-16", "count": 6},
+      {"op": "regex", "pattern": "gap-y-(\\\\d)", "repl": "gap-y-5", "count": 6}]}
+  {"cmd": "flush"} | {"cmd": "status"} | {"cmd": "shutdown"}
+The ops of one request are atomic: if any of them fails nothing is applied.
+"replace"/"regex" default to exactly one match; "count" sets the expected
+number of matches and "count": "all" accepts any non-zero number.
+The reply is sent once the batch containing the request has been written.
+
+Usage:
+  python3 scripts/edit_server.py serve &
+  python3 scripts/edit_server.py send deploy/tech-demo.html ops.json
+  python3 scripts/edit_server.py replace-id deploy/tech-demo.html agent-grid new-grid.html
+  python3 scripts/edit_server.py status | stop
+"""
+import sys
+import os
+import re
+import json
+import socket
+import hashlib
+import argparse
+import threading
+import socketserver
+
+from span_index import ROOT_DIR, SpanIndex, find_element_spans, page_key
+import undo_journal
+
+SOCKET_PATH = os.path.join(ROOT_DIR, ".cache", "edit_server.sock")
+# Edits arriving within this window after the first pending one share a write
+FLUSH_DELAY = 0.05
+REGEX_FLAGS = {'i': re.IGNORECASE, 'm': re.MULTILINE, 's': re.DOTALL}
+
+
+class EditError(Exception):
+    pass
+
+
+def hash_text(content):
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def read_page(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def expected_count(op, found):
+    """Checks the number of matches of a replace/regex op against its "count"."""
+    count = op.get('count', 1)
+    if count == 'all':
+        if found == 0:
+            raise EditError(f"{op['op']}: no match")
+    elif found != count:
+        raise EditError(f"{op['op']}: expected {count} match{'es' if count != 1 else ''}, found {found}")
+
+
+def op_edits(op, path, content, index):
+    """[(start, end, new_text), ...] for one operation against the current content."""
+    kind = op.get('op')
+    if kind == 'replace_id':
+        span = index.locate_id(path, content, op['id'])
+        if span is None:
+            # The index entry may predate an edit it could not follow; scan before giving up
+            spans, errors = find_element_spans(content, [op['id']])
+            if op['id'] not in spans:
+                raise EditError(f"replace_id: id='{op['id']}': {errors[op['id']]}")
+            span = spans[op['id']]
+        _, start, end = span
+        return [(start, end, op['content'])]
+    if kind == 'replace':
+        old = op['old']
+        if not old:
+            raise EditError("replace: empty 'old' text")
+        starts = []
+        pos = content.find(old)
+        while pos != -1:
+            starts.append(pos)
+            pos = content.find(old, pos + len(old))
+        expected_count(op, len(starts))
+        return [(start, start + len(old), op['new']) for start in starts]
+    if kind == 'regex':
+        flags = 0
+        for flag in op.get('flags', ''):
+            if flag not in REGEX_FLAGS:
+                raise EditError(f"regex: unknown flag '{flag}' (use {''.join(REGEX_FLAGS)})")
+            flags |= REGEX_FLAGS[flag]
+        try:
+            pattern = re.compile(op['pattern'], flags)
+        except re.error as e:
+            raise EditError(f"regex: {e}")
+        matches = list(pattern.finditer(content))
+        expected_count(op, len(matches))
+        return [(m.start(), m.end(), m.expand(op['repl'])) for m in matches]
+    raise EditError(f"unknown op {kind!r} (use replace_id, replace or regex)")
+
+
+def apply_edits(content, edits):
+    pieces = []
+    cursor = 0
+    for start, end, new_text in edits:
+        pieces.append(content[cursor:start])
+        pieces.append(new_text)
+        cursor = end
+    pieces.append(content[cursor:])
+    return ''.join(pieces)
+
+
+class Page:
+    """In-memory copy of one page plus the batch waiting to be written."""
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.content = read_page(path)
+        self.disk_content = self.content
+        self.disk_hash = hash_text(self.content)
+        self.disk_mtime = os.stat(path).st_mtime_ns
+        self.pending_ops = 0
+        self.pending_edits = []  # per-op edit lists since the last write, for the journal
+        self.staged = None     # SpanIndex fork tracking the pending content, adopted after the write
+        self.waiters = []      # [(threading.Event, result dict)] answered at flush
+        self.timer = None
+
+    def refresh(self):
+        """Picks up changes made on disk by other tools while nothing is pending."""
+        mtime = os.stat(self.path).st_mtime_ns
+        if mtime == self.disk_mtime:
+            return
+        content = read_page(self.path)
+        self.disk_mtime = mtime
+        if hash_text(content) == self.disk_hash:
+            return
+        if self.pending_ops:
+            raise EditError(f"{page_key(self.path)} changed on disk while edits were pending")
+        self.content = content
+        self.disk_content = content
+        self.disk_hash = hash_text(content)
+
+
+class EditServer:
+    def __init__(self):
+        self.pages = {}
+        self.pages_lock = threading.Lock()
+        self.index = SpanIndex()
+        self.index_lock = threading.Lock()
+        self.writes = 0
+        self.ops = 0
+
+    def page(self, filepath):
+        path = os.path.abspath(filepath if os.path.isabs(filepath) else os.path.join(ROOT_DIR, filepath))
+        with self.pages_lock:
+            if path not in self.pages:
+                if not os.path.isfile(path):
+                    raise EditError(f"File {filepath} not found.")
+                self.pages[path] = Page(path)
+            return self.pages[path]
+
+    def submit(self, filepath, ops):
+        """Applies `ops` atomically and blocks until they are on disk. Returns the reply dict."""
+        page = self.page(filepath)
+        done = threading.Event()
+        result = {'ok': True, 'file': page_key(page.path), 'ops': len(ops)}
+        with page.lock:
+            page.refresh()
+            content = page.content
+            if page.staged is None:
+                with self.index_lock:
+                    page.staged = self.index.fork(page.path)
+            # The shared index only learns about the edits once the batch is written;
+            # a failing op leaves the batch's own fork untouched too
+            staged = page.staged.fork(page.path)
+            op_lists = []
+            for op in ops:
+                edits = sorted(op_edits(op, page.path, content, staged))
+                for (_, prev_end, _), (next_start, _, _) in zip(edits, edits[1:]):
+                    if next_start < prev_end:
+                        raise EditError(f"{op['op']}: matches overlap")
+                new_content = apply_edits(content, edits)
+                if staged.is_current(page.path, content):
+                    staged.record_edits(page.path, edits, new_content)
+                op_lists.append(edits)
+                content = new_content
+            page.staged = staged
+            page.content = content
+            page.pending_edits.extend(op_lists)
+            page.pending_ops += len(ops)
+            page.waiters.append((done, result))
+            if page.timer is None:
+                page.timer = threading.Timer(FLUSH_DELAY, self.flush_page, (page,))
+                page.timer.daemon = True
+                page.timer.start()
+        done.wait()
+        return result
+
+    def flush_page(self, page):
+        waiters = []
+        error = None
+        written = False
+        batch = 0
+        try:
+            with page.lock:
+                if page.timer is not None:
+                    page.timer.cancel()
+                    page.timer = None
+                waiters, page.waiters = page.waiters, []
+                if not waiters:
+                    return
+                staged, page.staged = page.staged, None
+                batch = page.pending_ops
+                try:
+                    write_page(page)
+                    written = True
+                    self.writes += 1
+                    self.ops += batch
+                    with self.index_lock:
+                        self.index.adopt(staged, page.path, page.disk_hash)
+                except (OSError, EditError) as e:
+                    error = str(e)
+                    self.reload(page)
+                finally:
+                    page.pending_ops = 0
+                    page.pending_edits = []
+            with self.index_lock:
+                self.index.save()
+        except Exception as e:
+            # Still answer every waiter below; the Timer thread reports the traceback
+            if not written and error is None:
+                error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            for done, result in waiters:
+                if error:
+                    result.update(ok=False, error=f"batch not written: {error}")
+                else:
+                    result['batch_ops'] = batch
+                done.set()
+
+    def reload(self, page):
+        """
+        Drops a rejected batch: the next request starts from disk again, or, if
+        the page can no longer be read (e.g. it was deleted), from a fresh load.
+        """
+        try:
+            content = read_page(page.path)
+            mtime = os.stat(page.path).st_mtime_ns
+        except OSError:
+            with self.pages_lock:
+                if self.pages.get(page.path) is page:
+                    del self.pages[page.path]
+            return
+        page.content = page.disk_content = content
+        page.disk_hash = hash_text(content)
+        page.disk_mtime = mtime
+
+    def flush_all(self):
+        for page in list(self.pages.values()):
+            self.flush_page(page)
+
+    def status(self):
+        return {
+            'ok': True,
+            'pages': {page_key(p.path): {'pending_ops': p.pending_ops} for p in self.pages.values()},
+            'ops_applied': self.ops,
+            'writes': self.writes,
+        }
+
+
+def write_page(page):
+    """Writes the page once under the page lock; refuses if the file changed since it was loaded."""
+    with undo_journal.page_lock(page.path):
+        if hash_text(read_page(page.path)) != page.disk_hash:
+            raise EditError(f"{page_key(page.path)} changed on disk while edits were pending")
+        tmp_path = os.path.join(os.path.dirname(page.path), f".{os.path.basename(page.path)}.edit-server.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(page.content)
+        os.chmod(tmp_path, os.stat(page.path).st_mode & 0o7777)
+        os.replace(tmp_path, page.path)
+        edits = undo_journal.compose_edits(len(page.disk_content), page.pending_edits)
+        undo_journal.record_edit(page.path, page.disk_content, page.content, edits, tool="edit_server")
+        page.disk_content = page.content
+        page.disk_hash = hash_text(page.content)
+        page.disk_mtime = os.stat(page.path).st_mtime_ns
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                reply = self.dispatch(request)
+            except (ValueError, KeyError, TypeError) as e:
+                reply = {'ok': False, 'error': f"bad request: {e}"}
+            except (EditError, OSError) as e:
+                reply = {'ok': False, 'error': str(e)}
+            self.wfile.write((json.dumps(reply) + "\n").encode('utf-8'))
+            self.wfile.flush()
+            if request_is_shutdown(line):
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+    def dispatch(self, request):
+        editor = self.server.editor
+        cmd = request.get('cmd')
+        if cmd is None:
+            return editor.submit(request['file'], request['ops'])
+        if cmd == 'flush':
+            editor.flush_all()
+            return {'ok': True}
+        if cmd == 'status':
+            return editor.status()
+        if cmd == 'shutdown':
+            editor.flush_all()
+            return {'ok': True}
+        raise EditError(f"unknown cmd {cmd!r}")
+
+
+def request_is_shutdown(line):
+    try:
+        return json.loads(line).get('cmd') == 'shutdown'
+    except ValueError:
+        return False
+
+
+class UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(socket_path=SOCKET_PATH):
+    os.makedirs(os.path.dirname(socket_path), exist_ok=True)
+    if os.path.exists(socket_path):
+        try:
+            request({'cmd': 'status'}, socket_path)
+            print(f"Error: an edit server is already listening on {socket_path}")
+            sys.exit(1)
+        except OSError:
+            os.unlink(socket_path)  # stale socket from a crashed server
+    server = UnixServer(socket_path, RequestHandler)
+    server.editor = EditServer()
+    print(f"✏️  Edit server listening on {os.path.relpath(socket_path, ROOT_DIR)}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.editor.flush_all()
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+    stats = server.editor.status()
+    print(f"✏️  Edit server stopped: {stats['ops_applied']} ops in {stats['writes']} writes")
+
+
+def request(payload, socket_path=SOCKET_PATH):
+    """Sends one request to the running server and returns its reply."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall((json.dumps(payload) + "\n").encode('utf-8'))
+        reply = b''
+        while not reply.endswith(b"\n"):
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            reply += chunk
+    return json.loads(reply)
+
+
+def submit(filepath, ops, socket_path=SOCKET_PATH):
+    """Client helper for other scripts: queue `ops` for `filepath`, wait until written."""
+    return request({'file': os.path.abspath(filepath), 'ops': ops}, socket_path)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Edit-coalescing server for deploy pages.")
+    parser.add_argument("--socket", default=SOCKET_PATH, help="Unix socket path")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("serve", help="Run the server in the foreground")
+    send = sub.add_parser("send", help="Queue the ops of a JSON file (a list of op objects)")
+    send.add_argument("file")
+    send.add_argument("ops")
+    rid = sub.add_parser("replace-id", help="Queue one id replacement")
+    rid.add_argument("file")
+    rid.add_argument("id")
+    rid.add_argument("content", help="Markup or a file path")
+    sub.add_parser("flush", help="Write all pending batches now")
+    sub.add_parser("status", help="Show pages and write counts")
+    sub.add_parser("stop", help="Flush and stop the server")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    if args.command == "serve":
+        serve(args.socket)
+        sys.exit(0)
+
+    if args.command == "send":
+        with open(args.ops, 'r', encoding='utf-8') as f:
+            payload = {'file': os.path.abspath(args.file), 'ops': json.load(f)}
+    elif args.command == "replace-id":
+        content = args.content
+        if os.path.exists(content):
+            content = read_page(content)
+        payload = {'file': os.path.abspath(args.file), 'ops': [{'op': 'replace_id', 'id': args.id, 'content': content}]}
+    else:
+        payload = {'cmd': {'stop': 'shutdown'}.get(args.command, args.command)}
+
+    try:
+        reply = request(payload, args.socket)
+    except OSError:
+        print(f"Error: no edit server on {args.socket}. Start one with: python3 scripts/edit_server.py serve")
+        sys.exit(1)
+    if not reply.get('ok'):
+        print(f"Error: {reply.get('error')}")
+        sys.exit(1)
+    if 'batch_ops' in reply:
+        print(f"Successfully applied {reply['ops']} op(s) to {reply['file']} (written in a batch of {reply['batch_ops']})")
+    else:
+        print(json.dumps(reply, indent=2))
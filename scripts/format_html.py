@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Canonical formatter for deploy pages: one block-level tag per line, indented
+by block depth, so line-based tools and diffs see a stable structure.
+
+  * Block-level elements (BLOCK_TAGS, plus any element that contains one, e.g.
+    an <a> wrapping a card) open and close on their own lines; their tags are
+    rewritten with single spaces between attributes (values are never touched).
+  * Text and inline elements between two block boundaries form one run that
+    is emitted verbatim, only trimmed at its ends and re-indented as a whole.
+  * <script>, <style>, <pre>, <title> and <textarea> contents are copied
+    byte for byte, closing tag included.
+  * Comments between blocks get their own line (markers such as
+    `</div><!-- Card 5 -->` are split); inside a text run they stay put.
+
+The page is tokenized once; a pass over the token list marks which elements
+count as block-level and a second one emits the lines, so formatting is linear
+in the page size. Output is idempotent: formatting a formatted page changes
+nothing.
+
+Usage:
+  python3 scripts/format_html.py deploy/index.html              # formatted page to stdout
+  python3 scripts/format_html.py deploy/index.html --check      # exit 1 if not canonical
+  python3 scripts/format_html.py deploy/index.html --dry-run    # as a diff
+  python3 scripts/format_html.py deploy/index.html --apply [--indent 4]
+"""
+import sys
+import os
+import re
+import argparse
+
+import undo_journal
+import line_diff
+from span_index import TOKEN_PATTERN, tokenize
+
+BLOCK_TAGS = {
+    'html', 'head', 'body', 'title', 'meta', 'link', 'base', 'script', 'style', 'noscript', 'template',
+    'div', 'section', 'header', 'footer', 'main', 'nav', 'article', 'aside', 'address', 'blockquote',
+    'details', 'summary', 'dialog', 'dl', 'dt', 'dd', 'fieldset', 'legend', 'figure', 'figcaption', 'form',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'hr', 'li', 'ol', 'ul', 'menu', 'p', 'pre',
+    'table', 'caption', 'colgroup', 'col', 'thead', 'tbody', 'tfoot', 'tr', 'td', 'th',
+    'video', 'audio', 'source', 'track', 'canvas', 'iframe', 'select', 'option', 'optgroup',
+}
+# Contents copied verbatim (tags inside them are not tags, or whitespace is significant)
+VERBATIM_TAGS = {'script', 'style', 'pre', 'title', 'textarea'}
+ATTR_TOKEN = re.compile(r'[^\s=/>"\']+(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s>"\']+))?')
+ATTR_EQUALS = re.compile(r'\s*=\s*')
+DEFAULT_INDENT = 2
+
+
+def layout_tokens(content):
+    """
+    span_index.tokenize() with each VERBATIM_TAGS element (open tag through
+    close tag, or to the end of the page if never closed) merged into one
+    'verbatim' token.
+    """
+    tokens = []
+    awaiting_close = False
+    for kind, tag, start, end in tokenize(content, raw=VERBATIM_TAGS):
+        if awaiting_close:
+            # Contents are not tokenized, so the next token is the element's close
+            tokens[-1] = ('verbatim', tag, tokens[-1][2], end)
+            awaiting_close = False
+        elif kind == 'open' and tag in VERBATIM_TAGS:
+            tokens.append(('verbatim', tag, start, len(content)))
+            awaiting_close = True
+        else:
+            tokens.append((kind, tag, start, end))
+    return tokens
+
+
+def mark_blocks(tokens):
+    """
+    (block, opener): block is the set of token indices laid out as blocks
+    (block tags, every element with a block-level descendant, their closing
+    tags, stray block closes); opener maps each matched close to its open.
+    Each open element is marked at most once, so the pass stays linear.
+    """
+    block = set()
+    opener = {}
+    stack = []       # open token indices
+    positions = {}   # tag -> stack indices
+
+    for i, (kind, tag, _, _) in enumerate(tokens):
+        if kind == 'comment':
+            continue
+        if kind == 'close':
+            open_at = positions.get(tag)
+            if open_at:
+                depth = open_at[-1]
+                opener[i] = stack[depth]
+                for opened in stack[depth:]:
+                    positions[tokens[opened][1]].pop()
+                del stack[depth:]
+            elif tag in BLOCK_TAGS:
+                block.add(i)
+            continue
+        if tag in BLOCK_TAGS:
+            for opened in reversed(stack):
+                if opened in block:
+                    break
+                block.add(opened)
+            block.add(i)
+        if kind == 'open':
+            positions.setdefault(tag, []).append(len(stack))
+            stack.append(i)
+
+    block.update(close for close, opened in opener.items() if opened in block)
+    return block, opener
+
+
+def canonical_tag(text, tag, closing):
+    """`<tag a="1" b>` with single spaces between attributes; attribute values are kept as they are."""
+    if closing:
+        return f"</{tag}>"
+    inner = text[1 + len(tag):-1]
+    self_closing = inner.rstrip().endswith('/')
+    if self_closing:
+        inner = inner.rstrip()[:-1]
+    attrs = [ATTR_EQUALS.sub('=', attr, count=1) for attr in ATTR_TOKEN.findall(inner)]
+    return f"<{tag}{''.join(' ' + attr for attr in attrs)}{' /' if self_closing else ''}>"
+
+
+def format_html(content, indent=DEFAULT_INDENT):
+    tokens = layout_tokens(content)
+    block, opener = mark_blocks(tokens)
+    unit = ' ' * indent
+    lines = []
+    run = []
+    depth = 0
+    depth_of = {}  # block open token index -> its depth
+
+    def flush():
+        text = ''.join(run).strip()
+        run.clear()
+        if text:
+            lines.append(unit * depth + text)
+
+    cursor = 0
+    for i, (kind, tag, start, end) in enumerate(tokens):
+        run.append(content[cursor:start])
+        cursor = end
+        text = content[start:end]
+
+        if kind == 'comment':
+            pending = ''.join(run)
+            # Inside a run only if it shares a line with the text before it
+            if pending.strip() and '\n' not in pending[len(pending.rstrip()):]:
+                run.append(text)
+            else:
+                flush()
+                lines.append(unit * depth + text)
+        elif i not in block:
+            run.append(text)
+        elif kind == 'open':
+            flush()
+            lines.append(unit * depth + canonical_tag(text, tag, False))
+            depth_of[i] = depth
+            depth += 1
+        elif kind == 'close':
+            flush()
+            # Back to the level of the matching open (also closes anything left open inside it);
+            # a stray close stays at the current level
+            depth = depth_of.get(opener.get(i), depth)
+            lines.append(unit * depth + canonical_tag(text, tag, True))
+        elif kind == 'verbatim':
+            flush()
+            open_end = TOKEN_PATTERN.match(content, start).end()
+            lines.append(unit * depth + canonical_tag(content[start:open_end], tag, False) + content[open_end:end])
+        else:
+            flush()
+            lines.append(unit * depth + canonical_tag(text, tag, False))
+
+    run.append(content[cursor:])
+    flush()
+    return '\n'.join(lines) + '\n'
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Re-emit a page with one block-level tag per line and indentation by depth.")
+    parser.add_argument("file_path", help="Page to format")
+    parser.add_argument("--indent", type=int, default=DEFAULT_INDENT, help="Spaces per level")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--check", action="store_true", help="Exit 1 if the page is not canonically formatted")
+    mode.add_argument("--dry-run", action="store_true", help="Print the changes as a unified diff")
+    mode.add_argument("--apply", action="store_true", help="Rewrite the page")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    if not os.path.exists(args.file_path):
+        print(f"Error: File {args.file_path} not found.")
+        sys.exit(1)
+    with open(args.file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    formatted = format_html(content, args.indent)
+
+    if args.check:
+        if formatted != content:
+            print(f"❌ {args.file_path} is not canonically formatted (run with --apply).")
+            sys.exit(1)
+        print(f"✅ {args.file_path} is canonically formatted.")
+    elif args.dry_run:
+        line_diff.print_preview(content, formatted, args.file_path)
+    elif args.apply:
+        if formatted == content:
+            print(f"✅ {args.file_path} already canonical.")
+            sys.exit(0)
+        # Offsets move everywhere; the span index rescans the page on its next lookup
+        try:
+            entry = undo_journal.write_page(args.file_path, content, formatted, tool="format_html")
+        except undo_journal.PageChanged as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(f"Success: Formatted {args.file_path}. Undo: python3 scripts/undo_journal.py undo  (journal #{entry['seq']})")
+    else:
+        sys.stdout.write(formatted)
+    sys.exit(0)
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Minimal CSS selector engine over one tokenization of a page.
+
+Supported selector forms (and any compound of them):
+  div            tag (or * for any tag)
+  .card          class
+  #hero          id
+  [data-agent]   attribute present
+  [type=button]  attribute equals (quotes optional)
+  :nth-of-type(2), :nth-of-type(odd), :nth-of-type(2n+1)
+  .grid .card    descendant combinator
+  a, b           selector list
+
+Each selector is compiled into a list of compound matchers. While walking the
+tokens of span_index.tokenize() (so script/style/textarea/title contents are
+never mistaken for elements), every open element carries the set of "how many
+compounds of the selector are already satisfied by my ancestors", so
+descendant matching costs O(compounds) per element instead of a walk up the
+tree.
+"""
+import re
+
+from span_index import TOKEN_PATTERN, tokenize
+
+ATTR_PATTERN = re.compile(r'([^\s=/>"\']+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>"\']+)))?')
+
+COMPOUND_TOKEN = re.compile(
+    r'(?P<tag>\*|[a-zA-Z][\w-]*)'
+    r'|\.(?P<cls>[\w-]+)'
+    r'|#(?P<id>[\w-]+)'
+    r'|\[\s*(?P<attr>[\w:-]+)\s*(?:=\s*(?:"(?P<dq>[^"]*)"|\'(?P<sq>[^\']*)\'|(?P<bare>[^\]\s]+))\s*)?\]'
+    r'|:nth-of-type\(\s*(?P<nth>[^)]+?)\s*\)'
+)
+
+# One compound of a selector list, or a ',' between selectors. Brackets and
+# parentheses are kept whole, so '[data-x="a, b"]' or ':nth-of-type(2n + 1)'
+# is one compound.
+SELECTOR_PART = re.compile(r'((?:[^\s,\[(]|\[(?:[^\]"\']|"[^"]*"|\'[^\']*\')*\]?|\([^)]*\)?)+)|(,)')
+
+
+class SelectorError(ValueError):
+    pass
+
+
+def parse_nth(expr):
+    """:nth-of-type argument -> (a, b) meaning positions a*n + b for n >= 0."""
+    expr = expr.replace(' ', '').lower()
+    if expr == 'odd':
+        return 2, 1
+    if expr == 'even':
+        return 2, 0
+    m = re.fullmatch(r'([+-]?\d*)n([+-]\d+)?|([+-]?\d+)', expr)
+    if not m:
+        raise SelectorError(f"unsupported :nth-of-type({expr})")
+    if m.group(3) is not None:
+        return 0, int(m.group(3))
+    a = m.group(1)
+    a = -1 if a == '-' else 1 if a in ('', '+') else int(a)
+    return a, int(m.group(2) or 0)
+
+
+def nth_matches(a, b, position):
+    if a == 0:
+        return position == b
+    n, rest = divmod(position - b, a)
+    return rest == 0 and n >= 0
+
+
+class Compound:
+    """One compound selector such as div.card[data-x]:nth-of-type(2)."""
+    def __init__(self, text):
+        self.text = text
+        self.tag = None
+        self.classes = []
+        self.attrs = []  # [(name, value or None)]
+        self.nth = None
+        pos = 0
+        while pos < len(text):
+            m = COMPOUND_TOKEN.match(text, pos)
+            if not m or m.end() == pos:
+                raise SelectorError(f"unsupported selector syntax at '{text[pos:]}'")
+            if m.group('tag'):
+                if pos != 0:
+                    raise SelectorError(f"tag name must come first in '{text}'")
+                self.tag = None if m.group('tag') == '*' else m.group('tag').lower()
+            elif m.group('cls'):
+                self.classes.append(m.group('cls'))
+            elif m.group('id'):
+                self.attrs.append(('id', m.group('id')))
+            elif m.group('attr'):
+                value = next((v for v in (m.group('dq'), m.group('sq'), m.group('bare')) if v is not None), None)
+                self.attrs.append((m.group('attr').lower(), value))
+            else:
+                self.nth = parse_nth(m.group('nth'))
+            pos = m.end()
+
+    def matches(self, element):
+        if self.tag is not None and element.tag != self.tag:
+            return False
+        if self.classes:
+            classes = element.attrs.get('class', '').split()
+            if any(c not in classes for c in self.classes):
+                return False
+        for name, value in self.attrs:
+            if name not in element.attrs or (value is not None and element.attrs[name] != value):
+                return False
+        if self.nth is not None and not nth_matches(self.nth[0], self.nth[1], element.position):
+            return False
+        return True
+
+
+def compile_selector(selector):
+    """'a .b, c' -> [[Compound(a), Compound(.b)], [Compound(c)]]"""
+    parts = [[]]
+    for m in SELECTOR_PART.finditer(selector):
+        if m.group(2):
+            parts.append([])
+        else:
+            parts[-1].append(m.group(1))
+    compiled = []
+    for part in parts:
+        if not part:
+            raise SelectorError(f"empty selector in '{selector}'")
+        compiled.append([Compound(text) for text in part])
+    return compiled
+
+
+class Element:
+    """An element found by select(): tag name, attributes and character offsets."""
+    __slots__ = ('tag', 'attrs', 'start', 'tag_end', 'end', 'position', 'states', 'counts', 'selectors')
+
+    def __init__(self, tag, attrs, start, tag_end, position):
+        self.tag = tag
+        self.attrs = attrs
+        self.start = start        # '<' of the opening tag
+        self.tag_end = tag_end    # just after the opening tag's '>'
+        self.end = tag_end        # just after the closing tag (set when it closes)
+        self.position = position  # 1-based index among same-tag siblings
+        self.states = None
+        self.counts = {}
+        self.selectors = []       # indices of the selectors this element matched
+
+
+def parse_attrs(attr_text):
+    attrs = {}
+    for m in ATTR_PATTERN.finditer(attr_text):
+        name = m.group(1).lower()
+        if name not in attrs:
+            value = next((v for v in m.group(2, 3, 4) if v is not None), '')
+            attrs[name] = value
+    return attrs
+
+
+def select(content, selector):
+    """
+    Returns ([Element, ...] in document order, [match count per selector in the list]).
+    Unclosed matches end where their parent closes (or at the end of the page).
+    """
+    compiled = compile_selector(selector) if isinstance(selector, str) else selector
+    matched = []
+    counts = [0] * len(compiled)
+
+    root = Element('#root', {}, 0, 0, 1)
+    root.states = [frozenset([0]) for _ in compiled]
+    stack = [root]
+
+    for kind, tag, start, end in tokenize(content):
+        if kind == 'comment':
+            continue
+        if kind == 'close':
+            for depth in range(len(stack) - 1, 0, -1):
+                if stack[depth].tag == tag:
+                    for element in stack[depth:]:
+                        element.end = end if element is stack[depth] else start
+                    del stack[depth:]
+                    break
+            continue
+
+        parent = stack[-1]
+        position = parent.counts.get(tag, 0) + 1
+        parent.counts[tag] = position
+        attr_text = TOKEN_PATTERN.match(content, start).group(4)
+        element = Element(tag, parse_attrs(attr_text), start, end, position)
+
+        element.states = []
+        for i, compounds in enumerate(compiled):
+            before = parent.states[i]
+            hits = {k + 1 for k in before if k < len(compounds) and compounds[k].matches(element)}
+            if len(compounds) in hits:
+                element.selectors.append(i)
+                counts[i] += 1
+                hits.discard(len(compounds))
+            element.states.append(before | hits if hits else before)
+        if element.selectors:
+            matched.append(element)
+
+        if kind == 'open':
+            stack.append(element)
+
+    for element in stack[1:]:
+        element.end = len(content)
+    return matched, counts
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Line diff for edit previews (--dry-run in smart_replace.py / safe_replace_html.py).
+
+Lines are interned to integers first, so every comparison below is an int
+compare. The common head and tail are trimmed, then patience diff anchors on
+lines that occur exactly once on both sides (longest increasing run of such
+pairs), and Myers' O(ND) greedy algorithm fills the gaps between anchors.
+Typical page edits reduce to a few hundred lines after trimming and finish in
+milliseconds; whole-page rewrites still anchor on the many unique lines, and
+gaps that would need more than MYERS_MAX_D edits are emitted as one block.
+
+Usage:
+  python3 scripts/line_diff.py old.html new.html
+"""
+import sys
+import bisect
+
+CONTEXT_LINES = 3
+# Myers is O(ND); past this many edits a gap is reported as one replace block
+# (still a correct diff, just not minimal) so whole-page rewrites stay fast.
+MYERS_MAX_D = 500
+
+
+def common_prefix_len(a, b):
+    """Length of the common prefix, by binary search over C-level slice compares."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def common_suffix_len(a, b, limit):
+    """Length of the common suffix, at most `limit` (so it cannot overlap the prefix)."""
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:] == b[len(b) - mid:]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def intern_lines(a_lines, b_lines):
+    ids = {}
+    a = [ids.setdefault(line, len(ids)) for line in a_lines]
+    b = [ids.setdefault(line, len(ids)) for line in b_lines]
+    return a, b
+
+
+def myers(a, b, a_lo, a_hi, b_lo, b_hi):
+    """Matched index pairs of a[a_lo:a_hi] / b[b_lo:b_hi] (shortest edit script)."""
+    n, m = a_hi - a_lo, b_hi - b_lo
+    if n == 0 or m == 0:
+        return []
+    size = n + m
+    v = {1: 0}
+    trace = []
+    for d in range(min(size, MYERS_MAX_D) + 1):
+        trace.append(dict(v))
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v.get(k - 1, -1) < v.get(k + 1, -1)):
+                x = v.get(k + 1, 0)
+            else:
+                x = v.get(k - 1, 0) + 1
+            y = x - k
+            while x < n and y < m and a[a_lo + x] == b[b_lo + y]:
+                x += 1
+                y += 1
+            v[k] = x
+            if x >= n and y >= m:
+                return backtrack(trace, a_lo, b_lo, n, m)
+    return []
+
+
+def backtrack(trace, a_lo, b_lo, x, y):
+    pairs = []
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]
+        k = x - y
+        if k == -d or (k != d and v.get(k - 1, -1) < v.get(k + 1, -1)):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v.get(prev_k, 0)
+        prev_y = prev_x - prev_k
+        while x > prev_x and y > prev_y:
+            x -= 1
+            y -= 1
+            pairs.append((a_lo + x, b_lo + y))
+        if d > 0:
+            x, y = prev_x, prev_y
+    pairs.reverse()
+    return pairs
+
+
+def patience(a, b, a_lo, a_hi, b_lo, b_hi):
+    """Matched index pairs, anchoring on lines unique to both ranges."""
+    # Common head / tail
+    head = []
+    while a_lo < a_hi and b_lo < b_hi and a[a_lo] == b[b_lo]:
+        head.append((a_lo, b_lo))
+        a_lo += 1
+        b_lo += 1
+    tail = []
+    while a_lo < a_hi and b_lo < b_hi and a[a_hi - 1] == b[b_hi - 1]:
+        a_hi -= 1
+        b_hi -= 1
+        tail.append((a_hi, b_hi))
+    tail.reverse()
+
+    counts = {}
+    for i in range(a_lo, a_hi):
+        entry = counts.setdefault(a[i], [0, 0, i, 0])
+        entry[0] += 1
+    for j in range(b_lo, b_hi):
+        entry = counts.get(b[j])
+        if entry is not None:
+            entry[1] += 1
+            entry[3] = j
+    uniques = sorted((ai, bj) for ca, cb, ai, bj in counts.values() if ca == 1 and cb == 1)
+
+    if not uniques:
+        return head + myers(a, b, a_lo, a_hi, b_lo, b_hi) + tail
+
+    # Longest increasing subsequence of b positions (patience sorting)
+    piles = []
+    links = []
+    tops = []
+    for idx, (_, bj) in enumerate(uniques):
+        p = bisect.bisect_left(tops, bj)
+        links.append(piles[p - 1] if p else -1)
+        if p == len(piles):
+            piles.append(idx)
+            tops.append(bj)
+        else:
+            piles[p] = idx
+            tops[p] = bj
+    anchors = []
+    idx = piles[-1]
+    while idx != -1:
+        anchors.append(uniques[idx])
+        idx = links[idx]
+    anchors.reverse()
+
+    pairs = head
+    prev_a, prev_b = a_lo, b_lo
+    for ai, bj in anchors:
+        pairs += patience(a, b, prev_a, ai, prev_b, bj)
+        pairs.append((ai, bj))
+        prev_a, prev_b = ai + 1, bj + 1
+    pairs += patience(a, b, prev_a, a_hi, prev_b, b_hi)
+    return pairs + tail
+
+
+def opcodes(a_lines, b_lines):
+    """[(tag, i1, i2, j1, j2)] like difflib.SequenceMatcher.get_opcodes()."""
+    a, b = intern_lines(a_lines, b_lines)
+    pairs = patience(a, b, 0, len(a), 0, len(b))
+    codes = []
+    i = j = 0
+    for ai, bj in pairs + [(len(a), len(b))]:
+        if ai > i or bj > j:
+            tag = 'replace' if ai > i and bj > j else 'delete' if ai > i else 'insert'
+            codes.append((tag, i, ai, j, bj))
+        if ai < len(a):
+            if codes and codes[-1][0] == 'equal':
+                codes[-1] = ('equal', codes[-1][1], ai + 1, codes[-1][3], bj + 1)
+            else:
+                codes.append(('equal', ai, ai + 1, bj, bj + 1))
+        i, j = ai + 1, bj + 1
+    return codes
+
+
+def unified_diff(old_text, new_text, old_name='a', new_name='b', context=CONTEXT_LINES):
+    """Unified diff of two texts as a string ('' if they are equal)."""
+    a_lines = old_text.splitlines(keepends=True)
+    b_lines = new_text.splitlines(keepends=True)
+    codes = opcodes(a_lines, b_lines)
+    if all(code[0] == 'equal' for code in codes):
+        return ''
+
+    # Group changes whose context windows touch into one hunk
+    groups = []
+    for code in codes:
+        if code[0] == 'equal':
+            continue
+        if groups and code[1] - groups[-1][-1][2] <= 2 * context:
+            groups[-1].append(code)
+        else:
+            groups.append([code])
+
+    out = [f"--- {old_name}\n", f"+++ {new_name}\n"]
+    for group in groups:
+        i1 = max(group[0][1] - context, 0)
+        j1 = max(group[0][3] - context, 0)
+        i2 = min(group[-1][2] + context, len(a_lines))
+        j2 = min(group[-1][4] + context, len(b_lines))
+        out.append(f"@@ -{i1 + 1},{i2 - i1} +{j1 + 1},{j2 - j1} @@\n")
+        i, j = i1, j1
+        for _, ci1, ci2, cj1, cj2 in group:
+            out.extend(' ' + line for line in a_lines[i:ci1])
+            out.extend('-' + line for line in a_lines[ci1:ci2])
+            out.extend('+' + line for line in b_lines[cj1:cj2])
+            i, j = ci2, cj2
+        out.extend(' ' + line for line in a_lines[i:i2])
+    return ''.join(line if line.endswith('\n') else line + '\n\\ No newline at end of file\n' for line in out)
+
+
+def print_preview(old_text, new_text, path):
+    """Prints the unified diff of a pending edit plus a one-line summary."""
+    diff = unified_diff(old_text, new_text, f"a/{path}", f"b/{path}")
+    sys.stdout.write(diff)
+    added = sum(1 for line in diff.splitlines() if line.startswith('+') and not line.startswith('+++'))
+    removed = sum(1 for line in diff.splitlines() if line.startswith('-') and not line.startswith('---'))
+    print(f"Dry run: {path} not written (+{added} -{removed} lines).")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python3 line_diff.py <old_file> <new_file>")
+        sys.exit(1)
+    with open(sys.argv[1], 'r', encoding='utf-8') as f:
+        old = f.read()
+    with open(sys.argv[2], 'r', encoding='utf-8') as f:
+        new = f.read()
+    diff = unified_diff(old, new, sys.argv[1], sys.argv[2])
+    sys.stdout.write(diff)
+    sys.exit(1 if diff else 0)
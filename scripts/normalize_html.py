@@ -6,7 +6,7 @@ import re
 # But Line 615 (Card 5 Marker) still has unexpected closing tag?
 
 # Reason:
-# `fix_div_count.py` checks `l == '</div>'`.
+# `fix_div_count.py` (removed, see repair_tags.py) checked `l == '</div>'`.
 # BUT Line 615 is: `                </div><!-- Card 5: Sales Advisor -->`
 # This line is NOT `</div>`. It has content.
 # My script skipped it because `else: break`.
@@ -16,7 +16,7 @@ import re
 
 # Refined Fix:
 # 1. Normalize the file: Split `</div><!--` into `</div>\n<!--`.
-# 2. Re-run `fix_div_count.py`.
+# 2. Re-run the div fixer (now `repair_tags.py --apply`; fix_div_count.py is removed).
 
 file_path = '/home/drewman/getampere/deploy/tech-demo.html'
 with open(file_path, 'r') as f:
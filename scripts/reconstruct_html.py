@@ -35,7 +35,7 @@ with open(file_path, 'r') as f:
 # </div> (Group)
 
 # Total 4 closing?
-# `apply_math_socket.py` produced 3 closing divs.
+# `apply_math_socket.py` (removed; cards are now rendered by render_cards.py) produced 3 closing divs.
 # Wait, `get_tangent_card_html` opens 1 (Group).
 # Then `Masked` (Div 1).
 # Then `Content` (Div 4).
@@ -70,7 +70,7 @@ with open(file_path, 'r') as f:
 
 # Let's look at the "11" lines.
 # Maybe I have 11 `</div>` lines, but they are inside Loop?
-# `fix_missing_tail.py` output 11. 
+# `fix_missing_tail.py` (removed, see repair_tags.py) output 11.
 # This was in `end_chunk`.
 # If I had 11 closing divs at the end, that's enough to close Earth.
 
@@ -103,7 +103,7 @@ with open(file_path, 'r') as f:
 # If Old file v2.286 had 3.
 # I replaced body but appended 3.
 # If I failed to eat old 3, I have 3+3 = 6.
-# If I had 6, and removed 1 (fix_div_count), I have 5.
+# If I had 6, and removed 1 (fix_div_count, now repair_tags.py), I have 5.
 # 5 closes > 3 opens.
 # So Card 1 closes itself AND Main/Section?
 # Then Card 2 starts at root...
@@ -252,7 +252,7 @@ def clean_card_chunk(chunk):
 # Actually, the quickest 'hack' that is 100% reliable:
 # Go into the `content` and Replace `</div></div></div>` (specific newline combo) with single instance?
 # Let's look at the actual text at a boundary.
-# `check_div_balance.py` failed at line 482.
+# The div water level (now `validate_html.py --only div-balance`) went negative at line 482.
 # That was Card 3.
 # I suspect we have `</div>\n</div>` type stuff.
 
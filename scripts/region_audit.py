@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Region-balance audit: net open/close delta per tag type between markers.
+
+Boundaries can be marker comments (--marker, a regex matched against the
+stripped comment text), elements by id (--id) or every element of a tag
+(--tag). Each --marker / --tag is its own family and all --id values form one
+family; a region runs from a boundary to the next boundary of the same family,
+or to the point where the element enclosing the boundary closes (the last
+card of a grid ends with the grid). A balanced region opens and closes the
+same number of tags of every type, wherever the tags sit on their lines
+(`</div><!-- Card 5 -->` is counted like any other close).
+
+The page is tokenized once (span_index.tokenize()); the running level of
+every tag type is snapshotted at each boundary, so the whole audit is O(n).
+A region that ends by closing its enclosing element while another marker of
+its family follows at a shallower level has an extra close; repair_tags.py
+fixes both kinds of imbalance.
+
+Usage:
+  python3 scripts/region_audit.py deploy/tech-demo.html                       # Card markers + <section>s
+  python3 scripts/region_audit.py deploy/tech-demo.html --marker "Card\\b"
+  python3 scripts/region_audit.py deploy/index.html --tag section --id pricing --id faq
+"""
+import sys
+import re
+import bisect
+import argparse
+from collections import Counter
+
+from span_index import ID_ATTR_PATTERN, tokenize
+from repair_tags import DEFAULT_MARKERS
+
+DEFAULT_TAGS = ['section']
+
+
+class Region:
+    def __init__(self, family, label, start, level, counts):
+        self.family = family
+        self.label = label
+        self.start = start
+        self.end = None
+        self.level = level            # overall level at the boundary
+        self.counts = Counter(counts)  # per-tag levels at the boundary
+        self.delta = None              # per-tag net delta over the region
+        self.closed_by_parent = False
+        self.extra_close = False
+
+
+def audit_regions(content, markers=(), ids=(), tags=()):
+    """Regions of every family in page order (one pass over the tokens)."""
+    patterns = [re.compile(pattern) for pattern in markers]
+    wanted_ids = set(ids)
+    tag_families = {tag.lower(): f"<{tag.lower()}>" for tag in tags}
+
+    counts = Counter()
+    level = 0
+    current = {}   # family -> open Region
+    finished = []
+    last_closed = {}  # family -> the last region that ended because its parent closed
+
+    def finish(region, pos, by_parent):
+        region.end = pos
+        region.closed_by_parent = by_parent
+        region.delta = {tag: counts[tag] - region.counts[tag]
+                        for tag in set(counts) | set(region.counts) if counts[tag] != region.counts[tag]}
+        finished.append(region)
+        if by_parent:
+            last_closed[region.family] = region
+
+    def boundary(family, label, pos):
+        region = current.pop(family, None)
+        if region is not None:
+            finish(region, pos, False)
+        elif family in last_closed and level < last_closed[family].level:
+            # The previous region closed its parent and this marker sits shallower: that close was extra
+            last_closed[family].extra_close = True
+        last_closed.pop(family, None)
+        current[family] = Region(family, label, pos, level, counts)
+
+    for kind, name, start, end in tokenize(content):
+        if kind == 'comment':
+            for pattern in patterns:
+                if pattern.match(name):
+                    boundary(pattern.pattern, name, start)
+            continue
+        if kind == 'void':
+            continue
+
+        if kind == 'open':
+            if name in tag_families or wanted_ids:
+                id_match = ID_ATTR_PATTERN.search(content, start, end) if 'id' in content[start:end].lower() else None
+                found_id = id_match and (id_match.group(1) if id_match.group(1) is not None else id_match.group(2))
+                if name in tag_families:
+                    boundary(tag_families[name], f"<{name}" + (f" id=\"{found_id}\">" if found_id else ">"), start)
+                if found_id in wanted_ids:
+                    boundary('#ids', f"#{found_id}", start)
+            counts[name] += 1
+            level += 1
+        else:
+            # A region ends (before this close) when the element enclosing its boundary closes
+            for family, region in list(current.items()):
+                if level - 1 < region.level:
+                    finish(region, start, True)
+                    del current[family]
+            counts[name] -= 1
+            level -= 1
+
+    for region in current.values():
+        finish(region, len(content), False)
+    finished.sort(key=lambda region: region.start)
+    return finished
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Net open/close delta per tag type between consecutive markers.")
+    parser.add_argument("files", nargs="+", help="Pages to audit")
+    parser.add_argument("--marker", action="append", default=[],
+                        help="Regex for a family of marker comments (repeatable)")
+    parser.add_argument("--id", action="append", default=[], help="Element id used as a boundary (repeatable)")
+    parser.add_argument("--tag", action="append", default=[], help="Every element of this tag is a boundary (repeatable)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Only print unbalanced regions")
+    args = parser.parse_args(argv)
+    if not (args.marker or args.id or args.tag):
+        args.marker, args.tag = list(DEFAULT_MARKERS), list(DEFAULT_TAGS)
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    failed = False
+
+    for file_path in args.files:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except FileNotFoundError:
+            print(f"Error: File {file_path} not found.")
+            sys.exit(1)
+
+        newlines = [m.start() for m in re.finditer('\n', content)]
+
+        def line_of(pos):
+            return bisect.bisect_left(newlines, pos) + 1
+
+        regions = audit_regions(content, args.marker, args.id, args.tag)
+        bad = [region for region in regions if region.delta or region.extra_close]
+        failed = failed or bool(bad)
+        print(f"{'❌' if bad else '✅'} {file_path}: {len(regions)} regions, {len(bad)} unbalanced")
+        for region in regions:
+            if args.quiet and region not in bad:
+                continue
+            end = "end of page" if region.end == len(content) else f"line {line_of(region.end)}"
+            how = " (enclosing element closes)" if region.closed_by_parent else ""
+            problems = [f"{tag} {delta:+d}" for tag, delta in sorted(region.delta.items())]
+            if region.extra_close:
+                problems.append(f"extra close at {end}: the next marker of this family sits shallower")
+            status = '❌' if problems else '✅'
+            detail = f": {', '.join(problems)}" if problems else ""
+            print(f"  {status} Line {line_of(region.start):<5} {region.label} -> {end}{how}{detail}")
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Data-driven card renderer (replaces rebuild_tech_demo.py and the per-design
+apply_*_socket.py / apply_*_design.py scripts).
+
+Card data lives in a JSON file (content/tech-demo-cards.json), the markup in
+a template file (scripts/templates/glass_socket_card.html); a new design is a
+new template, not a new script. The template language is a small Mustache
+subset:
+
+  {{name}}                  value of a card (or row) field, HTML-escaped (see escape())
+  {{{name}}}                the same, inserted as is (markup such as icons)
+  {{.}}                     the current item (inside a section over a list of strings)
+  {{#name}} ... {{/name}}   once if truthy, once per item if a list
+  {{^name}} ... {{/name}}   once if falsy or missing
+  {{! ... }}                comment (not rendered)
+
+A section or comment tag alone on its line removes the whole line. Inside a
+section, names are looked up in the current item first, then outward (a row
+can use its card's fields). Besides its own fields every card gets `index`
+(0-based), `number` (1-based) and `first`.
+
+Each template is compiled once into a render function (a tree of closures, no
+re-parsing per card), cached under the hash of the template text; all cards
+are then rendered in one pass and the grid container's contents (located by
+id via the span index) are replaced in one journaled write.
+
+Usage:
+  python3 scripts/render_cards.py                                   # rendered cards to stdout
+  python3 scripts/render_cards.py content/tech-demo-cards.json --dry-run
+  python3 scripts/render_cards.py content/tech-demo-cards.json --apply
+  python3 scripts/render_cards.py --template new_design.html --dry-run
+  python3 scripts/render_cards.py --check                           # exit 1 if the page is out of date
+"""
+import sys
+import os
+import re
+import json
+import argparse
+
+import undo_journal
+import line_diff
+from span_index import ROOT_DIR, TOKEN_PATTERN, SpanIndex, hash_content
+
+DEFAULT_DATA = os.path.join(ROOT_DIR, "content", "tech-demo-cards.json")
+TAG_PATTERN = re.compile(r'\{\{\{\s*(.*?)\s*\}\}\}|\{\{([#^/!]?)\s*(.*?)\s*\}\}', re.DOTALL)
+# An '&' that could start a character reference; a bare '&' (as in "Revenue & Plans") is valid HTML
+AMPERSAND_PATTERN = re.compile(r'&(?=[#A-Za-z0-9])')
+
+# Template hash -> compiled render function
+_compiled = {}
+
+
+class TemplateError(Exception):
+    pass
+
+
+def parse_template(text):
+    """
+    Template text as a tree: a list of literal strings, ('var', name, raw) and
+    ('section', name, inverted, children) nodes.
+    """
+    root = []
+    stack = [(None, root, 0)]  # (section name, its children, tag offset)
+    cursor = 0
+
+    for m in TAG_PATTERN.finditer(text):
+        if m.group(1) is not None:
+            sigil, name = '{', m.group(1)
+        else:
+            sigil, name = m.group(2), m.group(3)
+        start, end = m.start(), m.end()
+        if sigil in ('#', '^', '/', '!'):
+            # A section / comment tag alone on its line takes the line with it
+            line_start = text.rfind('\n', 0, start) + 1
+            line_end = text.find('\n', end)
+            line_end = len(text) if line_end == -1 else line_end + 1
+            if not text[line_start:start].strip() and not text[end:line_end].strip():
+                start, end = line_start, line_end
+
+        if start > cursor:
+            stack[-1][1].append(text[cursor:start])
+        cursor = max(cursor, end)
+
+        if sigil == '!':
+            continue
+        if sigil in ('', '{'):
+            stack[-1][1].append(('var', name, sigil == '{'))
+        elif sigil in '#^':
+            children = []
+            stack[-1][1].append(('section', name, sigil == '^', children))
+            stack.append((name, children, m.start()))
+        else:
+            if stack[-1][0] != name:
+                opened = f"{{{{#{stack[-1][0]}}}}}" if stack[-1][0] else "no open section"
+                raise TemplateError(f"line {text.count(chr(10), 0, m.start()) + 1}: {{{{/{name}}}}} closes {opened}")
+            stack.pop()
+
+    if len(stack) > 1:
+        name, _, offset = stack[-1]
+        raise TemplateError(f"line {text.count(chr(10), 0, offset) + 1}: {{{{#{name}}}}} is never closed")
+    if cursor < len(text):
+        root.append(text[cursor:])
+    return root
+
+
+def lookup(stack, name):
+    """Innermost scope that has `name` wins. Raises KeyError if none does."""
+    if name == '.':
+        return stack[-1]
+    for scope in reversed(stack):
+        if isinstance(scope, dict) and name in scope:
+            return scope[name]
+    raise KeyError(name)
+
+
+def compile_nodes(nodes):
+    """Render function (scope stack -> text) for a list of nodes."""
+    pieces = []
+    for node in nodes:
+        if isinstance(node, str):
+            pieces.append(lambda stack, text=node: text)
+        elif node[0] == 'var':
+            pieces.append(compile_variable(node[1], node[2]))
+        else:
+            _, name, inverted, children = node
+            pieces.append(compile_section(name, inverted, compile_nodes(children)))
+    if len(pieces) == 1:
+        return pieces[0]
+    return lambda stack: ''.join([piece(stack) for piece in pieces])
+
+
+def escape(text):
+    """
+    HTML-escape a value: '<', '>' and quotes always, '&' only where it could be
+    read as a character reference, so text the page already has round-trips.
+    """
+    text = AMPERSAND_PATTERN.sub('&amp;', text)
+    return text.replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;').replace("'", '&#x27;')
+
+
+def compile_variable(name, raw):
+    def render(stack):
+        try:
+            value = lookup(stack, name)
+        except KeyError:
+            raise TemplateError(f"no value for {{{{{name}}}}}") from None
+        text = value if isinstance(value, str) else str(value)
+        return text if raw else escape(text)
+    return render
+
+
+def compile_section(name, inverted, body):
+    def render(stack):
+        try:
+            value = lookup(stack, name)
+        except KeyError:
+            value = None
+        if inverted:
+            return '' if value else body(stack)
+        if not value:
+            return ''
+        if isinstance(value, list):
+            return ''.join([body(stack + [item]) for item in value])
+        if isinstance(value, dict):
+            return body(stack + [value])
+        return body(stack)
+    return render
+
+
+def compile_template(text):
+    """One-time compile of a template into render(context) -> text."""
+    body = compile_nodes(parse_template(text))
+    return lambda context: body([context])
+
+
+def compiled(text):
+    """Cached compile_template(): a template is parsed once per content hash."""
+    key = hash_content(text)
+    render = _compiled.get(key)
+    if render is None:
+        render = _compiled[key] = compile_template(text)
+    return render
+
+
+def render_cards(template_text, cards):
+    """All cards rendered with one compiled template, concatenated in order."""
+    render = compiled(template_text)
+    pieces = []
+    for index, card in enumerate(cards):
+        context = dict(card, index=index, number=index + 1, first=index == 0)
+        try:
+            pieces.append(render(context))
+        except TemplateError as e:
+            raise TemplateError(f"card {index + 1} ({card.get('title', '?')}): {e}") from None
+    return ''.join(pieces)
+
+
+def replace_contents(content, start, end, rendered):
+    """
+    (new content, edit): the contents of the element spanning [start, end)
+    replaced by `rendered`, keeping the blank lines and closing-tag indentation
+    around them.
+    """
+    open_end = TOKEN_PATTERN.match(content, start).end()
+    close_start = content.rfind('</', start, end)
+    inner = content[open_end:close_start]
+    lead = inner[:len(inner) - len(inner.lstrip())]
+    trail = inner[len(inner.rstrip()):]
+    new_inner = lead[:lead.rfind('\n') + 1] + rendered.rstrip('\n') + trail
+    return content[:open_end] + new_inner + content[close_start:], (open_end, close_start, new_inner)
+
+
+def resolve(path):
+    """Data-file paths are relative to the repository root."""
+    return path if os.path.isabs(path) or os.path.exists(path) else os.path.join(ROOT_DIR, path)
+
+
+def read_text(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        print(f"Error: File {path} not found.")
+        sys.exit(1)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Render cards from a JSON data file through a compiled template.")
+    parser.add_argument("data", nargs="?", default=DEFAULT_DATA, help="Card data file (default: content/tech-demo-cards.json)")
+    parser.add_argument("--template", help="Template file (default: the data file's \"template\")")
+    parser.add_argument("--page", help="Page to update (default: the data file's \"page\")")
+    parser.add_argument("--container", help="Id of the grid element whose contents are replaced (default: the data file's \"container\")")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--check", action="store_true", help="Exit 1 if the page's grid differs from the rendered cards")
+    mode.add_argument("--dry-run", action="store_true", help="Print the page changes as a unified diff")
+    mode.add_argument("--apply", action="store_true", help="Write the rendered grid into the page")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    try:
+        data = json.loads(read_text(args.data))
+    except ValueError as e:
+        print(f"Error: {args.data} is not valid JSON ({e}).")
+        sys.exit(1)
+
+    template_path = resolve(args.template or data.get('template', ''))
+    try:
+        rendered = render_cards(read_text(template_path), data.get('cards', []))
+    except TemplateError as e:
+        print(f"Error: {template_path}: {e}")
+        sys.exit(1)
+
+    if not (args.check or args.dry_run or args.apply):
+        sys.stdout.write(rendered)
+        sys.exit(0)
+
+    file_path = resolve(args.page or data.get('page', ''))
+    container = args.container or data.get('container')
+    content = read_text(file_path)
+    index = SpanIndex()
+    span = index.locate_id(file_path, content, container)
+    if span is None:
+        print(f"Error: Element with id='{container}' not found in {file_path}")
+        sys.exit(1)
+    updated, edit = replace_contents(content, span[1], span[2], rendered)
+    cards = len(data.get('cards', []))
+
+    if updated == content:
+        index.save()
+        print(f"✅ {file_path}: #{container} matches {cards} rendered cards.")
+        sys.exit(0)
+    if args.check:
+        index.save()
+        print(f"❌ {file_path}: #{container} differs from the rendered cards (run with --dry-run / --apply).")
+        sys.exit(1)
+    if args.dry_run:
+        line_diff.print_preview(content, updated, file_path)
+        sys.exit(0)
+
+    try:
+        entry = undo_journal.write_page(file_path, content, updated, [edit], "render_cards")
+    except undo_journal.PageChanged as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    index.record_edits(file_path, [edit], updated)
+    index.save()
+    print(f"Success: Rendered {cards} cards into #{container} of {file_path}. "
+          f"Undo: python3 scripts/undo_journal.py undo  (journal #{entry['seq']})")
+    sys.exit(0)
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Closing-tag repair engine (replaces fix_div_count.py, fix_tail_divs.py,
+fix_missing_tail.py, emergency_close_divs.py, emergency_close_divs_v2.py and
+emergency_tail.py).
+
+The page is tokenized once and walked once with an open-element stack:
+
+  * a closing tag with no open element of that name is deleted;
+  * a closing tag that matches an element deeper in the stack either gets the
+    missing closes of the elements in between inserted before it, or is
+    deleted itself. The choice is a greedy estimate made on the spot: it
+    compares the edits each option implies from the counts of opening and
+    closing tags still to come, without looking at where they are (e.g. a
+    stray </div> inside three open <span>s that are closed right after it is
+    deleted, not "repaired" with three inserts and three deletes). It is a
+    heuristic, so the plan is short but not guaranteed to be the minimum;
+  * comment markers are region hints: consecutive markers of one family
+    (default: <!-- Card ... -->) must sit at the same depth. Elements a region
+    leaves open are closed right before the next marker; closing tags that
+    dropped below the region's starting depth (closing its parent) are
+    deleted instead. A region also ends normally when its parent closes and
+    a new element opens at the parent's level;
+  * whatever is still open at the end of the page is closed there.
+
+Script / style / textarea / title contents are skipped (not markup). Void and
+self-closing tags never need a close. The result is a list of insertions and
+deletions in page coordinates, printed with line numbers or applied in one
+write (journaled in .undo/, span index patched).
+
+Usage:
+  python3 scripts/repair_tags.py deploy/tech-demo.html                # print the repair plan
+  python3 scripts/repair_tags.py deploy/tech-demo.html --dry-run      # show it as a diff
+  python3 scripts/repair_tags.py deploy/tech-demo.html --apply
+  python3 scripts/repair_tags.py deploy/index.html --marker "Section\\b" --apply
+"""
+import sys
+import os
+import re
+import bisect
+import argparse
+from collections import Counter
+
+import undo_journal
+import line_diff
+from span_index import SpanIndex, tokenize
+
+# Marker families used as region hints (regexes matched against the stripped comment text)
+DEFAULT_MARKERS = [r'Card\b']
+
+
+class Region:
+    """Span from one hint marker to the next marker of its family."""
+    def __init__(self, marker, snapshot):
+        self.marker = marker
+        self.snapshot = snapshot  # open-element stack at the marker
+        self.base = len(snapshot)
+        self.over_pops = []  # token indices of closes that dropped below base
+
+
+def plan_repairs(content, markers=DEFAULT_MARKERS):
+    """
+    One pass over the tokens. Returns (tokens, inserts, deletes):
+    inserts maps a token index (len(tokens) = end of page) to the elements
+    [(tag, open token index)] to close right before it, innermost first;
+    deletes maps a token index to (reason, related open token index or None).
+    """
+    tokens = tokenize(content)
+    families = [re.compile(pattern) for pattern in markers]
+    opens_left = Counter(name for kind, name, _, _ in tokens if kind == 'open')
+    closes_left = Counter(name for kind, name, _, _ in tokens if kind == 'close')
+
+    stack = []         # [(tag, open token index)]
+    positions = {}     # tag -> stack indices of its open elements
+    regions = {}       # family index -> Region
+    inserts = {}
+    deletes = {}
+
+    def pop_to(depth):
+        while len(stack) > depth:
+            tag, _ = stack.pop()
+            positions[tag].pop()
+
+    def reset(snapshot):
+        stack[:] = snapshot
+        positions.clear()
+        for depth, (tag, _) in enumerate(stack):
+            positions.setdefault(tag, []).append(depth)
+
+    for i, (kind, name, _, _) in enumerate(tokens):
+        if kind == 'open':
+            opens_left[name] -= 1
+            # A new element at a level a region dropped below: its parent really closed
+            for family in [f for f, region in regions.items() if len(stack) < region.base]:
+                del regions[family]
+            positions.setdefault(name, []).append(len(stack))
+            stack.append((name, i))
+
+        elif kind == 'close':
+            closes_left[name] -= 1
+            open_at = positions.get(name)
+            if not open_at:
+                deletes[i] = (f"no open <{name}>", None)
+                continue
+            depth = open_at[-1]
+            between = stack[depth + 1:]
+            if between:
+                # Estimated cost of closing the elements in between now vs dropping
+                # this close, from the counts of the tags still to come (greedy: the
+                # choice is not revisited)
+                closed = Counter(tag for tag, _ in between)
+                closed[name] += 1
+                cost_close, cost_delete = len(between), 1
+                for tag, count in closed.items():
+                    still_open = len(positions[tag])
+                    later = max(0, closes_left[tag] - opens_left[tag])
+                    cost_close += abs(later - (still_open - count))
+                    cost_delete += abs(later - still_open)
+                if cost_delete < cost_close:
+                    tag, opened = between[-1]
+                    deletes[i] = (f"would close <{tag}> from line {{line}} early", opened)
+                    continue
+                inserts[i] = list(reversed(between))
+            pop_to(depth)
+            for region in regions.values():
+                if depth < region.base:
+                    region.over_pops.append(i)
+
+        elif kind == 'comment':
+            for family, pattern in enumerate(families):
+                if not pattern.match(name):
+                    continue
+                region = regions.get(family)
+                if region is not None:
+                    if region.over_pops:
+                        for index in region.over_pops:
+                            # Elements of the snapshot are open again; closes inserted for them go too
+                            kept = [element for element in inserts.pop(index, []) if element not in region.snapshot]
+                            if kept:
+                                inserts[index] = kept
+                            deletes[index] = (f"closes the parent of region '{region.marker}'", None)
+                        reset(region.snapshot)
+                    elif len(stack) > region.base and stack[:region.base] == region.snapshot:
+                        inserts[i] = list(reversed(stack[region.base:]))
+                        pop_to(region.base)
+                regions[family] = Region(name, list(stack))
+
+    if stack:
+        inserts[len(tokens)] = list(reversed(stack))
+    return tokens, inserts, deletes
+
+
+def line_span(content, start, end):
+    """(line start, line end incl. newline, True if [start, end) is alone on its line)."""
+    line_start = content.rfind('\n', 0, start) + 1
+    line_end = content.find('\n', end)
+    line_end = len(content) if line_end == -1 else line_end + 1
+    alone = not content[line_start:start].strip() and not content[end:line_end].strip()
+    return line_start, line_end, alone
+
+
+def indentation(content, pos):
+    line_start = content.rfind('\n', 0, pos) + 1
+    return re.match(r'[ \t]*', content[line_start:pos]).group(0)
+
+
+def build_edits(content, tokens, inserts, deletes):
+    """[(start, end, new_text)] in page coordinates. A close alone on its line is deleted with the line;
+    inserted closes before a tag that starts its line get their own lines, indented like their open tag."""
+    edits = []
+    for i, closing in inserts.items():
+        pos = tokens[i][2] if i < len(tokens) else len(content)
+        line_start = content.rfind('\n', 0, pos) + 1
+        if not content[line_start:pos].strip():
+            # Above any blank lines separating the tag from the previous content
+            while line_start and not content[content.rfind('\n', 0, line_start - 1) + 1:line_start].strip():
+                line_start = content.rfind('\n', 0, line_start - 1) + 1
+            text = ''.join(f"{indentation(content, tokens[opened][2])}</{tag}>\n" for tag, opened in closing)
+            if line_start == len(content) and content and not content.endswith('\n'):
+                text = '\n' + text
+            edits.append((line_start, line_start, text))
+        else:
+            edits.append((pos, pos, ''.join(f"</{tag}>" for tag, _ in closing)))
+    for i in deletes:
+        _, _, start, end = tokens[i]
+        line_start, line_end, alone = line_span(content, start, end)
+        edits.append((line_start, line_end, '') if alone else (start, end, ''))
+    return sorted(edits)
+
+
+def apply_edits(content, edits):
+    pieces = []
+    cursor = 0
+    for start, end, new_text in edits:
+        pieces.append(content[cursor:start])
+        pieces.append(new_text)
+        cursor = end
+    pieces.append(content[cursor:])
+    return ''.join(pieces)
+
+
+def describe(content, tokens, inserts, deletes):
+    """Repair plan as [(line, message)] in page order."""
+    newlines = [m.start() for m in re.finditer('\n', content)]
+
+    def line_of(pos):
+        return bisect.bisect_left(newlines, pos) + 1
+
+    def label(i):
+        if i == len(tokens):
+            return "end of page"
+        kind, name, _, _ = tokens[i]
+        if kind == 'comment':
+            return f"<!-- {name} -->"
+        return f"</{name}>"
+
+    lines = []
+    for i, closing in inserts.items():
+        pos = tokens[i][2] if i < len(tokens) else len(content)
+        for tag, opened in closing:
+            lines.append((pos, f"insert </{tag}> before {label(i)}  (closes <{tag}> from line {line_of(tokens[opened][2])})"))
+    for i, (reason, opened) in deletes.items():
+        if opened is not None:
+            reason = reason.format(line=line_of(tokens[opened][2]))
+        lines.append((tokens[i][2], f"delete {label(i)}  ({reason})"))
+    return [(line_of(pos), message) for pos, message in sorted(lines, key=lambda item: item[0])]
+
+
+def repair(content, markers=DEFAULT_MARKERS):
+    """(repaired content, edits, plan lines) for one page."""
+    tokens, inserts, deletes = plan_repairs(content, markers)
+    edits = build_edits(content, tokens, inserts, deletes)
+    return apply_edits(content, edits), edits, describe(content, tokens, inserts, deletes)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Compute (and optionally apply) the closing-tag repairs a page needs.")
+    parser.add_argument("files", nargs="+", help="Pages to repair")
+    parser.add_argument("--marker", action="append",
+                        help="Regex for a marker comment family used as region hints (repeatable; default: 'Card\\b')")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--apply", action="store_true", help="Write the repaired pages")
+    mode.add_argument("--dry-run", action="store_true", help="Print the repairs as a unified diff")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    markers = args.marker or DEFAULT_MARKERS
+    needed = False
+
+    for file_path in args.files:
+        if not os.path.exists(file_path):
+            print(f"Error: File {file_path} not found.")
+            sys.exit(1)
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        repaired, edits, plan = repair(content, markers)
+        if not edits:
+            print(f"✅ {file_path}: balanced")
+            continue
+        needed = True
+        print(f"🔧 {file_path}: {len(plan)} repair{'s' if len(plan) != 1 else ''}")
+        for line, message in plan:
+            print(f"  Line {line}: {message}")
+
+        if args.dry_run:
+            line_diff.print_preview(content, repaired, file_path)
+        elif args.apply:
+            try:
+                entry = undo_journal.write_page(file_path, content, repaired, edits, "repair_tags")
+            except undo_journal.PageChanged as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+            index = SpanIndex()
+            if index.is_current(file_path, content):
+                index.record_edits(file_path, edits, repaired)
+                index.save()
+            print(f"Success: Repaired {file_path}. Undo: python3 scripts/undo_journal.py undo  (journal #{entry['seq']})")
+
+    sys.exit(1 if needed and not args.apply else 0)
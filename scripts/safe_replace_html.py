@@ -1,98 +1,366 @@
 #!/usr/bin/env python3
 import sys
-import re
 import os
+import json
+import argparse
 
-def replace_element_by_id(file_path, target_id, new_content):
+from span_index import SpanIndex, TOKEN_PATTERN, find_element_spans, page_key
+import html_select
+import undo_journal
+import line_diff
+
+
+def locate_targets(content, target_ids, file_path, index):
+    """
+    {id: (tag, start, end)} for every target. Spans come from the span index
+    (a dict lookup when the page is unchanged since the last edit); if an id is
+    missing from it the page is re-scanned for the targets, and only ids the
+    scan cannot resolve either are reported (with the real problem).
+    """
+    entry = index.page(file_path, content)
+    warn_shared_ids(target_ids, file_path, entry, index)
+    spans = {}
+    for target_id in target_ids:
+        span = entry['ids'].get(target_id)
+        if span is None:
+            break
+        spans[target_id] = (span[2], span[0], span[1])
+    else:
+        return spans
+
+    spans, errors = find_element_spans(content, target_ids)
+    if not errors:
+        return spans
+    for target_id, error in errors.items():
+        if error == "not found":
+            print(f"Error: Element with id='{target_id}' not found in {file_path}")
+        else:
+            print(f"Error: {error}")
+    sys.exit(1)
+
+
+def warn_shared_ids(target_ids, file_path, entry, index):
+    """
+    Warns about target ids that are not unique: used again on this page (only
+    the first element is replaced) or, per the cross-page id index that
+    `validate_html.py --id-index` records, on other pages (left unchanged).
+    """
+    page = page_key(file_path)
+    for target_id in target_ids:
+        if target_id in entry['duplicates']:
+            print(f"Warning: id='{target_id}' is used more than once in {file_path}; only the first element is replaced.")
+        for other, line, tag in index.id_uses(target_id):
+            if other != page:
+                print(f"Warning: id='{target_id}' is also used in {other} line {line} (<{tag}>), which is not changed.")
+
+
+def apply_replacements(content, replacements, file_path, index):
+    """
+    Replaces every id in `replacements` (id -> new markup) in one pass.
+    Exits with an error if an id is missing/unbalanced or two target spans overlap
+    (e.g. one target nested inside another); nothing is written in that case.
+    Returns (new content, [(start, end, new_text), ...]).
+    """
+    spans = locate_targets(content, list(replacements), file_path, index)
+
+    ordered = sorted(spans.items(), key=lambda item: item[1][1])
+    for (prev_id, (_, _, prev_end)), (next_id, (_, next_start, _)) in zip(ordered, ordered[1:]):
+        if next_start < prev_end:
+            print(f"Error: targets '#{prev_id}' and '#{next_id}' overlap. Replace them in separate runs.")
+            sys.exit(1)
+
+    pieces = []
+    edits = []
+    cursor = 0
+    for target_id, (_, start, end) in ordered:
+        pieces.append(content[cursor:start])
+        pieces.append(replacements[target_id])
+        edits.append((start, end, replacements[target_id]))
+        cursor = end
+    pieces.append(content[cursor:])
+    return ''.join(pieces), edits
+
+
+def write_replacements(file_path, replacements, dry_run=False):
     """
-    Replaces an HTML element's content by ID, respecting nested tags.
-    Strategy:
-    1. Find the tag with the ID.
-    2. Determine the tag type (div, section, ul, etc.).
-    3. Iterate forward counting opening/closing tags of that same type to find the true end.
-    4. Replace the content.
+    Reads the page, applies all replacements, writes it once and patches the span index.
+    With dry_run the unified diff is printed instead, nothing (not even the
+    span index) is saved, and False is returned.
     """
+    content = read_target(file_path)
+    index = SpanIndex()
+    updated_file_content, edits = apply_replacements(content, replacements, file_path, index)
+
+    if dry_run:
+        line_diff.print_preview(content, updated_file_content, file_path)
+        return False
+
+    write_page(file_path, content, updated_file_content, edits)
+
+    index.record_edits(file_path, edits, updated_file_content)
+    index.save()
+    return True
+
+
+def write_page(file_path, content, updated_file_content, edits):
+    """Journaled write under the page lock; exits if the page changed since it was read."""
+    try:
+        undo_journal.write_page(file_path, content, updated_file_content, edits, "safe_replace_html")
+    except undo_journal.PageChanged as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+def read_target(file_path):
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+            return f.read()
     except FileNotFoundError:
         print(f"Error: File {file_path} not found.")
         sys.exit(1)
 
-    # 1. Find the tag definition 
-    # Matches: <tag ... id="target_id" ... > or <tag ... id='target_id' ... >
-    # We capture the tag name (group 1) and the full match end index.
-    pattern = re.compile(rf'<(\w+)[^>]*\bid=["\']{target_id}["\'][^>]*>', re.IGNORECASE)
-    match = pattern.search(content)
 
-    if not match:
-        print(f"Error: Element with id='{target_id}' not found in {file_path}")
+def replace_element_by_id(file_path, target_id, new_content, dry_run=False):
+    """
+    Replaces the element with this id (opening tag through its matching closing
+    tag) by `new_content`. A single-id write_replacements(): the span comes from
+    the span index (see locate_targets), and the write is journaled.
+    """
+    if write_replacements(file_path, {target_id: new_content}, dry_run):
+        print(f"Successfully replaced element #{target_id} in {file_path}")
+
+
+def load_manifest(manifest_path):
+    """
+    Manifest: JSON object mapping id -> replacement. A replacement is either a
+    string (a file path if it exists, otherwise inline markup, like the CLI
+    argument) or an object {"file": path} / {"content": markup}.
+    """
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    replacements = {}
+    for target_id, spec in manifest.items():
+        if isinstance(spec, dict):
+            if 'file' in spec:
+                with open(os.path.join(base_dir, spec['file']), 'r', encoding='utf-8') as cf:
+                    replacements[target_id] = cf.read()
+            else:
+                replacements[target_id] = spec['content']
+        else:
+            replacements[target_id] = resolve_content_arg(spec, base_dir)
+    return replacements
+
+
+def resolve_content_arg(content_arg, base_dir=''):
+    # Check if content_arg is a file path
+    candidate = os.path.join(base_dir, content_arg) if base_dir else content_arg
+    if os.path.exists(candidate):
+        with open(candidate, 'r', encoding='utf-8') as cf:
+            return cf.read()
+    return content_arg
+
+
+def replace_elements_from_manifest(file_path, manifest_path, dry_run=False):
+    replacements = load_manifest(manifest_path)
+    if write_replacements(file_path, replacements, dry_run):
+        print(f"Successfully replaced {len(replacements)} elements in {file_path}: "
+              + ", ".join(f"#{target_id}" for target_id in replacements))
+
+
+def edit_start_tag(tag_text, set_attrs=(), remove_attrs=(), add_classes=(), remove_classes=()):
+    """
+    Rewrites the attributes of one opening tag, leaving everything else (order,
+    quoting, whitespace of untouched attributes) exactly as it was.
+    """
+    m = TOKEN_PATTERN.match(tag_text)
+    attrs_start = m.start(4)
+    attr_text = m.group(4)
+    set_attrs = dict(set_attrs)
+    pending = dict(set_attrs)
+    class_edit = bool(add_classes or remove_classes)
+
+    pieces = []
+    cursor = 0
+    for am in html_select.ATTR_PATTERN.finditer(attr_text):
+        name = am.group(1).lower()
+        if name == '/':
+            continue
+        if name in remove_attrs:
+            # Drop the attribute together with the whitespace in front of it
+            ws_start = am.start()
+            while ws_start > 0 and attr_text[ws_start - 1].isspace():
+                ws_start -= 1
+            pieces.append(attr_text[cursor:ws_start])
+            cursor = am.end()
+        elif name in pending:
+            pieces.append(attr_text[cursor:am.start()])
+            pieces.append(f'{am.group(1)}="{pending.pop(name)}"')
+            cursor = am.end()
+        elif name == 'class' and class_edit:
+            classes = next((v for v in am.group(2, 3, 4) if v is not None), '').split()
+            classes = [c for c in classes if c not in remove_classes]
+            classes += [c for c in add_classes if c not in classes]
+            pieces.append(attr_text[cursor:am.start()])
+            pieces.append(f'class="{" ".join(classes)}"')
+            cursor = am.end()
+            class_edit = False
+    pieces.append(attr_text[cursor:])
+    new_attr_text = ''.join(pieces)
+
+    additions = [f'{name}="{value}"' for name, value in pending.items()]
+    if class_edit and add_classes:
+        additions.append(f'class="{" ".join(add_classes)}"')
+    if additions:
+        body = new_attr_text.rstrip()
+        self_closing = body.endswith('/')
+        if self_closing:
+            body = body[:-1].rstrip()
+        new_attr_text = body + ' ' + ' '.join(additions) + (' /' if self_closing else '')
+
+    return tag_text[:attrs_start] + new_attr_text + tag_text[m.end(4):]
+
+
+def wrapper_parts(wrapper):
+    """'<div class="x">' -> ('<div class="x">', '</div>')"""
+    m = TOKEN_PATTERN.match(wrapper.strip())
+    if not m or m.group(2) or m.group(3) is None:
+        print(f"Error: --wrap expects an opening tag such as '<div class=\"wrapper\">', got {wrapper!r}")
         sys.exit(1)
+    return m.group(0), f"</{m.group(3)}>"
 
-    tag_name = match.group(1)
-    start_index = match.start()
-    content_start_index = match.end()
-    
-    # 2. Find the matching closing tag
-    # We scan starting from the end of the opening tag
-    nesting_level = 1
-    
-    # Regex to find opening or closing tags of the SAME type
-    # <div or </div
-    tag_pattern = re.compile(rf'(<{tag_name}[^>]*>)|(</{tag_name}>)', re.IGNORECASE)
-    
-    current_pos = content_start_index
-    close_tag_end_index = -1
-
-    while True:
-        tag_match = tag_pattern.search(content, current_pos)
-        if not tag_match:
-            break
-        
-        if tag_match.group(1): # Opening tag
-            nesting_level += 1
-        elif tag_match.group(2): # Closing tag
-            nesting_level -= 1
-        
-        current_pos = tag_match.end()
-        
-        if nesting_level == 0:
-            close_tag_end_index = tag_match.end()
-            break
 
-    if nesting_level != 0:
-        print(f"Error: unbalanced tags. Could not find closing </{tag_name}> for id='{target_id}'")
+def selector_edits(content, matches, args):
+    """[(start, end, new_text), ...] for every matched element, in document order."""
+    edits = []
+    attr_edit = args.set_attr or args.remove_attr or args.add_class or args.remove_class
+    if args.replace is not None:
+        replacement = resolve_content_arg(args.replace)
+        for prev, element in zip([None] + matches, matches):
+            if prev is not None and element.start < prev.end:
+                print(f"Error: matches <{prev.tag}> at {prev.start} and <{element.tag}> at {element.start} are nested; "
+                      "--replace needs non-overlapping matches. Narrow the selector.")
+                sys.exit(1)
+            edits.append((element.start, element.end, replacement))
+        return edits
+
+    if args.wrap is not None:
+        opening, closing = wrapper_parts(resolve_content_arg(args.wrap))
+    for element in matches:
+        if args.wrap is not None:
+            edits.append((element.start, element.start, opening))
+        if attr_edit:
+            tag_text = content[element.start:element.tag_end]
+            new_tag = edit_start_tag(tag_text, args.set_attr, args.remove_attr, args.add_class, args.remove_class)
+            if new_tag != tag_text:
+                edits.append((element.start, element.tag_end, new_tag))
+        if args.wrap is not None:
+            edits.append((element.end, element.end, closing))
+    # Insertions at the same offset keep document order (outer wrapper first)
+    return sorted(edits, key=lambda edit: (edit[0], edit[1] > edit[0]))
+
+
+def apply_edits(content, edits):
+    pieces = []
+    cursor = 0
+    for start, end, new_text in edits:
+        pieces.append(content[cursor:start])
+        pieces.append(new_text)
+        cursor = end
+    pieces.append(content[cursor:])
+    return ''.join(pieces)
+
+
+def parse_select_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="safe_replace_html.py",
+        description="Edit every element matching a CSS selector in one pass.")
+    parser.add_argument("file_path")
+    parser.add_argument("--select", required=True,
+                        help="Selector: tag, .class, #id, [attr], [attr=value], :nth-of-type(), descendant, a, b")
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument("--replace", metavar="CONTENT", help="Replace each match (markup or a file path)")
+    action.add_argument("--wrap", metavar="OPEN_TAG", help="Wrap each match in this element, e.g. '<div class=\"x\">'")
+    parser.add_argument("--set-attr", action="append", default=[], metavar="NAME=VALUE", help="Set an attribute")
+    parser.add_argument("--remove-attr", action="append", default=[], metavar="NAME", help="Remove an attribute")
+    parser.add_argument("--add-class", action="append", default=[], metavar="CLASS", help="Add a class")
+    parser.add_argument("--remove-class", action="append", default=[], metavar="CLASS", help="Remove a class")
+    parser.add_argument("--expect", type=int, metavar="N", help="Abort unless exactly N elements match")
+    parser.add_argument("--dry-run", action="store_true", help="Print the unified diff instead of writing")
+    args = parser.parse_args(argv)
+
+    pairs = []
+    for item in args.set_attr:
+        name, sep, value = item.partition('=')
+        if not sep:
+            parser.error(f"--set-attr expects NAME=VALUE, got {item!r}")
+        pairs.append((name.lower(), value))
+    args.set_attr = pairs
+    args.remove_attr = [name.lower() for name in args.remove_attr]
+    attr_edit = args.set_attr or args.remove_attr or args.add_class or args.remove_class
+    if args.replace is not None and attr_edit:
+        parser.error("--replace cannot be combined with attribute/class edits")
+    if args.replace is None and args.wrap is None and not attr_edit:
+        parser.error("nothing to do: give --replace, --wrap or an attribute/class edit")
+    return args
+
+
+def edit_by_selector(args):
+    content = read_target(args.file_path)
+    try:
+        matches, counts = html_select.select(content, args.select)
+    except html_select.SelectorError as e:
+        print(f"Error: {e}")
         sys.exit(1)
 
-    # 3. Construct new content
-    # We keep the original file content up to the element's start
-    # We insert the NEW content
-    # We append the original file content after the element's end
-    
-    # Note: If we want to replace the WHOLE element (including outer tags), we use start_index to close_tag_end_index.
-    # If the user passed raw content that includes the container, we replace the whole thing.
-    # This script assumes 'new_content' REPLACES the element entirely.
-    
-    updated_file_content = content[:start_index] + new_content + content[close_tag_end_index:]
-    
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(updated_file_content)
-    
-    print(f"Successfully replaced element #{target_id} in {file_path}")
+    for part, count in zip(args.select.split(','), counts):
+        print(f"  {part.strip()}: {count} match{'es' if count != 1 else ''}")
+    if args.expect is not None and len(matches) != args.expect:
+        print(f"Error: expected {args.expect} matches, found {len(matches)}. Nothing written.")
+        sys.exit(1)
+    if not matches:
+        print(f"Error: no element matches '{args.select}' in {args.file_path}")
+        sys.exit(1)
+
+    edits = selector_edits(content, matches, args)
+    updated_file_content = apply_edits(content, edits)
+    if args.dry_run:
+        line_diff.print_preview(content, updated_file_content, args.file_path)
+        return
+
+    write_page(args.file_path, content, updated_file_content, edits)
+
+    # Keep the span index current if it already knew this version of the page
+    index = SpanIndex()
+    if index.is_current(args.file_path, content):
+        index.record_edits(args.file_path, edits, updated_file_content)
+        index.save()
+    print(f"Successfully edited {len(matches)} element{'s' if len(matches) != 1 else ''} in {args.file_path}")
+
 
 if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("Usage: python3 safe_replace_html.py <file_path> <target_id> <new_content_string_or_file>")
+    if "--select" in sys.argv[2:]:
+        edit_by_selector(parse_select_args(sys.argv[1:]))
+        sys.exit(0)
+
+    dry_run = "--dry-run" in sys.argv
+    argv = [a for a in sys.argv if a != "--dry-run"]
+
+    if len(argv) == 4 and argv[2] == "--manifest":
+        replace_elements_from_manifest(argv[1], argv[3], dry_run)
+        sys.exit(0)
+
+    if len(argv) < 4:
+        print("Usage: python3 safe_replace_html.py <file_path> <target_id> <new_content_string_or_file> [--dry-run]")
+        print("       python3 safe_replace_html.py <file_path> --manifest <manifest.json> [--dry-run]")
+        print("       python3 safe_replace_html.py <file_path> --select <selector> [--replace X | --wrap TAG] [--set-attr N=V] ... [--dry-run]")
         sys.exit(1)
-        
-    f_path = sys.argv[1]
-    t_id = sys.argv[2]
-    content_arg = sys.argv[3]
-    
-    # Check if content_arg is a file path
-    replacement_text = content_arg
-    if os.path.exists(content_arg):
-         with open(content_arg, 'r', encoding='utf-8') as cf:
-             replacement_text = cf.read()
-    
-    replace_element_by_id(f_path, t_id, replacement_text)
+
+    f_path = argv[1]
+    t_id = argv[2]
+    content_arg = argv[3]
+
+    replacement_text = resolve_content_arg(content_arg)
+
+    replace_element_by_id(f_path, t_id, replacement_text, dry_run)
@@ -1,16 +1,204 @@
 import sys
 import os
-import shutil
+import re
+import json
 
-def main():
-    if len(sys.argv) < 4:
-        print("Usage: python3 smart_replace.py <target_file> <old_clip_path> <new_clip_path> [--force]")
+import undo_journal
+import line_diff
+
+# Thresholds
+LARGE_DELETION_THRESHOLD = -15  # Alert if removing > 15 lines net
+
+# Patch files (--patch): any number of blocks of the form
+#   <<<<<<< SEARCH
+#   old lines
+#   =======
+#   new lines
+#   >>>>>>> REPLACE
+# or a JSON list of {"old": ..., "new": ...} objects.
+SEARCH_MARKER = "<<<<<<< SEARCH"
+DIVIDER_MARKER = "======="
+REPLACE_MARKER = ">>>>>>> REPLACE"
+
+# --loose: any run of whitespace matches any other run (indentation, line wrapping)
+WHITESPACE_RUN = re.compile(r'\s+')
+
+
+def find_all(text, pattern):
+    """Start offset of every occurrence of pattern in text (overlapping ones included)."""
+    starts = []
+    pos = text.find(pattern)
+    while pos != -1:
+        starts.append(pos)
+        pos = text.find(pattern, pos + 1)
+    return starts
+
+
+def collapse_whitespace(text):
+    """
+    Whitespace-collapsed view of `text`: every run of whitespace becomes one space.
+    Returns (view, offsets) where offsets[i] is the index in `text` of view[i].
+    """
+    pieces = []
+    offsets = []
+    pos = 0
+    for m in WHITESPACE_RUN.finditer(text):
+        pieces.append(text[pos:m.start()])
+        offsets.extend(range(pos, m.start()))
+        pieces.append(' ')
+        offsets.append(m.start())
+        pos = m.end()
+    pieces.append(text[pos:])
+    offsets.extend(range(pos, len(text)))
+    return ''.join(pieces), offsets
+
+
+def parse_patch(patch_text, patch_path):
+    """[(old_text, new_text), ...] from a SEARCH/REPLACE block file or a JSON list."""
+    if patch_path.endswith('.json'):
+        data = json.loads(patch_text)
+        hunks = data['hunks'] if isinstance(data, dict) else data
+        return [(hunk['old'], hunk['new']) for hunk in hunks]
+
+    hunks = []
+    section = None
+    old_lines, new_lines = [], []
+    for number, line in enumerate(patch_text.splitlines(keepends=True), 1):
+        marker = line.rstrip('\r\n')
+        if marker == SEARCH_MARKER and section is None:
+            section, old_lines, new_lines = 'old', [], []
+        elif marker == DIVIDER_MARKER and section == 'old':
+            section = 'new'
+        elif marker == REPLACE_MARKER and section == 'new':
+            hunks.append((''.join(old_lines), ''.join(new_lines)))
+            section = None
+        elif section == 'old':
+            old_lines.append(line)
+        elif section == 'new':
+            new_lines.append(line)
+        elif line.strip():
+            raise ValueError(f"line {number}: text outside a {SEARCH_MARKER} ... {REPLACE_MARKER} block")
+    if section is not None:
+        raise ValueError(f"unterminated block (missing {REPLACE_MARKER if section == 'new' else DIVIDER_MARKER})")
+    return hunks
+
+
+def find_exact(content, olds):
+    """
+    [[(start, end), ...] per clip] for exact matches. One C-level str.find scan
+    per clip, so the cost is O(clips x page) - but on deploy/tech-demo.html
+    (135 KB) that beat a pure-Python single-pass Aho-Corasick automaton at every
+    hunk count measured (1 to 5000, 6-100x faster).
+    """
+    return [[(start, start + len(old)) for start in find_all(content, old)] for old in olds]
+
+
+def whitespace_extent(content, pos, step, run):
+    """
+    Where the page's counterpart of a clip's whitespace `run` ends, walking from
+    pos backwards (step -1, run read from the match outwards) or forwards (step 1):
+    as many line ends as the run has, and spaces beyond the outermost one only
+    if the run has them too (so the next line's indentation is left alone).
+    """
+    newlines = run.count('\n')
+    spaces_beyond = run[-1] in ' \t'
+    i = pos - 1 if step < 0 else pos
+    while 0 <= i < len(content):
+        ch = content[i]
+        if ch == '\n':
+            if not newlines:
+                break
+            newlines -= 1
+        elif ch not in ' \t' or (not newlines and not spaces_beyond):
+            break
+        i += step
+    return i + 1 if step < 0 else i
+
+
+def widen_to_clip_whitespace(content, start, end, old):
+    """
+    Extends a loose match (which starts and ends on non-space characters) over
+    the page's indentation and line ends where the clip has them, so the
+    replacement takes their place instead of being inserted between them.
+    """
+    lead = old[:len(old) - len(old.lstrip())]
+    trail = old[len(old.rstrip()):]
+    if lead:
+        start = whitespace_extent(content, start, -1, lead[::-1])
+    if trail:
+        end = whitespace_extent(content, end, 1, trail)
+    return start, end
+
+
+def find_loose(content, olds):
+    """
+    [[(start, end), ...] per clip] matching whitespace-insensitively: clips and
+    page are compared in their collapsed views, and matches are mapped back to
+    the original page so the replacement is spliced in exactly there.
+    """
+    view, offsets = collapse_whitespace(content)
+    patterns = [collapse_whitespace(old)[0].strip() for old in olds]
+    spans = []
+    for old, pattern in zip(olds, patterns):
+        found = find_all(view, pattern)
+        # Patterns are stripped, so a match starts and ends on a non-space character
+        spans.append([widen_to_clip_whitespace(content, offsets[i], offsets[i + len(pattern) - 1] + 1, old)
+                      for i in found])
+    return spans
+
+
+def locate_hunks(content, hunks, labels, loose=False):
+    """
+    Finds every old clip (one str.find scan per clip, see find_exact) and checks
+    all hunks together: each old clip must occur exactly once and no two hunks
+    may overlap.
+    Returns the hunks as [(start, end, new_text, label)] sorted by position.
+    """
+    olds = [old for old, _ in hunks]
+    for label, old in zip(labels, olds):
+        if not (old.strip() if loose else old):
+            print(f"Error: {label} is empty.")
+            sys.exit(1)
+
+    spans = find_loose(content, olds) if loose else find_exact(content, olds)
+
+    failed = False
+    for label, old, found in zip(labels, olds, spans):
+        if not found:
+            print(f"Error: {label} not found in file. Check whitespace or context.")
+            print(f"--- Search text start ---\n{old[:100]}\n-------------------------")
+            if not loose:
+                print("Hint: --loose ignores indentation and line-wrapping differences.")
+            failed = True
+        elif len(found) > 1:
+            print(f"Error: {label} found {len(found)} times. Context is not unique. Please provide more context.")
+            failed = True
+    if failed:
         sys.exit(1)
 
-    target_file = sys.argv[1]
-    old_clip_path = sys.argv[2]
-    new_clip_path = sys.argv[3]
+    located = sorted((found[0][0], found[0][1], new, label)
+                     for (old, new), found, label in zip(hunks, spans, labels))
+    for prev, nxt in zip(located, located[1:]):
+        if nxt[0] < prev[1]:
+            print(f"Error: {prev[3]} and {nxt[3]} overlap in the file. Merge them into one hunk.")
+            sys.exit(1)
+    return located
+
+
+def main():
+    args = [a for a in sys.argv[1:] if a not in ("--force", "--loose", "--dry-run")]
     force = "--force" in sys.argv
+    loose = "--loose" in sys.argv
+    dry_run = "--dry-run" in sys.argv
+
+    if len(args) == 3 and args[1] == "--patch":
+        target_file, patch_path = args[0], args[2]
+    elif len(args) == 3:
+        target_file, patch_path = args[0], None
+    else:
+        print("Usage: python3 smart_replace.py <target_file> <old_clip_path> <new_clip_path> [--force] [--loose] [--dry-run]")
+        print("       python3 smart_replace.py <target_file> --patch <patch_file> [--force] [--loose] [--dry-run]")
+        sys.exit(1)
 
     if not os.path.exists(target_file):
         print(f"Error: Target file {target_file} not found.")
@@ -20,54 +208,84 @@ def main():
     with open(target_file, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    with open(old_clip_path, 'r', encoding='utf-8') as f:
-        old_text = f.read()
+    if patch_path is None:
+        with open(args[1], 'r', encoding='utf-8') as f:
+            old_text = f.read()
+        with open(args[2], 'r', encoding='utf-8') as f:
+            new_text = f.read()
+        hunks = [(old_text, new_text)]
+        labels = ["'Old text'"]
+    else:
+        with open(patch_path, 'r', encoding='utf-8') as f:
+            patch_text = f.read()
+        try:
+            hunks = parse_patch(patch_text, patch_path)
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"Error: Could not parse patch {patch_path}: {e}")
+            sys.exit(1)
+        if not hunks:
+            print(f"Error: No hunks found in {patch_path}.")
+            sys.exit(1)
+        labels = [f"Hunk {i}" for i in range(1, len(hunks) + 1)]
 
-    with open(new_clip_path, 'r', encoding='utf-8') as f:
-        new_text = f.read()
+    # 1. Uniqueness + overlap check (all hunks together)
+    located = locate_hunks(content, hunks, labels, loose)
 
-    # 1. Uniqueness Check
-    count = content.count(old_text)
-    if count == 0:
-        print("Error: 'Old text' not found in file. Check whitespace or context.")
-        print(f"--- Search text start ---\n{old_text[:100]}\n-------------------------")
-        sys.exit(1)
-    if count > 1:
-        print(f"Error: 'Old text' found {count} times. Context is not unique. Please provide more context.")
-        sys.exit(1)
+    # 2. Safety Check: Dangerous Deletions (per hunk)
+    line_delta = 0
+    blocked = []
+    order = {label: i for i, label in enumerate(labels)}
+    for start, end, new_text, label in sorted(located, key=lambda hunk: order[hunk[3]]):
+        # Measured on the text actually matched, which --loose may wrap differently than the clip
+        old_lines = content[start:end].splitlines()
+        new_lines = new_text.splitlines()
 
-    # 2. Safety Check: Dangerous Deletions
-    old_lines = old_text.splitlines()
-    new_lines = new_text.splitlines()
-    
-    # Calculate net change
-    line_delta = len(new_lines) - len(old_lines)
-    
-    # Thresholds
-    LARGE_DELETION_THRESHOLD = -15  # Alert if removing > 15 lines net
-    
-    if line_delta < LARGE_DELETION_THRESHOLD and not force:
-        print(f"\n[SAFETY BLOCK] This edit removes {abs(line_delta)} lines (net).")
-        print(f"Old block size: {len(old_lines)} lines")
-        print(f"New block size: {len(new_lines)} lines")
+        # Calculate net change
+        delta = len(new_lines) - len(old_lines)
+        line_delta += delta
+        if delta < LARGE_DELETION_THRESHOLD:
+            blocked.append((label, delta, len(old_lines), len(new_lines)))
+
+    if blocked and not force:
+        for label, delta, old_size, new_size in blocked:
+            prefix = "" if patch_path is None else f"{label}: "
+            print(f"\n[SAFETY BLOCK] {prefix}This edit removes {abs(delta)} lines (net).")
+            print(f"Old block size: {old_size} lines")
+            print(f"New block size: {new_size} lines")
         print("This looks like a potential accidental deletion.")
-        print("Action: Aborted. Use --force to override if this is intentional.\n")
-        sys.exit(1)
+        if dry_run:
+            print("Action: A real run would abort. Use --force to override if this is intentional.\n")
+        else:
+            print("Action: Aborted. Use --force to override if this is intentional.\n")
+            sys.exit(1)
 
-    # 3. Apply Replacement
-    new_content = content.replace(old_text, new_text)
+    # 3. Apply Replacement (all hunks spliced in one go)
+    pieces = []
+    cursor = 0
+    for start, end, new_text, _ in located:
+        pieces.append(content[cursor:start])
+        pieces.append(new_text)
+        cursor = end
+    pieces.append(content[cursor:])
+    new_content = ''.join(pieces)
 
-    # 4. Backup
-    backup_path = target_file + ".bak"
-    shutil.copy2(target_file, backup_path)
-    
-    # 5. Write
-    with open(target_file, 'w', encoding='utf-8') as f:
-        f.write(new_content)
+    if dry_run:
+        line_diff.print_preview(content, new_content, target_file)
+        print(f"Lines changed: {line_delta}")
+        return
+
+    # 4. Write under the page lock + undo journal (reverse delta only, outside deploy/)
+    try:
+        entry = undo_journal.write_page(target_file, content, new_content,
+                                        [(start, end, new_text) for start, end, new_text, _ in located], "smart_replace")
+    except undo_journal.PageChanged as e:
+        print(f"Error: {e}")
+        sys.exit(1)
 
-    print(f"Success: Updated {target_file}.")
-    print(f"Backup saved to {backup_path}")
+    print(f"Success: Updated {target_file}." + ("" if patch_path is None else f" ({len(hunks)} hunks)"))
     print(f"Lines changed: {line_delta}")
+    if entry:
+        print(f"Undo: python3 scripts/undo_journal.py undo  (journal #{entry['seq']})")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+"""
+Persistent id / comment-marker span index for the editing scripts.
+
+For every deploy page the index stores where each element id and each comment
+marker (e.g. `<!-- Card 4: Technical Specialist -->`) lives:
+
+  {"scanner": sha256(this file),
+   "pages": {"deploy/tech-demo.html": {
+       "sha256": <content hash>,
+       "ids": {id: [start, end, tag]},          # full element, open tag .. close tag
+       "markers": {text: [[start, end], ...]},   # comment text without <!-- -->
+       "duplicates": [id, ...],                # ids on more than one element
+       "raw": [[start, end], ...]}},           # script/style/textarea/title elements
+   "id_pages": {"deploy/index.html": {
+       "stat": [mtime_ns, size],                # file stat when the page was validated
+       "ids": {id: [[line, tag], ...]}}}}      # every use, in page order
+
+Offsets are str indices into the decoded page, so `content[start:end]` is the
+element. A page whose content hash no longer matches is rescanned on the next
+lookup. Tools that write a page call record_edits() so the entry is patched in
+place (spans after an edit are shifted, the inserted text is scanned on its
+own, and elements an edit only partly covered are located again) instead of
+rebuilding the whole entry.
+
+"id_pages" is the cross-page id index: `validate_html.py --id-index` records
+each page's ids from its validation pass (record_page_ids()), and id_uses()
+answers "where else is this id used" from the pages unchanged since then.
+
+Usage:
+  python3 scripts/span_index.py deploy/tech-demo.html                 # list ids and markers
+  python3 scripts/span_index.py deploy/tech-demo.html --id agent-grid
+  python3 scripts/span_index.py deploy/tech-demo.html --marker "Card 4: Technical Specialist"
+"""
+import sys
+import os
+import re
+import json
+import bisect
+import hashlib
+import argparse
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEPLOY_DIR = os.path.join(ROOT_DIR, "deploy")
+SPAN_INDEX_PATH = os.path.join(ROOT_DIR, ".cache", "span_index.json")
+
+# One tokenizer for the whole page: comments are reported as such, every other
+# tag with its name, whether it closes, and its raw attribute text.
+TOKEN_PATTERN = re.compile(r'<!--(.*?)-->|<(/?)([a-zA-Z][\w:-]*)((?:[^>"\']|"[^"]*"|\'[^\']*\')*)>', re.DOTALL)
+ID_ATTR_PATTERN = re.compile(r'(?<![\w-])id\s*=\s*(?:"([^"]*)"|\'([^\']*)\')', re.IGNORECASE)
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param', 'source', 'track', 'wbr'
+}
+# Elements whose content is raw text: tags inside them are not tags
+RAW_TEXT_ELEMENTS = {'script', 'style', 'textarea', 'title'}
+
+
+def scanner_version():
+    """Hash of this module's source. A scanner change invalidates every stored page."""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def hash_content(content):
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def tokenize(content, raw=RAW_TEXT_ELEMENTS):
+    """
+    [(kind, name, start, end)] for every tag and comment, in page order. kind
+    is 'open', 'close', 'void' (void element or self-closing tag) or 'comment'
+    (name is then the stripped comment text). The contents of `raw` elements
+    are not parsed: their open tag is followed directly by their close tag, or
+    is the last token if they are never closed. Text is whatever lies between
+    tokens. Shared by repair_tags, depth_profile, region_audit, format_html
+    and tree_diff.
+    """
+    tokens = []
+    pos = 0
+    while True:
+        m = TOKEN_PATTERN.search(content, pos)
+        if not m:
+            break
+        pos = m.end()
+        if m.group(3) is None:
+            tokens.append(('comment', m.group(1).strip(), m.start(), m.end()))
+            continue
+        closing, tag, attrs = m.group(2), m.group(3).lower(), m.group(4)
+        if closing:
+            tokens.append(('close', tag, m.start(), m.end()))
+        elif tag in VOID_ELEMENTS or attrs.rstrip().endswith('/'):
+            tokens.append(('void', tag, m.start(), m.end()))
+        else:
+            tokens.append(('open', tag, m.start(), m.end()))
+            if tag in raw:
+                close = re.compile(rf'</{tag}\s*>', re.IGNORECASE).search(content, pos)
+                if close is None:
+                    break
+                tokens.append(('close', tag, close.start(), close.end()))
+                pos = close.end()
+    return tokens
+
+
+def find_element_spans(content, target_ids=None, markers=None, duplicates=None, raw=None):
+    """
+    Finds the full span (opening tag through matching closing tag) of the first
+    element carrying each id, in a single forward scan of the page. With
+    target_ids=None every id is collected. If a `markers` dict is given, comment
+    spans are added to it as {stripped text: [[start, end], ...]}; a `duplicates`
+    set collects ids seen more than once (only the first is reported).
+    Nesting is tracked per target by counting same-name tags. As in tokenize(),
+    the contents of RAW_TEXT_ELEMENTS are skipped; a `raw` list collects the
+    [start, end] of each such element (end is len(content) if never closed).
+    Returns ({id: (tag_name, start, end)}, {id: error}) for found / unclosed ids.
+    """
+    wanted = None if target_ids is None else set(target_ids)
+    seen = set()
+    spans = {}
+    # tag name -> list of [target_id, start, depth] currently open
+    active = {}
+
+    pos = 0
+    while True:
+        m = TOKEN_PATTERN.search(content, pos)
+        if not m:
+            break
+        pos = m.end()
+        if m.group(3) is None:
+            if markers is not None:
+                markers.setdefault(m.group(1).strip(), []).append([m.start(), m.end()])
+            continue
+        closing, tag_name, attrs = m.group(2), m.group(3).lower(), m.group(4)
+        trackers = active.get(tag_name)
+
+        if closing:
+            if not trackers:
+                continue
+            for tracker in trackers:
+                tracker[2] -= 1
+            done = [t for t in trackers if t[2] == 0]
+            for target_id, start, _ in done:
+                spans[target_id] = (tag_name, start, m.end())
+                trackers.remove([target_id, start, 0])
+            continue
+
+        self_closing = attrs.rstrip().endswith('/') or tag_name in VOID_ELEMENTS
+        if trackers and not self_closing:
+            for tracker in trackers:
+                tracker[2] += 1
+
+        if (wanted is None or wanted) and 'id' in attrs.lower():
+            id_match = ID_ATTR_PATTERN.search(attrs)
+            if id_match:
+                found_id = id_match.group(1) if id_match.group(1) is not None else id_match.group(2)
+                if found_id in seen and duplicates is not None:
+                    duplicates.add(found_id)
+                elif found_id not in seen and (wanted is None or found_id in wanted):
+                    seen.add(found_id)
+                    if wanted is not None:
+                        wanted.discard(found_id)
+                    if self_closing:
+                        spans[found_id] = (tag_name, m.start(), m.end())
+                    else:
+                        active.setdefault(tag_name, []).append([found_id, m.start(), 1])
+
+        if tag_name in RAW_TEXT_ELEMENTS and not self_closing:
+            # Resume at the close tag so it is still counted for trackers
+            close = re.compile(rf'</{tag_name}\s*>', re.IGNORECASE).search(content, pos)
+            if raw is not None:
+                raw.append([m.start(), close.end() if close else len(content)])
+            if close is None:
+                break
+            pos = close.start()
+
+    errors = {}
+    for tag_name, trackers in active.items():
+        for target_id, _, _ in trackers:
+            errors[target_id] = f"unbalanced tags. Could not find closing </{tag_name}> for id='{target_id}'"
+    for target_id in wanted or ():
+        errors[target_id] = "not found"
+    return spans, errors
+
+
+def runs_to_end(content, start, end):
+    """True if the raw-text element at `start` is never closed in `content`."""
+    if end < len(content):
+        return False
+    tag = TOKEN_PATTERN.match(content, start).group(3)
+    return not re.compile(rf'</{tag}\s*>\Z', re.IGNORECASE).search(content, start)
+
+
+def scan_page(content):
+    """Full index entry for a page (one scan)."""
+    markers = {}
+    duplicates = set()
+    raw = []
+    spans, _ = find_element_spans(content, markers=markers, duplicates=duplicates, raw=raw)
+    return {
+        'sha256': hash_content(content),
+        'ids': {id_value: [start, end, tag] for id_value, (tag, start, end) in spans.items()},
+        'markers': markers,
+        'duplicates': sorted(duplicates),
+        'raw': raw,
+    }
+
+
+def marker_key(marker):
+    """Accepts 'Card 4: ...' as well as the literal '<!-- Card 4: ... -->'."""
+    marker = marker.strip()
+    if marker.startswith('<!--') and marker.endswith('-->'):
+        marker = marker[4:-3]
+    return marker.strip()
+
+
+def tracked(filepath):
+    """Only deploy pages are persisted; anything else is scanned on demand."""
+    return os.path.abspath(filepath).startswith(DEPLOY_DIR + os.sep)
+
+
+def page_key(filepath):
+    return os.path.relpath(os.path.abspath(filepath), ROOT_DIR)
+
+
+class SpanIndex:
+    """
+    Maps page -> {sha256, ids, markers}. Pages are only trusted if their content
+    hash matches and the entry was written by the same scanner_version().
+    """
+    def __init__(self, path=SPAN_INDEX_PATH):
+        self.path = path
+        self.version = scanner_version()
+        self.pages = {}
+        self.id_pages = {}
+        self.dirty = False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('scanner') == self.version:
+                self.pages = data.get('pages', {})
+                self.id_pages = data.get('id_pages', {})
+        except (OSError, ValueError):
+            pass
+
+    def page(self, filepath, content):
+        """Index entry for `content` (the current text of `filepath`), rescanning if stale."""
+        key = page_key(filepath)
+        entry = self.pages.get(key)
+        if entry is not None and entry['sha256'] == hash_content(content):
+            return entry
+        entry = scan_page(content)
+        if tracked(filepath):
+            self.pages[key] = entry
+            self.dirty = True
+        return entry
+
+    def record_page_ids(self, filepath, ids):
+        """Stores {id: [[line, tag], ...]} for a page as it is on disk now."""
+        if not tracked(filepath):
+            return
+        st = os.stat(filepath)
+        self.id_pages[page_key(filepath)] = {'stat': [st.st_mtime_ns, st.st_size], 'ids': ids}
+        self.dirty = True
+
+    def id_uses(self, id_value):
+        """
+        [(page, line, tag)] for every recorded use of an id, skipping pages
+        changed (by mtime/size) since they were recorded.
+        """
+        uses = []
+        for key, entry in sorted(self.id_pages.items()):
+            try:
+                st = os.stat(os.path.join(ROOT_DIR, key))
+            except OSError:
+                continue
+            if entry['stat'] == [st.st_mtime_ns, st.st_size]:
+                uses.extend((key, line, tag) for line, tag in entry['ids'].get(id_value, ()))
+        return uses
+
+    def is_current(self, filepath, content):
+        """True if the stored entry was built from exactly this content."""
+        entry = self.pages.get(page_key(filepath))
+        return entry is not None and entry['sha256'] == hash_content(content)
+
+    def locate_id(self, filepath, content, id_value):
+        """(tag, start, end) of the element with this id, or None."""
+        span = self.page(filepath, content)['ids'].get(id_value)
+        return None if span is None else (span[2], span[0], span[1])
+
+    def locate_marker(self, filepath, content, marker):
+        """[(start, end), ...] of every comment with this text, in page order."""
+        spans = self.page(filepath, content)['markers'].get(marker_key(marker), [])
+        return [tuple(span) for span in spans]
+
+    def record_edits(self, filepath, edits, new_content):
+        """
+        Patches the entry of a page after it was rewritten. `edits` are
+        non-overlapping (start, end, new_text) triples in the coordinates of the
+        previous content (the one the entry was built from).
+        """
+        key = page_key(filepath)
+        entry = self.pages.get(key)
+        if entry is None:
+            return
+        edits = sorted(edits)
+        starts = [e[0] for e in edits]
+        ends = [e[1] for e in edits]
+        # cum[k]: total length change caused by the first k edits
+        cum = [0]
+        for start, end, new_text in edits:
+            cum.append(cum[-1] + len(new_text) - (end - start))
+
+        def shift(start, end):
+            """New (start, end) of an untouched span, or None if an edit touched it."""
+            i = bisect.bisect_right(ends, start)
+            if i < len(edits) and starts[i] <= start < ends[i]:
+                return None  # edit overlaps the start of the span
+            j = bisect.bisect_left(starts, end)
+            if j > i and ends[j - 1] >= end:
+                return None  # edit overlaps the end of the span
+            return start + cum[i], end + cum[j]
+
+        # An edit in or on a raw-text element can turn text into tags or back;
+        # only edits that leave it alone or replace it whole are patched here
+        raw = []
+        for start, end in entry['raw']:
+            i = bisect.bisect_right(ends, start)
+            if i == len(edits) or starts[i] >= end:
+                raw.append([start + cum[i], end + cum[i]])
+            elif not (starts[i] <= start and end <= ends[i]):
+                self.pages[key] = scan_page(new_content)
+                self.dirty = True
+                return
+
+        duplicates = set(entry['duplicates'])
+        ids = {}
+        touched = set()
+        for id_value, (start, end, tag) in entry['ids'].items():
+            moved = shift(start, end)
+            if moved is not None:
+                ids[id_value] = [moved[0], moved[1], tag]
+                continue
+            touched.add(id_value)
+            if id_value in duplicates:
+                # A later element with the same id may now be the first one
+                self.pages[key] = scan_page(new_content)
+                self.dirty = True
+                return
+        markers = {}
+        split_marker = False
+        for text, spans in entry['markers'].items():
+            for start, end in spans:
+                # Unlike an element, a comment's text is its key: any edit
+                # inside it counts
+                i = bisect.bisect_right(ends, start)
+                if i == len(edits) or starts[i] >= end:
+                    markers.setdefault(text, []).append([start + cum[i], end + cum[i]])
+                elif not (starts[i] <= start and end <= ends[i]):
+                    # (comments wholly inside an edit are rescanned with its text below)
+                    split_marker = True
+
+        # The inserted text is scanned on its own and merged at its new offset
+        for k, (start, end, new_text) in enumerate(edits):
+            base = start + cum[k]
+            local_markers = {}
+            local_raw = []
+            local_spans, _ = find_element_spans(new_text, markers=local_markers, duplicates=duplicates,
+                                                raw=local_raw)
+            if local_raw and runs_to_end(new_text, *local_raw[-1]):
+                # An unclosed raw-text element swallows the rest of the page
+                self.pages[key] = scan_page(new_content)
+                self.dirty = True
+                return
+            raw.extend([base + s, base + e] for s, e in local_raw)
+            for id_value, (tag, s, e) in local_spans.items():
+                if id_value in ids:
+                    duplicates.add(id_value)
+                if id_value not in ids or ids[id_value][0] > base + s:
+                    ids[id_value] = [base + s, base + e, tag]
+            for text, spans in local_markers.items():
+                markers.setdefault(text, []).extend([base + s, base + e] for s, e in spans)
+
+        # An edit that only covered part of an element (e.g. its opening tag,
+        # for a class change) or of a comment leaves it out of the inserted
+        # text's scan; those are located again in the new page
+        lost = touched.difference(ids)
+        if lost or split_marker:
+            found_markers = {} if split_marker else None
+            found, _ = find_element_spans(new_content, lost, markers=found_markers)
+            for id_value, (tag, start, end) in found.items():
+                ids[id_value] = [start, end, tag]
+            if split_marker:
+                markers = found_markers
+        for spans in markers.values():
+            spans.sort()
+        raw.sort()
+
+        self.pages[key] = {'sha256': hash_content(new_content), 'ids': ids, 'markers': markers,
+                           'duplicates': sorted(duplicates), 'raw': raw}
+        self.dirty = True
+
+    def fork(self, filepath):
+        """
+        In-memory copy of one page's entry for edits that are not on disk yet:
+        lookups and record_edits() go to the copy, which adopt() takes over
+        once the page has been written. A fork is never saved.
+        """
+        staged = SpanIndex.__new__(SpanIndex)
+        staged.path = None
+        staged.version = self.version
+        staged.dirty = False
+        staged.id_pages = {}
+        key = page_key(filepath)
+        staged.pages = {key: self.pages[key]} if key in self.pages else {}
+        return staged
+
+    def adopt(self, staged, filepath, content_hash):
+        """Takes over a fork's entry for a page whose content with this hash is now on disk."""
+        key = page_key(filepath)
+        entry = staged.pages.get(key)
+        if entry is not None and entry['sha256'] == content_hash and tracked(filepath):
+            self.pages[key] = entry
+            self.dirty = True
+
+    def save(self):
+        if not self.dirty or self.path is None:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'scanner': self.version, 'pages': self.pages, 'id_pages': self.id_pages}, f)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Look up element ids and comment markers in the span index.")
+    parser.add_argument("file", help="Page to look up (deploy pages are cached)")
+    parser.add_argument("--id", dest="ids", action="append", default=[], help="Print the span of this id (repeatable)")
+    parser.add_argument("--marker", dest="markers", action="append", default=[],
+                        help="Print the spans of this comment marker (repeatable)")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    try:
+        with open(args.file, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except FileNotFoundError:
+        print(f"Error: File {args.file} not found.")
+        sys.exit(1)
+
+    index = SpanIndex()
+    entry = index.page(args.file, content)
+    index.save()
+
+    missing = False
+    for id_value in args.ids:
+        span = entry['ids'].get(id_value)
+        if span is None:
+            print(f"#{id_value}: not found")
+            missing = True
+        else:
+            line = content.count('\n', 0, span[0]) + 1
+            print(f"#{id_value}: <{span[2]}> chars {span[0]}-{span[1]} (line {line})")
+    for marker in args.markers:
+        spans = entry['markers'].get(marker_key(marker))
+        if not spans:
+            print(f"<!-- {marker_key(marker)} -->: not found")
+            missing = True
+        for start, end in spans or ():
+            print(f"<!-- {marker_key(marker)} -->: chars {start}-{end} (line {content.count(chr(10), 0, start) + 1})")
+    if not args.ids and not args.markers:
+        print(f"{len(entry['ids'])} ids, {sum(len(s) for s in entry['markers'].values())} markers in {args.file}")
+        for id_value, (start, end, tag) in sorted(entry['ids'].items(), key=lambda item: item[1][0]):
+            print(f"  #{id_value:<40} <{tag}> {start}-{end}")
+        for text, spans in sorted(entry['markers'].items(), key=lambda item: item[1][0][0]):
+            print(f"  <!-- {text[:60]} --> x{len(spans)}")
+    sys.exit(1 if missing else 0)
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Structural (DOM-level) diff between two versions of a page.
+
+Both pages are parsed into element trees with one tokenization each (the
+span_index.tokenize(); comments are ignored, text is whitespace-collapsed
+and belongs to its parent element). Every element gets two bottom-up
+(Merkle) hashes:
+
+  hash   tag + attributes + own text + children's hashes (the whole subtree)
+  shape  the same without the element's own attributes
+
+Matching then runs in three linear passes:
+  1. identical subtrees, by hash (whole subtrees are paired at once, so
+     unchanged sections cost O(size) and are never compared again);
+  2. elements carrying the same id and tag;
+  3. under every matched parent, unmatched children of the same tag, by
+     shape, then class, then order.
+
+Unmatched elements are reported as inserted / removed (top-most only, with
+the size of the subtree), matched ones as moved when their parent changed or
+their order among siblings did, re-attributed when attributes differ and as
+text changes when their own text does. Paths read like selectors:
+`html > body > section#pricing > div:nth-of-type(2)`.
+
+Usage:
+  python3 scripts/tree_diff.py v2.130_index.html deploy/index.html
+  python3 scripts/tree_diff.py old.html new.html --limit 50
+"""
+import sys
+import re
+import bisect
+import hashlib
+import argparse
+
+from html_select import parse_attrs
+from span_index import TOKEN_PATTERN, tokenize
+
+WHITESPACE_RUN = re.compile(r'\s+')
+# Identical subtrees smaller than this (in elements) are only paired in pass 3,
+# under matched parents, unless their hash is unique on both sides
+MIN_HASH_MATCH_SIZE = 3
+# Characters of an attribute value shown in the report
+VALUE_PREVIEW = 60
+
+
+class Node:
+    __slots__ = ('tag', 'attrs', 'text', 'children', 'parent', 'order', 'size',
+                 'hash', 'shape', 'match', 'step', 'moved')
+
+    def __init__(self, tag, attrs, parent, order):
+        self.tag = tag
+        self.attrs = attrs
+        self.text = []
+        self.children = []
+        self.parent = parent
+        self.order = order  # pre-order index
+        self.size = 1
+        self.hash = self.shape = None
+        self.match = None
+        self.step = tag
+        self.moved = False
+
+
+def parse_tree(content):
+    """Root node and the pre-order list of all nodes (root first)."""
+    root = Node('#document', {}, None, 0)
+    nodes = [root]
+    stack = [root]
+    cursor = 0
+
+    def add(tag, attr_text):
+        node = Node(tag, parse_attrs(attr_text), stack[-1], len(nodes))
+        stack[-1].children.append(node)
+        nodes.append(node)
+        return node
+
+    for kind, tag, start, end in tokenize(content):
+        stack[-1].text.append(content[cursor:start])
+        cursor = end
+        if kind == 'comment':
+            continue
+        if kind == 'close':
+            for depth in range(len(stack) - 1, 0, -1):
+                if stack[depth].tag == tag:
+                    del stack[depth:]
+                    break
+            continue
+        m = TOKEN_PATTERN.match(content, start)
+        node = add(tag, m.group(4))
+        if kind == 'open':
+            # A raw-text element's contents become its text like any other text
+            stack.append(node)
+    stack[-1].text.append(content[cursor:])
+
+    for node in nodes:
+        node.text = WHITESPACE_RUN.sub(' ', ''.join(node.text)).strip()
+    return root, nodes
+
+
+def digest(*parts):
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part if isinstance(part, bytes) else part.encode('utf-8'))
+        h.update(b'\0')
+    return h.digest()
+
+
+def hash_tree(nodes):
+    """Bottom-up hashes, sizes and selector-style path steps (reverse pre-order visits children first)."""
+    for node in reversed(nodes):
+        children = b''.join(child.hash for child in node.children)
+        attrs = '\x1f'.join(f"{name}={value}" for name, value in sorted(node.attrs.items()))
+        node.shape = digest(node.tag, node.text, children)
+        node.hash = digest(node.tag, attrs, node.text, children)
+        node.size = 1 + sum(child.size for child in node.children)
+
+        totals = {}
+        for child in node.children:
+            totals[child.tag] = totals.get(child.tag, 0) + 1
+        seen = {}
+        for child in node.children:
+            seen[child.tag] = seen.get(child.tag, 0) + 1
+            if child.attrs.get('id'):
+                child.step = f"{child.tag}#{child.attrs['id']}"
+            elif totals[child.tag] > 1:
+                child.step = f"{child.tag}:nth-of-type({seen[child.tag]})"
+
+
+def path(node):
+    steps = []
+    while node.parent is not None:
+        steps.append(node.step)
+        node = node.parent
+    return ' > '.join(reversed(steps)) or '#document'
+
+
+def pair(old, new):
+    old.match, new.match = new, old
+
+
+def pair_subtrees(old, new):
+    """Pairs two identical subtrees node by node (same shape, so pre-order lists line up)."""
+    old_stack, new_stack = [old], [new]
+    while old_stack:
+        o, n = old_stack.pop(), new_stack.pop()
+        pair(o, n)
+        old_stack.extend(o.children)
+        new_stack.extend(n.children)
+
+
+def match_trees(old_nodes, new_nodes):
+    """Runs the three matching passes; returns the number of elements paired by subtree hash."""
+    pair(old_nodes[0], new_nodes[0])
+
+    # 1. Identical subtrees, top-down over the new tree (a paired subtree is skipped as a whole)
+    by_hash = {}
+    for node in old_nodes[1:]:
+        by_hash.setdefault(node.hash, []).append(node)
+    new_counts = {}
+    for node in new_nodes[1:]:
+        new_counts[node.hash] = new_counts.get(node.hash, 0) + 1
+    hashed = 0
+    todo = list(reversed(new_nodes[0].children))
+    while todo:
+        node = todo.pop()
+        candidates = by_hash.get(node.hash)
+        if candidates and node.size < MIN_HASH_MATCH_SIZE and (len(candidates) > 1 or new_counts[node.hash] > 1):
+            candidates = None  # small and repeated: left to pass 3
+        if candidates:
+            # Copies already paired inside another subtree drop out here
+            candidates[:] = [o for o in candidates if o.match is None]
+        if candidates:
+            # Prefer the copy sitting at the same place (same parent tag and step)
+            best = next((o for o in candidates if o.step == node.step and o.parent.tag == node.parent.tag),
+                        candidates[0])
+            candidates.remove(best)
+            pair_subtrees(best, node)
+            hashed += node.size
+            continue
+        todo.extend(reversed(node.children))
+
+    # 2. Same id and tag
+    by_id = {}
+    for node in old_nodes[1:]:
+        if node.match is None and node.attrs.get('id'):
+            by_id.setdefault((node.tag, node.attrs['id']), node)
+    for node in new_nodes[1:]:
+        if node.match is None and node.attrs.get('id'):
+            old = by_id.pop((node.tag, node.attrs['id']), None)
+            if old is not None and old.match is None:
+                pair(old, node)
+
+    # 3. Children of matched parents: same shape, then same class, then in order
+    for node in new_nodes:
+        if node.match is None:
+            continue
+        waiting = [child for child in node.children if child.match is None]
+        if not waiting:
+            continue
+        free = {}
+        for child in node.match.children:
+            if child.match is None:
+                free.setdefault(child.tag, []).append(child)
+        for child in waiting:
+            candidates = free.get(child.tag)
+            if not candidates:
+                continue
+            best = (next((o for o in candidates if o.shape == child.shape), None)
+                    or next((o for o in candidates if child.attrs.get('class')
+                             and o.attrs.get('class') == child.attrs.get('class')), None)
+                    or candidates[0])
+            candidates.remove(best)
+            pair(best, child)
+    return hashed
+
+
+def mark_moves(new_nodes):
+    """Matched elements whose parent changed, or whose order among matched siblings did."""
+    for node in new_nodes[1:]:
+        if node.match is None:
+            continue
+        if node.match.parent.match is not node.parent:
+            node.moved = True
+    for node in new_nodes:
+        kept = [child for child in node.children if child.match is not None and not child.moved]
+        if len(kept) < 2:
+            continue
+        # Longest run of children still in their old relative order; the rest were reordered
+        old_orders = [child.match.order for child in kept]
+        tails, tail_index, links = [], [], []
+        for i, value in enumerate(old_orders):
+            p = bisect.bisect_left(tails, value)
+            links.append(tail_index[p - 1] if p else -1)
+            if p == len(tails):
+                tails.append(value)
+                tail_index.append(i)
+            else:
+                tails[p] = value
+                tail_index[p] = i
+        in_order = set()
+        i = tail_index[-1]
+        while i != -1:
+            in_order.add(i)
+            i = links[i]
+        for i, child in enumerate(kept):
+            if i not in in_order:
+                child.moved = True
+
+
+def preview(value):
+    return value if len(value) <= VALUE_PREVIEW else value[:VALUE_PREVIEW - 3] + '...'
+
+
+def attribute_changes(old_attrs, new_attrs):
+    changes = []
+    for name in sorted(set(old_attrs) | set(new_attrs)):
+        if name not in new_attrs:
+            changes.append(f"-{name}")
+        elif name not in old_attrs:
+            changes.append(f"+{name}=\"{preview(new_attrs[name])}\"")
+        elif old_attrs[name] != new_attrs[name]:
+            changes.append(f"{name}: \"{preview(old_attrs[name])}\" -> \"{preview(new_attrs[name])}\"")
+    return changes
+
+
+def unmatched_size(node):
+    """Elements of a subtree that have no counterpart (children moved into it are not counted)."""
+    count = 0
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if current.match is None:
+            count += 1
+            stack.extend(current.children)
+    return count
+
+
+def diff_trees(old_content, new_content):
+    """([(symbol, kind, path, detail)] in document order, stats dict)."""
+    _, old_nodes = parse_tree(old_content)
+    _, new_nodes = parse_tree(new_content)
+    hash_tree(old_nodes)
+    hash_tree(new_nodes)
+    stats = {'old': len(old_nodes) - 1, 'new': len(new_nodes) - 1}
+    if old_nodes[0].hash == new_nodes[0].hash:
+        stats['hashed'] = stats['new']
+        return [], stats
+    stats['hashed'] = match_trees(old_nodes, new_nodes)
+    mark_moves(new_nodes)
+
+    changes = []
+    for node in new_nodes[1:]:
+        old = node.match
+        if old is None:
+            if node.parent.match is not None:
+                size = unmatched_size(node)
+                size = f"({size} elements)" if size > 1 else ""
+                changes.append((node.order, '+', 'inserted', path(node), size))
+            continue
+        if node.moved:
+            same_parent = old.parent.match is node.parent
+            changes.append((node.order, '>', 'moved', path(node),
+                            "reordered among its siblings" if same_parent else f"from {path(old)}"))
+        if old.attrs != node.attrs:
+            changes.append((node.order, '~', 're-attributed', path(node), '; '.join(attribute_changes(old.attrs, node.attrs))))
+        if old.text != node.text:
+            changes.append((node.order, '~', 'text', path(node), f"\"{preview(old.text)}\" -> \"{preview(node.text)}\""))
+    for node in old_nodes[1:]:
+        if node.match is None and node.parent.match is not None:
+            # Listed where its parent sits in the new page
+            anchor = node.parent.match.order
+            size = unmatched_size(node)
+            changes.append((anchor, '-', 'removed', path(node), f"({size} elements)" if size > 1 else ""))
+    changes.sort(key=lambda change: change[0])
+    return [change[1:] for change in changes], stats
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Structural diff of two HTML pages (inserted / removed / moved / re-attributed elements).")
+    parser.add_argument("old", help="Old version")
+    parser.add_argument("new", help="New version")
+    parser.add_argument("--limit", type=int, default=0, help="Show at most this many changes (0 = all)")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    contents = []
+    for file_path in (args.old, args.new):
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                contents.append(f.read())
+        except FileNotFoundError:
+            print(f"Error: File {file_path} not found.")
+            sys.exit(1)
+
+    changes, stats = diff_trees(*contents)
+    print(f"--- {args.old} ({stats['old']} elements)")
+    print(f"+++ {args.new} ({stats['new']} elements)")
+    if not changes:
+        print("✅ Structurally identical.")
+        sys.exit(0)
+    print(f"{stats['hashed']} elements matched as identical subtrees, {len(changes)} changes")
+    shown = changes if not args.limit else changes[:args.limit]
+    for symbol, kind, where, detail in shown:
+        print(f"{symbol} {kind:<13} {where}" + (f"  {detail}" if detail else ""))
+    if len(shown) < len(changes):
+        print(f"... {len(changes) - len(shown)} more (raise --limit)")
+    sys.exit(1)
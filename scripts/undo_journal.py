@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Append-only undo journal for the editing scripts (replaces full .bak copies).
+
+Every edit appends one JSON line to .undo/journal.jsonl (outside deploy/, so it
+is never uploaded) holding only the reverse delta: for each changed span, where
+it now sits in the page and the text it replaced. Undoing an edit splices those
+old texts back and appends an "undo" record; nothing is ever rewritten.
+
+  {"seq": 12, "time": "...", "tool": "smart_replace", "file": "deploy/index.html",
+   "before": sha256, "after": sha256, "hunks": [[start, new_length, old_text], ...]}
+  {"seq": 13, "time": "...", "undo": 12, "file": "deploy/index.html", ...}
+
+An edit is only undone if the page still hashes to its "after" value, i.e.
+nothing changed it since (undo newer edits first, or pass --force).
+
+Pages are written through write_page(), under the same per-page flock that
+edit_server.py takes for its batches, so writes to a page are serialized
+and an edit computed from text that has since changed on disk is refused.
+
+Usage:
+  python3 scripts/undo_journal.py list [-n 20]
+  python3 scripts/undo_journal.py undo [-n 1] [--file deploy/index.html] [--force]
+"""
+import sys
+import os
+import json
+import time
+import fcntl
+import bisect
+import hashlib
+import argparse
+import contextlib
+
+from line_diff import common_prefix_len, common_suffix_len
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JOURNAL_PATH = os.path.join(ROOT_DIR, ".undo", "journal.jsonl")
+LOCK_DIR = os.path.join(ROOT_DIR, ".cache", "locks")
+# Block size used when reading the journal backwards
+TAIL_BLOCK = 64 * 1024
+
+
+class PageChanged(Exception):
+    pass
+
+
+def hash_text(content):
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+@contextlib.contextmanager
+def page_lock(filepath):
+    """Exclusive per-page flock, held by every tool while it writes the page."""
+    os.makedirs(LOCK_DIR, exist_ok=True)
+    key = hashlib.sha1(os.path.abspath(filepath).encode('utf-8')).hexdigest()
+    with open(os.path.join(LOCK_DIR, key + ".lock"), 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+
+def journal_key(filepath):
+    # Paths such as deploy/index.html work from any directory
+    if not os.path.exists(filepath) and os.path.exists(os.path.join(ROOT_DIR, filepath)):
+        filepath = os.path.join(ROOT_DIR, filepath)
+    return os.path.relpath(os.path.abspath(filepath), ROOT_DIR)
+
+
+def reverse_hunks(old_content, edits):
+    """
+    Reverse delta of `edits` ([(start, end, new_text)] in old coordinates,
+    non-overlapping): [[start in new content, len(new_text), replaced old text]].
+    """
+    hunks = []
+    shift = 0
+    for start, end, new_text in sorted(edits, key=lambda edit: edit[0]):
+        hunks.append([start + shift, len(new_text), old_content[start:end]])
+        shift += len(new_text) - (end - start)
+    return hunks
+
+
+def piece_length(piece):
+    return len(piece) if isinstance(piece, str) else piece[1] - piece[0]
+
+
+def compose_edits(old_length, batches):
+    """
+    Folds edit lists applied one after another (each [(start, end, new_text)]
+    against the result of the previous one) into one non-overlapping list
+    against the original content. The content is tracked as pieces: (start,
+    end) spans of the original or inserted strings; every gap between kept
+    original spans becomes one edit.
+    """
+    pieces = [(0, old_length)] if old_length else []
+    for edits in batches:
+        offsets = []
+        pos = 0
+        for piece in pieces:
+            offsets.append(pos)
+            pos += piece_length(piece)
+
+        def cut(a, b):
+            out = []
+            i = max(bisect.bisect_right(offsets, a) - 1, 0)
+            while i < len(pieces) and offsets[i] < b:
+                piece, lo, hi = pieces[i], max(a - offsets[i], 0), min(b - offsets[i], piece_length(pieces[i]))
+                if lo < hi:
+                    out.append(piece[lo:hi] if isinstance(piece, str) else (piece[0] + lo, piece[0] + hi))
+                i += 1
+            return out
+
+        new_pieces = []
+        cursor = 0
+        for start, end, new_text in sorted(edits, key=lambda edit: edit[0]):
+            new_pieces.extend(cut(cursor, start))
+            if new_text:
+                new_pieces.append(new_text)
+            cursor = end
+        new_pieces.extend(cut(cursor, pos))
+        pieces = new_pieces
+
+    composed = []
+    kept_end = 0
+    inserted = []
+    for piece in pieces + [(old_length, old_length)]:
+        if isinstance(piece, str):
+            inserted.append(piece)
+            continue
+        if piece[0] != kept_end or inserted:
+            composed.append((kept_end, piece[0], ''.join(inserted)))
+        kept_end = piece[1]
+        inserted = []
+    return composed
+
+
+def single_edit(old_content, new_content):
+    """The one span that differs between two versions (common prefix / suffix trimmed)."""
+    prefix = common_prefix_len(old_content, new_content)
+    suffix = common_suffix_len(old_content, new_content, min(len(old_content), len(new_content)) - prefix)
+    return [(prefix, len(old_content) - suffix, new_content[prefix:len(new_content) - suffix])]
+
+
+def iter_entries_reversed(path=JOURNAL_PATH):
+    """Journal entries newest first, reading the file backwards block by block."""
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return
+    with f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        carry = b''
+        while pos > 0:
+            size = min(TAIL_BLOCK, pos)
+            pos -= size
+            f.seek(pos)
+            lines = (f.read(size) + carry).split(b'\n')
+            carry = lines.pop(0)
+            for line in reversed(lines):
+                if line.strip():
+                    yield json.loads(line)
+        if carry.strip():
+            yield json.loads(carry)
+
+
+def last_seq(path=JOURNAL_PATH):
+    for entry in iter_entries_reversed(path):
+        return entry['seq']
+    return 0
+
+
+def append_entry(entry, path=JOURNAL_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        # Serialises concurrent writers so sequence numbers stay unique
+        fcntl.flock(f, fcntl.LOCK_EX)
+        entry = dict(seq=last_seq(path) + 1, time=time.strftime('%Y-%m-%dT%H:%M:%S'), **entry)
+        f.write(json.dumps(entry) + "\n")
+    return entry
+
+
+def record_edit(filepath, old_content, new_content, edits=None, tool=None, path=JOURNAL_PATH):
+    """
+    Journals one write of `filepath`. `edits` are the [(start, end, new_text)]
+    the tool applied (old coordinates); without them the changed span is derived
+    from the two versions. Returns the entry (None if nothing changed).
+    """
+    if old_content == new_content:
+        return None
+    if edits is None:
+        edits = single_edit(old_content, new_content)
+    return append_entry({
+        'tool': tool or os.path.basename(sys.argv[0]),
+        'file': journal_key(filepath),
+        'before': hash_text(old_content),
+        'after': hash_text(new_content),
+        'hunks': reverse_hunks(old_content, edits),
+    }, path)
+
+
+def write_page(filepath, old_content, new_content, edits=None, tool=None, path=JOURNAL_PATH):
+    """
+    Writes and journals one edit of `filepath` under page_lock(). The file must
+    still hold `old_content` (the text the edit was computed from); otherwise
+    PageChanged is raised and nothing is written. Returns the journal entry.
+    """
+    with page_lock(filepath):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            if f.read() != old_content:
+                raise PageChanged(f"{journal_key(filepath)} changed on disk since it was read; nothing written")
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+        return record_edit(filepath, old_content, new_content, edits, tool, path=path)
+
+
+def pending_edits(limit, filepath=None, path=JOURNAL_PATH):
+    """The newest `limit` edits that have not been undone yet (optionally for one page)."""
+    undone = set()
+    found = []
+    for entry in iter_entries_reversed(path):
+        if 'undo' in entry:
+            undone.add(entry['undo'])
+            continue
+        if entry['seq'] in undone or (filepath is not None and entry['file'] != journal_key(filepath)):
+            continue
+        found.append(entry)
+        if len(found) == limit:
+            break
+    return found
+
+
+def undo_entry(entry, force=False, path=JOURNAL_PATH):
+    """Restores the page of one journal entry. Returns an error message or None."""
+    page_path = os.path.join(ROOT_DIR, entry['file'])
+    with page_lock(page_path):
+        try:
+            with open(page_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except FileNotFoundError:
+            return f"{entry['file']} not found"
+        if hash_text(content) != entry['after'] and not force:
+            return (f"{entry['file']} changed since edit #{entry['seq']} ({entry['tool']}); "
+                    "undo newer edits first or use --force")
+
+        pieces = []
+        cursor = 0
+        for start, new_length, old_text in entry['hunks']:
+            pieces.append(content[cursor:start])
+            pieces.append(old_text)
+            cursor = start + new_length
+        pieces.append(content[cursor:])
+        restored = ''.join(pieces)
+
+        with open(page_path, 'w', encoding='utf-8') as f:
+            f.write(restored)
+        append_entry({
+            'undo': entry['seq'],
+            'tool': 'undo_journal',
+            'file': entry['file'],
+            'before': hash_text(content),
+            'after': hash_text(restored),
+        }, path)
+    if hash_text(restored) != entry['before']:
+        return f"restored {entry['file']}, but it differs from the version before edit #{entry['seq']} (forced undo)"
+    return None
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="List or undo journaled page edits.")
+    parser.add_argument("--journal", default=JOURNAL_PATH, help="Journal file")
+    sub = parser.add_subparsers(dest="command", required=True)
+    ls = sub.add_parser("list", help="Show the newest edits that can be undone")
+    ls.add_argument("-n", type=int, default=20, help="Number of edits to show")
+    ls.add_argument("--file", help="Only edits of this page")
+    undo = sub.add_parser("undo", help="Undo the newest edits, newest first")
+    undo.add_argument("-n", type=int, default=1, help="Number of edits to undo")
+    undo.add_argument("--file", help="Only edits of this page")
+    undo.add_argument("--force", action="store_true", help="Undo even if the page changed since the edit")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    entries = pending_edits(args.n, args.file, args.journal)
+
+    if args.command == "list":
+        if not entries:
+            print("Nothing to undo.")
+        for entry in entries:
+            size = sum(len(old_text) for _, _, old_text in entry['hunks'])
+            print(f"#{entry['seq']:<5} {entry['time']}  {entry['tool']:<18} {entry['file']}  "
+                  f"({len(entry['hunks'])} hunk{'s' if len(entry['hunks']) != 1 else ''}, {size} chars)")
+        sys.exit(0)
+
+    if not entries:
+        print("Nothing to undo.")
+        sys.exit(1)
+    for entry in entries:
+        error = undo_entry(entry, args.force, args.journal)
+        if error and not args.force:
+            print(f"Error: {error}")
+            sys.exit(1)
+        print(f"↩️  Undid #{entry['seq']} ({entry['tool']}) on {entry['file']}" + (f"  ⚠️  {error}" if error else ""))
+    sys.exit(0)
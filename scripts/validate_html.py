@@ -2,8 +2,24 @@
 import sys
 import os
 import re
+import io
+import time
+import ctypes
+import ctypes.util
+import select
+import struct
+import argparse
+import hashlib
+import json
+from functools import partial
+from collections import Counter
+from urllib.parse import unquote
+from concurrent.futures import ProcessPoolExecutor
 from html.parser import HTMLParser
 
+from span_index import SPAN_INDEX_PATH, SpanIndex
+from line_diff import common_prefix_len, common_suffix_len
+
 # Standard HTML5 void elements (no closing tag required/allowed)
 VOID_ELEMENTS = {
     'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param', 'source', 'track', 'wbr'
@@ -17,32 +33,144 @@ SVG_ELEMENTS = {
     'radialGradient', 'stop', 'filter', 'feGaussianBlur', 'feComposite', 'feColorMatrix', 'mask', 'use', 'animate', 'animateTransform'
 }
 
+# Persistent result cache (outside deploy/ so wrangler never uploads it)
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_PATH = os.path.join(ROOT_DIR, ".cache", "validate_html.json")
+CACHE_MAX_ENTRIES = 256
+DEPLOY_DIR = os.path.join(ROOT_DIR, "deploy")
+# Parser snapshots for --incremental (one file per page)
+SNAPSHOT_DIR = os.path.join(ROOT_DIR, ".cache", "validate_snapshots")
+# Minimum distance in characters between two recorded checkpoints
+CHECKPOINT_INTERVAL = 4096
+
+# Streaming mode (--stream): characters handed to the parser per feed() call
+STREAM_CHUNK_SIZE = 64 * 1024
+# A '<' followed by one of these starts a tag, end tag, comment/doctype or PI
+TAG_START_RE = re.compile(r'<[a-zA-Z/!?]')
+
+
+_validator_version = None
+
+
+def validator_version():
+    """
+    Hash of this script's source. Any rule change invalidates the whole cache.
+    Computed once per process (the result cache and every snapshot load/save use it).
+    """
+    global _validator_version
+    if _validator_version is None:
+        with open(os.path.abspath(__file__), 'rb') as f:
+            _validator_version = hashlib.sha256(f.read()).hexdigest()
+    return _validator_version
+
+
+class ResultCache:
+    """
+    Maps cache_key() (page path, sha256 of its content, mode, rule set) -> check_file() result.
+    Entries are only trusted if they were written by the same validator_version().
+    """
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        self.version = validator_version()
+        self.entries = {}
+        self.dirty = False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('validator') == self.version:
+                self.entries = data.get('entries', {})
+        except (OSError, ValueError):
+            pass
+
+    def get(self, content_hash):
+        return self.entries.get(content_hash)
+
+    def put(self, content_hash, result):
+        # Re-insert so the newest entries survive trimming (dicts keep insertion order)
+        self.entries.pop(content_hash, None)
+        self.entries[content_hash] = result
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        while len(self.entries) > CACHE_MAX_ENTRIES:
+            del self.entries[next(iter(self.entries))]
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'validator': self.version, 'entries': self.entries}, f)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+
+def hash_file(filepath):
+    h = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+# Elements whose text content is code, where "-->" is legitimate
+CODE_ELEMENTS = {'script', 'style'}
+
 class ValidationParser(HTMLParser):
-    def __init__(self, filename):
+    """
+    Tracks the open-element stack and reports structural errors itself.
+    Content checks are Rule plugins (see RULES below) that subscribe to parser
+    events, so every enabled rule runs in this single tokenization pass.
+    """
+    def __init__(self, filename, rules=None):
         super().__init__()
         self.filename = filename
         self.stack = []
         self.errors = []
         self.warnings = []
+        self.rules = build_rules(DEFAULT_RULES) if rules is None else rules
+        # Per-event subscriber lists: only rules overriding a hook get called for it
+        self._on_starttag = subscribers(self.rules, 'on_starttag')
+        self._on_endtag = subscribers(self.rules, 'on_endtag')
+        self._on_startendtag = subscribers(self.rules, 'on_startendtag')
+        self._on_data = subscribers(self.rules, 'on_data')
+        self._on_comment = subscribers(self.rules, 'on_comment')
+        self._on_finish = subscribers(self.rules, 'on_finish')
+        # O(1) bookkeeping kept in sync with self.stack (see _push/_pop):
+        # tag -> number of open elements, tag -> stack indices, open script/style count
+        self.open_counts = {}
+        self.positions = {}
+        self.code_depth = 0
+
+    def _push(self, tag, line):
+        self.positions.setdefault(tag, []).append(len(self.stack))
+        self.open_counts[tag] = self.open_counts.get(tag, 0) + 1
+        if tag in CODE_ELEMENTS:
+            self.code_depth += 1
+        self.stack.append((tag, line))
+
+    def _pop(self):
+        tag, line = self.stack.pop()
+        self.positions[tag].pop()
+        self.open_counts[tag] -= 1
+        if tag in CODE_ELEMENTS:
+            self.code_depth -= 1
+        return tag, line
     
     def handle_starttag(self, tag, attrs):
-        # Shotgun Logic Check (No Inline Scripts)
-        if tag == 'script':
-            attr_dict = dict(attrs)
-            has_src = 'src' in attr_dict
-            script_type = attr_dict.get('type', '')
-            
-            # Whitelisted types that can be inline
-            allowed_types = ['importmap', 'application/ld+json']
-            
-            if not has_src and script_type not in allowed_types:
-                self.errors.append(f"Line {self.getpos()[0]}: Forbidden Inline Script detected. All logic must be in external .js files (Shotgun Rule). Allowed inline types: {allowed_types}")
+        # Rules see the tag before it is pushed (the stack holds its ancestors)
+        for hook in self._on_starttag:
+            hook(self, tag, attrs)
 
         # Normal <tag>
         if tag not in VOID_ELEMENTS:
-            self.stack.append((tag, self.getpos()[0]))
+            self._push(tag, self.getpos()[0])
 
     def handle_endtag(self, tag):
+        self._close(tag)
+        for hook in self._on_endtag:
+            hook(self, tag)
+
+    def _close(self, tag):
         # Closing </tag>
         if tag in VOID_ELEMENTS:
             # Technically invalid HTML to close void tags, but browsers ignore it.
@@ -55,18 +183,14 @@ class ValidationParser(HTMLParser):
         last_tag, last_line = self.stack[-1]
 
         if last_tag == tag:
-            self.stack.pop()
+            self._pop()
         else:
             # Mismatch found
             # Check if this tag closes a parent up the stack (recovering from missing child close)
             # e.g. <div><p></div> -> p is unclosed, div closes.
-            found_index = -1
-            for i in range(len(self.stack) - 1, -1, -1):
-                if self.stack[i][0] == tag:
-                    found_index = i
-                    break
-            
-            if found_index != -1:
+            # The innermost open <tag> is the last recorded position for it (no stack walk).
+            if self.open_counts.get(tag, 0) > 0:
+                found_index = self.positions[tag][-1]
                 # We found the matching tag up the stack.
                 # Everything between found_index and end is unclosed.
                 unclosed = self.stack[found_index+1:]
@@ -77,41 +201,524 @@ class ValidationParser(HTMLParser):
                 if real_errors:
                     self.errors.append(f"Line {self.getpos()[0]}: Mismatched </{tag}>. Unclosed elements: {real_errors}")
                 
-                # Pop back to this tag
+                # Pop back to this tag (amortized O(1): every element is popped at most once)
                 while len(self.stack) > found_index:
-                    self.stack.pop()
+                    self._pop()
             else:
                 self.errors.append(f"Line {self.getpos()[0]}: Unexpected closing tag </{tag}>. Expected </{last_tag}>")
 
     def handle_startendtag(self, tag, attrs):
         # Self closing <tag /> matches
-        pass
+        for hook in self._on_startendtag:
+            hook(self, tag, attrs)
 
     def handle_data(self, data):
-        # Logic to check for corruption in text nodes
-        line, col = self.getpos()
-        
+        for hook in self._on_data:
+            hook(self, data)
+
+    def handle_comment(self, data):
+        for hook in self._on_comment:
+            hook(self, data)
+
+    def close(self):
+        super().close()
+        for hook in self._on_finish:
+            hook(self)
+
+    def error(self, message):
+        self.errors.append(f"Line {self.getpos()[0]}: {message}")
+
+    def warn(self, message):
+        self.warnings.append(f"Line {self.getpos()[0]}: {message}")
+
+
+# ----------------------------------------
+# Rule plugins
+# ----------------------------------------
+# A rule is a class with any of the hooks below. Register it with @register_rule
+# and enable it with --rule NAME (or list it in DEFAULT_RULES). Extra rules can
+# live in their own file and be loaded with --plugin path/to/rules.py.
+# Hooks get the parser, so they can read parser.stack / open_counts / code_depth
+# and report through parser.error() / parser.warn().
+
+RULES = {}
+
+
+def register_rule(cls):
+    RULES[cls.name] = cls
+    return cls
+
+
+class Rule:
+    name = None
+    description = ""
+    # True if the rule keeps no state between events (beyond what the parser
+    # stack holds); only such rules can be resumed by --incremental
+    stateless = False
+
+    def on_starttag(self, parser, tag, attrs): pass
+    def on_endtag(self, parser, tag): pass
+    def on_startendtag(self, parser, tag, attrs): pass
+    def on_data(self, parser, data): pass
+    def on_comment(self, parser, data): pass
+    def on_finish(self, parser): pass
+
+    @classmethod
+    def cache_signature(cls):
+        """Extra cache-key input for rules whose result depends on more than the page bytes."""
+        return ''
+
+
+def subscribers(rules, hook):
+    return [getattr(r, hook) for r in rules if getattr(type(r), hook) is not getattr(Rule, hook)]
+
+
+@register_rule
+class InlineScriptRule(Rule):
+    name = 'inline-script'
+    description = "No inline <script> logic (Shotgun Rule)"
+    stateless = True
+    # Whitelisted types that can be inline
+    allowed_types = ['importmap', 'application/ld+json']
+
+    def on_starttag(self, parser, tag, attrs):
+        # Shotgun Logic Check (No Inline Scripts)
+        if tag == 'script':
+            attr_dict = dict(attrs)
+            has_src = 'src' in attr_dict
+            script_type = attr_dict.get('type', '')
+            
+            if not has_src and script_type not in self.allowed_types:
+                parser.error(f"Forbidden Inline Script detected. All logic must be in external .js files (Shotgun Rule). Allowed inline types: {self.allowed_types}")
+
+
+@register_rule
+class DanglingCommentRule(Rule):
+    name = 'dangling-comment'
+    description = "Warn on '-->' in text outside script/style"
+    stateless = True
+
+    def on_data(self, parser, data):
         # 1. Check for dangling template artifacts
         if "-->" in data:
             # Ignore if inside script or style (comments)
-            in_code_block = False
-            for t, l in self.stack:
-                if t in ['script', 'style']:
-                    in_code_block = True
-                    break
-            
-            if not in_code_block:
+            if not parser.code_depth:
                 # Even in HTML text, --> is suspicious if not inside a <!-- --> which Parser handles separately
                 # parser.handle_comment handles actual comments. matching text data "-->" means it wasn't parsed as a comment end.
-                self.warnings.append(f"Line {line}: Suspicious text '-->' found. usage of arrow or broken comment?")
+                parser.warn("Suspicious text '-->' found. usage of arrow or broken comment?")
+
 
+@register_rule
+class ConflictMarkerRule(Rule):
+    name = 'conflict-marker'
+    description = "Git conflict markers in text"
+    stateless = True
+
+    def on_data(self, parser, data):
         if "<<<<<<< HEAD" in data or "=======" in data and len(data.strip()) == 7:
-             self.errors.append(f"Line {line}: Git conflict markers detected")
+             parser.error("Git conflict markers detected")
 
 
-def validate_file(filepath):
-    print(f"checking {os.path.basename(filepath)}...", end=" ", flush=True)
-    
+@register_rule
+class DivBalanceRule(Rule):
+    """Single-pass div "water level": where it first goes negative, and what is left open at the end."""
+    name = 'div-balance'
+    description = "Raw <div> open/close count: first negative level and final imbalance"
+
+    def __init__(self):
+        self.level = 0
+        self.went_negative = False
+
+    def on_starttag(self, parser, tag, attrs):
+        if tag == 'div':
+            self.level += 1
+
+    def on_endtag(self, parser, tag):
+        if tag == 'div':
+            self.level -= 1
+            if self.level < 0 and not self.went_negative:
+                self.went_negative = True
+                parser.error("Div level went negative (extra </div>)")
+
+    def on_finish(self, parser):
+        if self.level > 0:
+            parser.error(f"Div balance: {self.level} <div> never closed")
+
+
+@register_rule
+class CardBalanceRule(Rule):
+    """
+    Single-pass replacement for the backward marker scans of the old
+    fix_div_count.py: every card must close exactly the divs it opens, so the
+    net <div> delta between two consecutive card markers has to be zero.
+    The last region runs to the end of the page; it must close its own divs plus
+    the wrappers that were open at the first marker.
+    scripts/repair_tags.py computes the fix.
+    """
+    name = 'card-balance'
+    description = "Net <div> delta between consecutive <!-- Card ... --> markers must be 0"
+    marker_re = re.compile(r'^\s*Card\b')
+
+    def __init__(self):
+        self.level = 0
+        self.first_level = None  # level at the first marker
+        self.region = None  # (marker text, line, level at marker)
+
+    def on_starttag(self, parser, tag, attrs):
+        if tag == 'div':
+            self.level += 1
+
+    def on_endtag(self, parser, tag):
+        if tag == 'div':
+            self.level -= 1
+
+    def on_comment(self, parser, data):
+        if not self.marker_re.match(data):
+            return
+        if self.region is not None:
+            self.check_region(parser, self.level - self.region[2])
+        else:
+            self.first_level = self.level
+        self.region = (data.strip(), parser.getpos()[0], self.level)
+
+    def on_finish(self, parser):
+        if self.region is not None:
+            # Imbalance of the earlier regions is already reported, so it is
+            # not counted against the last one
+            self.check_region(parser, self.level - (self.region[2] - self.first_level), " to end of page")
+
+    def check_region(self, parser, delta, extent=""):
+        if delta:
+            marker, line, _ = self.region
+            kind = "unclosed <div>" if delta > 0 else "extra </div>"
+            parser.warn(f"Region '{marker}' (from line {line}){extent} has {abs(delta)} {kind}")
+
+
+@register_rule
+class DuplicateIdRule(Rule):
+    """
+    Flags ids used more than once on a page, with the line of the first use:
+    safe_replace_html.py edits the first match. Every use is kept as
+    {id: [[line, tag], ...]} in the result ('ids'), which --id-index stores in
+    the span index (span_index.py) as the cross-page id index.
+    """
+    name = 'duplicate-id'
+    description = "Index id attributes and flag ids used more than once on a page"
+
+    def __init__(self):
+        self.ids = {}
+
+    def on_starttag(self, parser, tag, attrs):
+        for key, value in attrs:
+            if key == 'id' and value:
+                line = parser.getpos()[0]
+                seen = self.ids.setdefault(value, [])
+                if seen:
+                    first_line, first_tag = seen[0]
+                    parser.error(f"Duplicate id=\"{value}\" on <{tag}> (first used on line {first_line} by <{first_tag}>)")
+                seen.append([line, tag])
+
+    def on_startendtag(self, parser, tag, attrs):
+        self.on_starttag(parser, tag, attrs)
+
+
+_asset_index = None
+
+
+def asset_index():
+    """
+    Every file and directory under deploy/ as posix paths relative to deploy/.
+    Built once per process and shared by all pages (AssetRefRule).
+    """
+    global _asset_index
+    if _asset_index is None:
+        files, dirs = set(), {''}
+        for dirpath, dirnames, filenames in os.walk(DEPLOY_DIR):
+            rel = os.path.relpath(dirpath, DEPLOY_DIR).replace(os.sep, '/')
+            rel = '' if rel == '.' else rel + '/'
+            dirs.update(rel + d for d in dirnames)
+            files.update(rel + f for f in filenames)
+        _asset_index = (files, dirs)
+    return _asset_index
+
+
+@register_rule
+class AssetRefRule(Rule):
+    """
+    Resolves src / href / srcset / poster attributes and importmap entries
+    against asset_index(). Extension-less paths are page routes (the worker
+    falls back to index.html for those) and are not checked.
+    Cache-busters on /assets/ refs must match the page's <meta name="version">,
+    or, without one, the version most refs on the page use.
+    """
+    name = 'asset-refs'
+    description = "Local src/href/srcset/importmap targets must exist in deploy/; ?v= must be current"
+    url_attrs = {'src', 'href', 'poster'}
+    skip_prefixes = ('#', '//', 'mailto:', 'tel:', 'data:', 'javascript:', 'blob:')
+    version_re = re.compile(r'(?:^|&)v=([^&]*)')
+
+    def __init__(self):
+        self.files, self.dirs = asset_index()
+        self.page_dir = None
+        self.meta_version = None
+        self.versions = []  # (line, url, version)
+        self.missing = set()  # report each missing target once per page
+        self.importmap_line = None
+        self.importmap_text = []
+
+    def _page_dir(self, parser):
+        if self.page_dir is None:
+            page = os.path.abspath(parser.filename)
+            rel = os.path.relpath(os.path.dirname(page), DEPLOY_DIR).replace(os.sep, '/')
+            self.page_dir = '' if rel == '.' else rel
+        return self.page_dir
+
+    def check(self, parser, url, line, prefix=False):
+        url = url.strip()
+        if not url or url.startswith(self.skip_prefixes) or '://' in url or '{' in url or '${' in url:
+            return
+        path, _, query = url.split('#', 1)[0].partition('?')
+        path = unquote(path)
+        if not path:
+            return
+        if not prefix and ('.' not in path.rsplit('/', 1)[-1] or path.endswith('/')):
+            return  # route, not a file
+
+        if path.startswith('/'):
+            target = os.path.normpath(path.lstrip('/'))
+        else:
+            target = os.path.normpath(os.path.join(self._page_dir(parser), path))
+        target = '' if target == '.' else target.replace(os.sep, '/')
+
+        if prefix:
+            if target not in self.dirs:
+                parser.errors.append(f"Line {line}: Missing asset directory '{url}' (deploy/{target}/)")
+            return
+        if target not in self.files:
+            if target in self.missing:
+                return
+            self.missing.add(target)
+            parser.errors.append(f"Line {line}: Missing asset '{url}' (deploy/{target})")
+            return
+
+        match = self.version_re.search(query)
+        if match and target.startswith('assets/'):
+            self.versions.append((line, url, match.group(1)))
+
+    def on_starttag(self, parser, tag, attrs):
+        line = parser.getpos()[0]
+        attr_dict = dict(attrs)
+        if tag == 'meta' and attr_dict.get('name') == 'version':
+            self.meta_version = (attr_dict.get('content') or '').lstrip('v')
+        if tag == 'script' and attr_dict.get('type') == 'importmap':
+            self.importmap_line = line
+            self.importmap_text = []
+        for key, value in attrs:
+            if value is None:
+                continue
+            if key in self.url_attrs:
+                self.check(parser, value, line)
+            elif key == 'srcset':
+                for candidate in value.split(','):
+                    if candidate.strip():
+                        self.check(parser, candidate.split()[0], line)
+
+    def on_startendtag(self, parser, tag, attrs):
+        self.on_starttag(parser, tag, attrs)
+
+    def on_data(self, parser, data):
+        if self.importmap_line is not None:
+            self.importmap_text.append(data)
+
+    def on_endtag(self, parser, tag):
+        if tag != 'script' or self.importmap_line is None:
+            return
+        line, self.importmap_line = self.importmap_line, None
+        try:
+            importmap = json.loads(''.join(self.importmap_text))
+        except ValueError as e:
+            parser.errors.append(f"Line {line}: Invalid importmap JSON ({e})")
+            return
+        targets = list(importmap.get('imports', {}).values())
+        for scope in importmap.get('scopes', {}).values():
+            targets.extend(scope.values())
+        for url in targets:
+            self.check(parser, url, line, prefix=url.endswith('/'))
+
+    def on_finish(self, parser):
+        if not self.versions:
+            return
+        expected = self.meta_version or Counter(v for _, _, v in self.versions).most_common(1)[0][0]
+        for line, url, version in self.versions:
+            if version != expected:
+                parser.warnings.append(f"Line {line}: Stale cache-buster '{url}' (expected ?v={expected})")
+
+    @classmethod
+    def cache_signature(cls):
+        files, dirs = asset_index()
+        return hashlib.sha256('\n'.join(sorted(files)).encode()).hexdigest()[:16]
+
+
+DEFAULT_RULES = ('inline-script', 'dangling-comment', 'conflict-marker')
+_loaded_plugins = set()
+
+
+def load_plugin(path):
+    """Executes a rules file once; its @register_rule classes land in RULES."""
+    path = os.path.abspath(path)
+    if path in _loaded_plugins:
+        return
+    namespace = {'__name__': 'validate_html_plugin', '__file__': path}
+    # Plugins import from this module; make sure they get this instance of it
+    sys.modules.setdefault('validate_html', sys.modules[__name__])
+    with open(path, 'r', encoding='utf-8') as f:
+        exec(compile(f.read(), path, 'exec'), namespace)
+    _loaded_plugins.add(path)
+
+
+def build_rules(names, plugins=()):
+    for path in plugins:
+        load_plugin(path)
+    unknown = [n for n in names if n not in RULES]
+    if unknown:
+        raise ValueError(f"Unknown rule(s): {', '.join(unknown)}. Known: {', '.join(sorted(RULES))}")
+    return [RULES[n]() for n in names]
+
+
+def last_tag_start(text):
+    """Offset of the last '<' in text that starts a tag or comment (0 if none after the first character)."""
+    pos = len(text)
+    while True:
+        pos = text.rfind('<', 0, pos)
+        if pos <= 0:
+            return 0
+        if TAG_START_RE.match(text, pos):
+            return pos
+
+
+def iter_stream_chunks(stream, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Yields pieces of a text stream of about chunk_size, each cut just before
+    the last '<' that starts a tag. HTMLParser emits pending text as soon as a
+    feed() ends, so cutting mid-text would split text nodes (and a '-->' or
+    conflict marker with them); a full read also ends every text run at the
+    next '<', so cutting there keeps the data events the same. A piece with no
+    such '<' is carried over into the next read rather than fed early.
+    """
+    carry = ''
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            break
+        carry += block
+        cut = last_tag_start(carry)
+        if cut == 0:
+            continue
+        yield carry[:cut]
+        carry = carry[cut:]
+    if carry:
+        yield carry
+
+
+class ProfilingParser(ValidationParser):
+    """ValidationParser that also counts handler events and tracks peak stack depth (--profile)."""
+    def __init__(self, filename, rules=None):
+        super().__init__(filename, rules)
+        self.events = {'starttag': 0, 'endtag': 0, 'startendtag': 0, 'data': 0, 'comment': 0}
+        self.peak_depth = 0
+
+    def _push(self, tag, line):
+        super()._push(tag, line)
+        if len(self.stack) > self.peak_depth:
+            self.peak_depth = len(self.stack)
+
+    def handle_starttag(self, tag, attrs):
+        self.events['starttag'] += 1
+        super().handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        self.events['endtag'] += 1
+        super().handle_endtag(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.events['startendtag'] += 1
+        super().handle_startendtag(tag, attrs)
+
+    def handle_data(self, data):
+        self.events['data'] += 1
+        super().handle_data(data)
+
+    def handle_comment(self, data):
+        self.events['comment'] += 1
+        super().handle_comment(data)
+
+
+def run_parser(filename, chunks, profile=False, rules=DEFAULT_RULES, plugins=()):
+    """
+    Feeds every chunk to a fresh parser and builds the result dict.
+    With profile=True the result also carries a 'profile' entry with wall time,
+    throughput, per-handler event counts and peak stack depth.
+    """
+    parser_cls = ProfilingParser if profile else ValidationParser
+    parser = parser_cls(filename, build_rules(rules, plugins))
+    nbytes = 0
+    started = time.perf_counter()
+    try:
+        for chunk in chunks:
+            if profile:
+                nbytes += len(chunk.encode('utf-8'))
+            parser.feed(chunk)
+        parser.close()
+    except Exception as e:
+        return {'errors': [], 'warnings': [], 'critical': str(e)}
+    elapsed = time.perf_counter() - started
+
+    result = {'errors': parser.errors, 'warnings': parser.warnings, 'critical': None}
+    for rule in parser.rules:
+        if isinstance(rule, DuplicateIdRule):
+            # The cross-page id index (--id-index) comes from this same pass
+            result['ids'] = rule.ids
+    if profile:
+        result['profile'] = {
+            'parse_seconds': round(elapsed, 6),
+            'bytes': nbytes,
+            'bytes_per_second': round(nbytes / elapsed) if elapsed > 0 else None,
+            'events': parser.events,
+            'peak_stack_depth': parser.peak_depth,
+        }
+    return result
+
+
+def check_stream(stream, filename, profile=False, rules=DEFAULT_RULES, plugins=()):
+    """
+    Streaming variant of check_file(): feeds the parser chunk by chunk so memory
+    stays flat regardless of page size. HTMLParser tracks line numbers across
+    feed() calls, so reported lines match a full read.
+    The whole-document regex pre-check is skipped here (it never flags anything).
+    """
+    return run_parser(filename, iter_stream_chunks(stream), profile, rules, plugins)
+
+
+def open_stdin():
+    return io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8')
+
+
+def check_file(filepath, stream=False, profile=False, rules=DEFAULT_RULES, plugins=()):
+    """
+    Parses a single file and returns its result without printing anything.
+    Kept free of side effects so it can run inside a worker process (--jobs).
+    With stream=True (always for '-', i.e. stdin) the page is fed in chunks.
+    Result: {'errors': [...], 'warnings': [...], 'critical': str or None}
+    plus 'profile' when profile=True.
+    `rules` are RULES names; `plugins` are rule files to load first.
+    """
+    if filepath == '-':
+        return check_stream(open_stdin(), '<stdin>', profile, rules, plugins)
+
+    if stream:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return check_stream(f, filepath, profile, rules, plugins)
+
     with open(filepath, 'r', encoding='utf-8') as f:
         content = f.read()
 
@@ -124,25 +731,43 @@ def validate_file(filepath):
         # But for '-->2xl' style corruption, it's very specific.
         pass 
 
-    parser = ValidationParser(filepath)
-    try:
-        parser.feed(content)
-        parser.close()
-    except Exception as e:
+    return run_parser(filepath, [content], profile, rules, plugins)
+
+
+def result_record(filepath, result):
+    """One JSON-serializable record per file for --format json."""
+    record = {
+        'file': filepath,
+        'ok': result['critical'] is None and not result['errors'],
+        'errors': result['errors'],
+        'warnings': result['warnings'],
+        'critical': result['critical'],
+    }
+    if 'profile' in result:
+        record.update(result['profile'])
+    return record
+
+
+def report_result(filepath, result):
+    """Prints a check_file() result in the standard CLI format. Returns pass/fail."""
+    name = 'stdin' if filepath == '-' else os.path.basename(filepath)
+    print(f"checking {name}...", end=" ", flush=True)
+
+    if result['critical'] is not None:
         print("❌ CRITICAL")
-        print(f"   Parser Exception: {e}")
+        print(f"   Parser Exception: {result['critical']}")
         return False
 
-    if parser.errors:
+    if result['errors']:
         print("❌ FAILED")
-        for e in parser.errors:
+        for e in result['errors']:
             print(f"   - {e}")
         return False
     
-    if parser.warnings:
+    if result['warnings']:
         # Don't fail on warnings but show them
         print("⚠️  WARNINGS")
-        for w in parser.warnings:
+        for w in result['warnings']:
             print(f"   - {w}")
         return True # Return true logic for warnings? User wants to STOP breakage. 
         # For now, pass.
@@ -150,23 +775,558 @@ def validate_file(filepath):
     print("✅ OK")
     return True
 
+
+def validate_file(filepath):
+    return report_result(filepath, check_file(filepath))
+
+
+def index_key(filepath):
+    """Stable index key for a page: path relative to the repo root."""
+    return os.path.relpath(os.path.abspath(filepath), ROOT_DIR)
+
+
+def record_id_index(files, results):
+    """
+    Stores the ids each page's validation pass collected (duplicate-id rule)
+    in the span index's cross-page id index. Returns {page: {id: uses}}.
+    """
+    index = SpanIndex()
+    pages = {}
+    for f, result in zip(files, results):
+        if f != '-' and 'ids' in result:
+            index.record_page_ids(f, result['ids'])
+            pages[index_key(f)] = result['ids']
+    index.save()
+    return pages
+
+
+def rules_signature(rules, plugins):
+    """Cache-key component for the enabled rule set (plugin files are hashed by content)."""
+    build_rules((), plugins)
+    extra = [RULES[n].cache_signature() for n in rules]
+    return hashlib.sha256(repr((tuple(rules), [hash_file(p) for p in plugins], extra)).encode()).hexdigest()[:16]
+
+
+def cache_key(filepath, stream, signature):
+    """
+    Page path + content hash + mode + rule set. The path is part of the key
+    because rules such as asset-refs resolve relative URLs against the page's
+    directory, so identical bytes at two paths can give different results.
+    """
+    return f"{index_key(filepath)}:{hash_file(filepath)}{':stream' if stream else ''}:{signature}"
+
+
+def check_files(files, jobs=1, cache=None, stream=False, profile=False, rules=DEFAULT_RULES, plugins=(),
+                incremental=False):
+    """
+    Runs check_file() over every file. With jobs > 1 the pages are parsed in a
+    process pool; results always come back in the order of `files`.
+    If a ResultCache is given, pages whose cache_key() is cached skip parsing.
+    stdin ('-') is never cached and always read in this process.
+    Profiling runs should pass cache=None so every page is actually timed.
+    With incremental=True pages go through check_file_incremental() instead
+    (its snapshots already short-circuit unchanged pages, so pass cache=None).
+    """
+    results = [None] * len(files)
+    pending = [i for i, f in enumerate(files) if f != '-']
+    hashes = {}
+
+    if cache is not None:
+        # Streamed results are cached separately from full-read results
+        signature = rules_signature(rules, plugins)
+        misses = []
+        for i in pending:
+            hashes[i] = cache_key(files[i], stream, signature)
+            cached = cache.get(hashes[i])
+            if cached is not None:
+                results[i] = cached
+            else:
+                misses.append(i)
+        pending = misses
+
+    if incremental:
+        check = partial(incremental_result, rules=rules)
+    else:
+        check = partial(check_file, stream=stream, profile=profile, rules=rules, plugins=plugins)
+    todo = [files[i] for i in pending]
+    if jobs <= 1 or len(todo) <= 1:
+        fresh = [check(f) for f in todo]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(todo))) as pool:
+            fresh = list(pool.map(check, todo))
+
+    for i, result in zip(pending, fresh):
+        results[i] = result
+        if cache is not None:
+            cache.put(hashes[i], result)
+
+    for i, f in enumerate(files):
+        if f == '-':
+            results[i] = check_file(f, stream=stream, profile=profile, rules=rules, plugins=plugins)
+
+    return results
+
+
+# ----------------------------------------
+# Incremental validation (--incremental)
+# ----------------------------------------
+# A full parse records checkpoints: offsets where the parser has consumed all
+# input and is outside script/style, with the open-element stack and the number
+# of errors/warnings emitted so far. The page text is stored with them, so the
+# edited region of a new version is found with a common prefix/suffix compare.
+# Parsing resumes at the last checkpoint before the edit and stops at the first
+# checkpoint after it whose stack matches the cached one; the cached messages
+# from there on are reused with their line numbers shifted.
+
+LINE_RE = re.compile(r'^Line (\d+):')
+STACK_ENTRY_RE = re.compile(r"\('([^']*)', (\d+)\)")
+
+
+def snapshot_path(filepath):
+    key = index_key(filepath).replace(os.sep, '__').replace('/', '__')
+    return os.path.join(SNAPSHOT_DIR, key + '.json')
+
+
+def load_snapshot(filepath):
+    try:
+        with open(snapshot_path(filepath), 'r', encoding='utf-8') as f:
+            snap = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if snap.get('validator') != validator_version():
+        return None
+    return snap
+
+
+def save_snapshot(filepath, snap):
+    path = snapshot_path(filepath)
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    snap['validator'] = validator_version()
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(snap, f)
+    os.replace(tmp_path, path)
+
+
+def parser_idle(parser):
+    """True when everything fed so far has been turned into events (safe checkpoint)."""
+    return not parser.rawdata and parser.cdata_elem is None
+
+
+def restore_parser(filename, rules, checkpoint, errors, warnings):
+    offset, line, col, stack, n_err, n_warn = checkpoint
+    parser = ValidationParser(filename, build_rules(rules))
+    for tag, tag_line in stack:
+        parser._push(tag, tag_line)
+    parser.errors = list(errors[:n_err])
+    parser.warnings = list(warnings[:n_warn])
+    parser.lineno, parser.offset = line, col
+    return parser
+
+
+def feed_checkpointed(parser, content, start, stops, checkpoints, on_stop=None):
+    """
+    Feeds content[start:] in chunks cut before a tag start (as --stream does),
+    appending a checkpoint at idle points at least CHECKPOINT_INTERVAL apart.
+    `stops` are extra offsets (earlier checkpoints, so also just before a tag)
+    where a chunk is forced to end; on_stop(offset) is called there and may
+    return True to stop feeding. Returns the offset reached.
+    """
+    pos = start
+    last_cp = checkpoints[-1][0] if checkpoints else 0
+    for stop in sorted(set(stops)) + [len(content)]:
+        if stop <= pos:
+            continue
+        for chunk in iter_stream_chunks(io.StringIO(content[pos:stop]), CHECKPOINT_INTERVAL):
+            parser.feed(chunk)
+            pos += len(chunk)
+            if pos - last_cp >= CHECKPOINT_INTERVAL and parser_idle(parser):
+                line, col = parser.getpos()
+                checkpoints.append([pos, line, col, [list(t) for t in parser.stack],
+                                    len(parser.errors), len(parser.warnings)])
+                last_cp = pos
+        if on_stop is not None and stop < len(content) and on_stop(pos):
+            return pos
+    return pos
+
+
+def full_snapshot_parse(filepath, content, rules):
+    parser = ValidationParser(filepath, build_rules(rules))
+    checkpoints = [[0, 1, 0, [], 0, 0]]
+    feed_checkpointed(parser, content, 0, [], checkpoints)
+    parser.close()
+    return parser, checkpoints
+
+
+def check_file_incremental(filepath, rules=DEFAULT_RULES):
+    """
+    Validates a page by re-parsing only the region that changed since the last
+    snapshot. Returns (result, reparsed character count). Falls back to a full
+    parse when there is no usable snapshot or a rule is not stateless.
+    Produces the same errors and warnings as check_file().
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    snap = load_snapshot(filepath)
+    resumable = all(RULES[n].stateless for n in rules)
+    if snap is not None and (snap['rules'] != list(rules) or not resumable):
+        snap = None
+
+    try:
+        if snap is not None and snap['content'] == content:
+            return {'errors': snap['errors'], 'warnings': snap['warnings'], 'critical': None}, 0
+        if snap is None:
+            parser, checkpoints = full_snapshot_parse(filepath, content, rules)
+            errors, warnings = parser.errors, parser.warnings
+            reparsed = len(content)
+        else:
+            errors, warnings, checkpoints, reparsed = resume_parse(filepath, content, snap, rules)
+    except Exception as e:
+        return {'errors': [], 'warnings': [], 'critical': str(e)}, len(content)
+
+    if resumable:
+        save_snapshot(filepath, {'rules': list(rules), 'content': content, 'checkpoints': checkpoints,
+                                 'errors': errors, 'warnings': warnings})
+    return {'errors': errors, 'warnings': warnings, 'critical': None}, reparsed
+
+
+def resume_parse(filepath, content, snap, rules):
+    old = snap['content']
+    old_cps = snap['checkpoints']
+
+    # Edited region: old[p:len(old)-s] became content[p:len(content)-s]
+    p = common_prefix_len(old, content)
+    s = common_suffix_len(old, content, min(len(old), len(content)) - p)
+    char_delta = len(content) - len(old)
+    line_delta = content.count('\n') - old.count('\n')
+    old_suffix_start = len(old) - s
+
+    resume = max((cp for cp in old_cps if cp[0] <= p), key=lambda cp: cp[0])
+    parser = restore_parser(filepath, rules, resume, snap['errors'], snap['warnings'])
+    checkpoints = [cp for cp in old_cps if cp[0] <= resume[0]]
+
+    # Convergence candidates: old checkpoints inside the unchanged suffix
+    candidates = {cp[0] + char_delta: cp for cp in old_cps if cp[0] >= old_suffix_start and cp[0] > 0}
+    converged = {}
+
+    def on_stop(pos):
+        cp = candidates.get(pos)
+        if cp is None or not parser_idle(parser):
+            return False
+        mapping = stack_mapping(cp[3], parser.stack, cp[1], line_delta)
+        if mapping is None:
+            return False
+        converged['cp'] = cp
+        converged['mapping'] = mapping
+        return True
+
+    pos = feed_checkpointed(parser, content, resume[0], candidates.keys(), checkpoints, on_stop)
+    reparsed = pos - resume[0]
+
+    if 'cp' not in converged:
+        parser.close()
+        return parser.errors, parser.warnings, checkpoints, reparsed
+
+    cp, mapping = converged['cp'], converged['mapping']
+    shift = lambda line: line + line_delta
+    errors = parser.errors + [shift_message(m, mapping, shift) for m in snap['errors'][cp[4]:]]
+    warnings = parser.warnings + [shift_message(m, mapping, shift) for m in snap['warnings'][cp[5]:]]
+
+    # Carry the remaining old checkpoints over, moved into the new coordinates
+    err_delta = len(parser.errors) - cp[4]
+    warn_delta = len(parser.warnings) - cp[5]
+    if checkpoints[-1][0] >= pos:
+        checkpoints.pop()
+    for old_cp in old_cps:
+        if old_cp[0] < cp[0]:
+            continue
+        new_offset = old_cp[0] + char_delta
+        col = new_offset - (content.rfind('\n', 0, new_offset) + 1)
+        stack = [[t, mapping.get((t, l), shift(l))] for t, l in old_cp[3]]
+        checkpoints.append([new_offset, shift(old_cp[1]), col, stack,
+                            old_cp[4] + err_delta, old_cp[5] + warn_delta])
+    return errors, warnings, checkpoints, reparsed
+
+
+def incremental_result(filepath, rules=DEFAULT_RULES):
+    """check_file_incremental() with the re-parse size folded into the result."""
+    result, reparsed = check_file_incremental(filepath, rules)
+    result['incremental'] = {'reparsed': reparsed, 'size': os.path.getsize(filepath)}
+    return result
+
+
+def stack_mapping(old_stack, new_stack, cp_line, line_delta):
+    """
+    Maps old (tag, line) stack entries to the new ones if both stacks hold the
+    same tags. Entries the cached messages may mention later must map
+    unambiguously, and anything opened on/after the checkpoint line must map to
+    a plain line shift. Returns None if the states have not converged.
+    """
+    if len(old_stack) != len(new_stack):
+        return None
+    mapping = {}
+    for (old_tag, old_line), (new_tag, new_line) in zip(old_stack, new_stack):
+        if old_tag != new_tag:
+            return None
+        key = (old_tag, old_line)
+        if mapping.setdefault(key, new_line) != new_line:
+            return None
+        if old_line >= cp_line and new_line != old_line + line_delta:
+            return None
+    return mapping
+
+
+def shift_message(message, mapping, shift):
+    """Rewrites the line numbers of a cached message into the new page's coordinates."""
+    message = LINE_RE.sub(lambda m: f"Line {shift(int(m.group(1)))}:", message, count=1)
+    return STACK_ENTRY_RE.sub(
+        lambda m: f"('{m.group(1)}', {mapping.get((m.group(1), int(m.group(2))), shift(int(m.group(2))))})",
+        message)
+
+
+# --watch: inotify masks (linux/inotify.h) and the polling fallback interval
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0x00000800
+INOTIFY_EVENT = struct.Struct('iIII')
+WATCH_POLL_INTERVAL = 0.05
+# Editors emit bursts of events per save; wait this long for the burst to settle
+WATCH_SETTLE = 0.02
+
+
+class InotifyWatcher:
+    """Directory watcher using the raw inotify syscalls through ctypes (Linux only)."""
+    def __init__(self, directory):
+        libc_name = ctypes.util.find_library('c')
+        if not libc_name:
+            raise OSError("libc not found")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError("inotify not available")
+        self.fd = libc.inotify_init1(IN_NONBLOCK)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_MODIFY
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self.directory = directory
+
+    def wait(self, timeout=None):
+        """Blocks until something changes; returns the set of touched file names."""
+        names = set()
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        while ready:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buf):
+                _, _, _, name_len = INOTIFY_EVENT.unpack_from(buf, offset)
+                offset += INOTIFY_EVENT.size
+                name = buf[offset:offset + name_len].rstrip(b'\0')
+                offset += name_len
+                if name:
+                    names.add(os.fsdecode(name))
+            ready, _, _ = select.select([self.fd], [], [], WATCH_SETTLE)
+        return names
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Fallback watcher: compares (mtime, size) of every file in the directory."""
+    def __init__(self, directory):
+        self.directory = directory
+        self.seen = self._snapshot()
+
+    def _snapshot(self):
+        snap = {}
+        for entry in os.scandir(self.directory):
+            if entry.is_file():
+                st = entry.stat()
+                snap[entry.name] = (st.st_mtime_ns, st.st_size)
+        return snap
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = self._snapshot()
+            names = {n for n, sig in current.items() if self.seen.get(n) != sig}
+            self.seen = current
+            if names:
+                return names
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            time.sleep(WATCH_POLL_INTERVAL)
+
+    def close(self):
+        pass
+
+
+def make_watcher(directory):
+    try:
+        return InotifyWatcher(directory), "inotify"
+    except (OSError, AttributeError):
+        return PollingWatcher(directory), "polling"
+
+
+def watch(deploy_dir, stream=False, rules=DEFAULT_RULES, plugins=(), incremental=False):
+    """
+    Validates every page once, then re-validates only the pages that change.
+    Results for unchanged pages stay in memory (keyed by content hash), so a
+    save that does not change the bytes costs one hash and no parse.
+    """
+    watcher, backend = make_watcher(deploy_dir)
+    state = {}  # path -> (content hash, result)
+
+    def revalidate(path):
+        try:
+            content_hash = hash_file(path)
+        except FileNotFoundError:
+            state.pop(path, None)
+            return
+        known = state.get(path)
+        if known and known[0] == content_hash:
+            return
+        started = time.perf_counter()
+        if incremental:
+            result = incremental_result(path, rules)
+        else:
+            result = check_file(path, stream=stream, rules=rules, plugins=plugins)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        state[path] = (content_hash, result)
+        print(f"[{time.strftime('%H:%M:%S')}] ", end="")
+        report_result(path, result)
+        print(f"   ({elapsed_ms:.0f} ms)", flush=True)
+
+    print(f"👀  Watching {deploy_dir}/*.html ({backend}). Ctrl+C to stop.")
+    for name in sorted(os.listdir(deploy_dir)):
+        if name.endswith(".html"):
+            revalidate(os.path.join(deploy_dir, name))
+
+    try:
+        while True:
+            for name in sorted(watcher.wait()):
+                if name.endswith(".html"):
+                    revalidate(os.path.join(deploy_dir, name))
+    except KeyboardInterrupt:
+        print("\n👋  Watch stopped.")
+    finally:
+        watcher.close()
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Validate markup structure of deploy HTML pages.")
+    parser.add_argument("files", nargs="*", help="HTML files to check, '-' for stdin (default: deploy/*.html)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Validate pages in N worker processes (0 = one per CPU core)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore and do not update the content-hash result cache")
+    parser.add_argument("--stream", action="store_true",
+                        help=f"Feed pages to the parser in {STREAM_CHUNK_SIZE // 1024} KB chunks instead of reading them whole")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and re-validate deploy/*.html pages as they are saved")
+    parser.add_argument("--profile", action="store_true",
+                        help="Measure parse time, throughput, handler events and peak stack depth (disables the cache)")
+    parser.add_argument("--format", choices=["text", "json"], default="text",
+                        help="Output format; json prints one record per file (JSON Lines)")
+    parser.add_argument("--rule", action="append", default=[], metavar="NAME",
+                        help=f"Enable an extra rule on top of the defaults ({', '.join(DEFAULT_RULES)})")
+    parser.add_argument("--only", action="append", default=[], metavar="NAME",
+                        help="Run only these rules instead of the defaults")
+    parser.add_argument("--plugin", action="append", default=[], metavar="FILE",
+                        help="Load a Python file that registers extra rules with @register_rule")
+    parser.add_argument("--list-rules", action="store_true", help="List available rules and exit")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Re-parse only the region changed since the last snapshot (default rules only)")
+    parser.add_argument("--id-index", action="store_true",
+                        help=f"Flag duplicate ids and record every id's page, line and tag in {os.path.relpath(SPAN_INDEX_PATH, ROOT_DIR)}")
+    return parser.parse_intermixed_args(argv)
+
+
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
+    args = parse_args(sys.argv[1:])
+
+    plugins = tuple(args.plugin)
+    rules = tuple(args.only) if args.only else DEFAULT_RULES + tuple(r for r in args.rule if r not in DEFAULT_RULES)
+    if args.id_index and 'duplicate-id' not in rules:
+        rules += ('duplicate-id',)
+    try:
+        build_rules(rules, plugins)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(2)
+
+    if args.list_rules:
+        for name, cls in sorted(RULES.items()):
+            flag = "*" if name in DEFAULT_RULES else " "
+            print(f" {flag} {name:<18} {cls.description}")
+        sys.exit(0)
+
+    incremental = args.incremental and not plugins and all(RULES[n].stateless for n in rules)
+    if args.incremental and not incremental:
+        print("⚠️  --incremental needs built-in stateless rules only; running a full parse.")
+
+    if args.watch:
+        watch("deploy", stream=args.stream, rules=rules, plugins=plugins, incremental=incremental)
+        sys.exit(0)
+
+    if args.files:
         # Check specific files
-        files = sys.argv[1:]
+        files = args.files
     else:
         # Check all deploy html
         deploy_dir = "deploy"
-        files = [os.path.join(deploy_dir, f) for f in os.listdir(deploy_dir) if f.endswith(".html")]
+        files = sorted(os.path.join(deploy_dir, f) for f in os.listdir(deploy_dir) if f.endswith(".html"))
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    cache = None if args.no_cache or args.profile or incremental else ResultCache()
+    results = check_files(files, jobs, cache, stream=args.stream, profile=args.profile,
+                          rules=rules, plugins=plugins, incremental=incremental)
+    if cache is not None:
+        cache.save()
+
+    id_index = record_id_index(files, results) if args.id_index else None
+
+    if args.format == "json":
+        failure = False
+        for f, result in zip(files, results):
+            record = result_record(f, result)
+            failure = failure or not record['ok']
+            print(json.dumps(record))
+        sys.exit(1 if failure else 0)
 
     failure = False
     print("----------------------------------------")
     print("🔍  Running Markup Validation           ")
     print("----------------------------------------")
     
-    for f in files:
-        if not validate_file(f):
+    for f, result in zip(files, results):
+        if not report_result(f, result):
             failure = True
+        if 'profile' in result:
+            prof = result['profile']
+            print(f"   ⏱  {prof['parse_seconds'] * 1000:.1f} ms, {prof['bytes'] / 1024:.0f} KB, "
+                  f"peak depth {prof['peak_stack_depth']}, events {prof['events']}")
+        if 'incremental' in result:
+            inc = result['incremental']
+            print(f"   ♻️  re-parsed {inc['reparsed'] / 1024:.1f} KB of {inc['size'] / 1024:.0f} KB")
+
+    if id_index is not None:
+        pages_by_id = {}
+        for page, ids in id_index.items():
+            for id_value in ids:
+                pages_by_id.setdefault(id_value, []).append(page)
+        shared = sum(1 for pages in pages_by_id.values() if len(pages) > 1)
+        print(f"🗂  Indexed {len(pages_by_id)} ids across {len(id_index)} pages "
+              f"({shared} shared between pages) -> {os.path.relpath(SPAN_INDEX_PATH, ROOT_DIR)}")
 
     print("----------------------------------------")
     if failure:
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The tools are plain scripts that import each other by module name
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
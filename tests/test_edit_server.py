@@ -0,0 +1,32 @@
+"""edit_server.py: a failed flush answers every waiter, even if the page is gone."""
+import functools
+import threading
+import time
+
+import edit_server
+import undo_journal
+
+
+def test_flush_of_deleted_page_answers_waiters(tmp_path, monkeypatch):
+    monkeypatch.setattr(undo_journal, "LOCK_DIR", str(tmp_path / "locks"))
+    monkeypatch.setattr(undo_journal, "record_edit",
+                        functools.partial(undo_journal.record_edit, path=str(tmp_path / "journal.jsonl")))
+    monkeypatch.setattr(edit_server, "FLUSH_DELAY", 60)
+    page_path = tmp_path / "page.html"
+    page_path.write_text('<div class="a">x</div>\n', encoding="utf-8")
+
+    server = edit_server.EditServer()
+    replies = []
+    worker = threading.Thread(target=lambda: replies.append(
+        server.submit(str(page_path), [{"op": "replace", "old": 'class="a"', "new": 'class="b"'}])))
+    worker.start()
+    page = server.page(str(page_path))
+    while not page.waiters:
+        time.sleep(0.01)
+
+    page_path.unlink()
+    server.flush_page(page)
+    worker.join(5)
+    assert not worker.is_alive()
+    assert replies[0]["ok"] is False and "batch not written" in replies[0]["error"]
+    assert str(page_path) not in server.pages
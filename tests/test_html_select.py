@@ -0,0 +1,31 @@
+"""Selector matching over span_index.tokenize()."""
+import pytest
+
+from html_select import SelectorError, compile_selector, select
+
+
+def test_raw_text_contents_are_not_elements():
+    content = ('<div class="card"><script>const t = `<div class="card">`;</script></div>'
+               '<textarea><p class="card"></p></textarea>')
+    matched, counts = select(content, ".card")
+    assert [(e.tag, e.start, e.end) for e in matched] == [("div", 0, content.index("<textarea>"))]
+    assert counts == [1]
+    matched, _ = select(content, "div script")
+    assert content[matched[0].start:matched[0].end] == '<script>const t = `<div class="card">`;</script>'
+
+
+def test_selector_list_splits_outside_quotes_and_brackets():
+    content = '<p data-x="a,b">1</p><p title="x y">2</p><p>3</p><i>4</i>'
+    compiled = compile_selector('[data-x="a,b"], p[title="x y"], p:nth-of-type( 2n + 1 ),i')
+    assert [[c.text for c in compounds] for compounds in compiled] == [
+        ['[data-x="a,b"]'], ['p[title="x y"]'], ['p:nth-of-type( 2n + 1 )'], ['i']]
+    matched, counts = select(content, compiled)
+    assert [content[e.start:e.end] for e in matched] == [
+        '<p data-x="a,b">1</p>', '<p title="x y">2</p>', '<p>3</p>', '<i>4</i>']
+    assert counts == [1, 1, 2, 1]
+
+
+@pytest.mark.parametrize("selector", ["a,", ", a", "a,,b", ""])
+def test_empty_selector_in_list_is_an_error(selector):
+    with pytest.raises(SelectorError):
+        compile_selector(selector)
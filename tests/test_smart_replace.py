@@ -0,0 +1,68 @@
+"""smart_replace.py: exact and --loose matching end up splicing the same text."""
+import functools
+import sys
+
+import pytest
+
+import smart_replace
+import undo_journal
+
+PAGE = """<section>
+    <div class="card">
+        <h3>Title</h3>
+    </div>
+</section>
+"""
+OLD = """    <div class="card">
+        <h3>Title</h3>
+    </div>
+"""
+NEW = """    <div class="card active">
+        <h3>Title</h3>
+    </div>
+"""
+
+
+@pytest.fixture
+def run(tmp_path, monkeypatch):
+    """Runs smart_replace.py on a fresh copy of a page (PAGE by default); returns it afterwards."""
+    monkeypatch.setattr(undo_journal, "LOCK_DIR", str(tmp_path / "locks"))
+    monkeypatch.setattr(undo_journal, "write_page",
+                        functools.partial(undo_journal.write_page, path=str(tmp_path / "journal.jsonl")))
+
+    def run(*flags, page=PAGE, old=OLD, new=NEW):
+        path = tmp_path / "page.html"
+        path.write_text(page, encoding="utf-8")
+        (tmp_path / "old.txt").write_text(old, encoding="utf-8")
+        (tmp_path / "new.txt").write_text(new, encoding="utf-8")
+        monkeypatch.setattr(sys, "argv", ["smart_replace.py", str(path), str(tmp_path / "old.txt"),
+                                          str(tmp_path / "new.txt"), *flags])
+        smart_replace.main()
+        return path.read_text(encoding="utf-8")
+    return run
+
+
+def test_exact_clip_under_loose_matches_exact_result(run):
+    expected = PAGE.replace(OLD, NEW)
+    assert run() == expected
+    assert run("--loose") == expected
+
+
+def test_loose_clip_with_other_indentation_takes_new_text_indentation(run):
+    old = '<div class="card">\n  <h3>Title</h3>\n</div>'
+    result = run("--loose", old=old, new='<div class="card active"><h3>Title</h3></div>')
+    assert result == '<section>\n    <div class="card active"><h3>Title</h3></div>\n</section>\n'
+
+
+def test_loose_clip_after_blank_lines_keeps_the_blank_lines(run):
+    page = "<section>\n\n\n    <p>x</p>\n</section>\n"
+    old = "\n\n  <p>x</p>\n"
+    new = "\n\n    <p>y</p>\n"
+    assert run("--loose", page=page, old=old, new=new) == page.replace("<p>x</p>", "<p>y</p>")
+    assert run("--loose", page=page, old="\n\n    <p>x</p>\n", new=new) == run(page=page, old="\n\n    <p>x</p>\n", new=new)
+
+
+def test_loose_trailing_newline_leaves_next_line_indentation():
+    content = "<p>x</p>\n\n    <p>z</p>\n"
+    start, end = smart_replace.find_loose(content, ["<p>x</p>\n\n"])[0][0]
+    assert content[start:end] == "<p>x</p>\n\n"
@@ -0,0 +1,121 @@
+"""record_edits() must leave the same entry a full rescan of the new page builds."""
+import os
+import random
+
+import pytest
+
+import span_index
+from span_index import DEPLOY_DIR, SpanIndex, find_element_spans, page_key, scan_page
+
+PAGE = os.path.join(DEPLOY_DIR, "tech-demo.html")
+
+
+@pytest.fixture
+def index(tmp_path):
+    if not os.path.exists(PAGE):
+        pytest.skip("tech-demo.html not in deploy/")
+    with open(PAGE, "r", encoding="utf-8") as f:
+        content = f.read()
+    index = SpanIndex(str(tmp_path / "span_index.json"))
+    index.page(PAGE, content)
+    return index, content
+
+
+def apply(content, edits):
+    for start, end, new_text in sorted(edits, reverse=True):
+        content = content[:start] + new_text + content[end:]
+    return content
+
+
+def assert_matches_rescan(index, content):
+    entry = index.pages[page_key(PAGE)]
+    expected = scan_page(content)
+    assert entry["ids"] == expected["ids"]
+    assert entry["markers"] == expected["markers"]
+    assert entry["duplicates"] == expected["duplicates"]
+    assert entry["raw"] == expected["raw"]
+
+
+def test_opening_tag_edit_keeps_id(index):
+    index, content = index
+    start, _, _ = index.pages[page_key(PAGE)]["ids"]["tech-demo-card-track"]
+    tag_end = content.index(">", start)
+    tag = content[start:tag_end]
+    new_tag = tag.replace('class="', 'class="foo ', 1)
+    updated = apply(content, [(start, tag_end, new_tag)])
+    index.record_edits(PAGE, [(start, tag_end, new_tag)], updated)
+    assert_matches_rescan(index, updated)
+
+
+def test_partial_comment_edit_moves_marker(index):
+    index, content = index
+    start = content.index("<!-- Card") + len("<!-- ")
+    edits = [(start, start + len("Card"), "Panel")]
+    updated = apply(content, edits)
+    index.record_edits(PAGE, edits, updated)
+    assert_matches_rescan(index, updated)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_edits_match_rescan(index, seed):
+    index, content = index
+    rng = random.Random(seed)
+    # Whole elements, opening tags and attribute values, as the editing tools produce
+    spans = list(index.pages[page_key(PAGE)]["ids"].values())
+    edits = []
+    for start, end, tag in rng.sample(spans, 3):
+        kind = rng.randrange(3)
+        if kind == 0:
+            edits.append((start, end, f'<{tag} id="new-{seed}-{start}"></{tag}>'))
+        elif kind == 1:
+            tag_end = content.index(">", start)
+            edits.append((start, tag_end, content[start:tag_end] + ' data-x="1"'))
+        else:
+            edits.append((end, end, "\n<!-- note -->\n"))
+    # Nested samples overlap; keep the outermost edit of each group
+    edits.sort(key=lambda e: (e[0], -e[1]))
+    edits = [e for k, e in enumerate(edits) if all(e[0] >= prev[1] for prev in edits[:k])]
+    updated = apply(content, edits)
+    index.record_edits(PAGE, edits, updated)
+    assert_matches_rescan(index, updated)
+
+
+def test_raw_text_contents_are_not_indexed():
+    content = '<script id="s">const t = `<div id="fake">`;</script><div id="real"></div>'
+    spans, errors = find_element_spans(content)
+    assert set(spans) == {"s", "real"}
+    assert spans["s"] == ("script", 0, content.index("</script>") + len("</script>"))
+    assert not errors
+
+
+@pytest.mark.parametrize("anchor, new_text", [
+    ("<style>", '<div id="inside"></div>'),
+    ("<style>", "</style><div id='out'></div><style>"),
+    ("<body", "<script>"),
+    ("<body", "<textarea><p id='kept-as-text'></p></textarea>"),
+])
+def test_edits_in_or_into_raw_text_match_rescan(index, anchor, new_text):
+    index, content = index
+    start = content.index(anchor) + (len(anchor) if anchor == "<style>" else 0)
+    edits = [(start, start, new_text)]
+    updated = apply(content, edits)
+    index.record_edits(PAGE, edits, updated)
+    assert_matches_rescan(index, updated)
+
+
+def test_id_uses_skip_pages_changed_since_recorded(tmp_path, monkeypatch):
+    monkeypatch.setattr(span_index, "ROOT_DIR", str(tmp_path))
+    monkeypatch.setattr(span_index, "DEPLOY_DIR", str(tmp_path / "deploy"))
+    (tmp_path / "deploy").mkdir()
+    one, two = tmp_path / "deploy" / "one.html", tmp_path / "deploy" / "two.html"
+    one.write_text('<div id="nav"></div>', encoding="utf-8")
+    two.write_text('<nav id="nav"></nav>', encoding="utf-8")
+    index = SpanIndex(str(tmp_path / "span_index.json"))
+    index.record_page_ids(str(one), {"nav": [[1, "div"]]})
+    index.record_page_ids(str(two), {"nav": [[1, "nav"]]})
+    index.save()
+
+    reloaded = SpanIndex(str(tmp_path / "span_index.json"))
+    assert reloaded.id_uses("nav") == [("deploy/one.html", 1, "div"), ("deploy/two.html", 1, "nav")]
+    two.write_text('<nav id="menu"></nav>\n', encoding="utf-8")
+    assert reloaded.id_uses("nav") == [("deploy/one.html", 1, "div")]
@@ -0,0 +1,55 @@
+"""compose_edits(): folded edit lists must reproduce the sequential result."""
+import random
+
+import pytest
+
+import undo_journal
+from undo_journal import compose_edits, record_edit, reverse_hunks
+
+
+def apply(content, edits):
+    for start, end, new_text in sorted(edits, reverse=True):
+        content = content[:start] + new_text + content[end:]
+    return content
+
+
+def random_edits(rng, content):
+    points = sorted(rng.randrange(len(content) + 1) for _ in range(2 * rng.randrange(4)))
+    edits = [(points[i], points[i + 1], rng.choice(["", "X", "YZ", "\n"])) for i in range(0, len(points), 2)]
+    # Two insertions at one offset have no defined order; real edit lists never contain them
+    return [e for k, e in enumerate(edits) if k == 0 or not (e[0] == e[1] == edits[k - 1][1])]
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_compose_matches_sequential_application(seed):
+    rng = random.Random(seed)
+    original = "".join(rng.choice("ab<>\n") for _ in range(rng.randrange(60)))
+    content, batches = original, []
+    for _ in range(rng.randrange(1, 6)):
+        edits = random_edits(rng, content)
+        batches.append(edits)
+        content = apply(content, edits)
+    composed = compose_edits(len(original), batches)
+    assert apply(original, composed) == content
+    assert all(prev[1] < nxt[0] for prev, nxt in zip(composed, composed[1:]))
+
+
+def test_batch_journal_keeps_separate_hunks(tmp_path):
+    original = "<p>one</p>\n" * 50
+    first = [(3, 6, "ONE")]
+    second = [(len(original) - 7, len(original) - 4, "last")]
+    new = apply(apply(original, first), second)
+    entry = record_edit("page.html", original, new, compose_edits(len(original), [first, second]),
+                        "test", path=str(tmp_path / "journal.jsonl"))
+    assert entry["hunks"] == reverse_hunks(original, first + second)
+    assert len(entry["hunks"]) == 2
+
+
+def test_write_page_refuses_a_page_changed_since_read(tmp_path, monkeypatch):
+    monkeypatch.setattr(undo_journal, "LOCK_DIR", str(tmp_path / "locks"))
+    page = tmp_path / "page.html"
+    page.write_text("<p>new elsewhere</p>\n", encoding="utf-8")
+    with pytest.raises(undo_journal.PageChanged):
+        undo_journal.write_page(str(page), "<p>old</p>\n", "<p>mine</p>\n", path=str(tmp_path / "journal.jsonl"))
+    assert page.read_text(encoding="utf-8") == "<p>new elsewhere</p>\n"
+    assert not (tmp_path / "journal.jsonl").exists()
@@ -0,0 +1,106 @@
+"""
+Equivalence tests: streamed and incremental validation must report exactly
+what a full read of the same page reports.
+"""
+import io
+import os
+import random
+
+import pytest
+
+import validate_html
+from span_index import DEPLOY_DIR
+
+PAGES = ["index.html", "tech-demo.html", "router-monitor.html"]
+
+# Fragments that hit the rules and the parser's edge cases: unbalanced tags,
+# '>' and '<' in text, comment-like text, conflict markers, raw-text elements,
+# a pending '&' at a chunk end.
+SNIPPETS = [
+    "<div>", "</div>", "</section>", "<p>a > b</p>", "x < y", " -> ", "-->", "a > b -->", " >\n=======\n",
+    "<!-- note -->", "<!-- <div> -->", "\n<<<<<<< HEAD\n", "\n=======\n", "\n>>>>>>> main\n",
+    "<script>if (a<b) {}</script>", "<script src=\"app.js\"></script>", "<style>p>a{}</style>",
+    "&amp", "&nbsp;", "\n", "text", "<br>", "<img src=\"x.png\" alt=\"a > b\">",
+]
+
+
+def full_result(content):
+    return validate_html.run_parser("page.html", [content])
+
+
+def messages(result):
+    return result["errors"], result["warnings"], result["critical"]
+
+
+def random_edit(rng, content):
+    pos = rng.randrange(len(content) + 1)
+    kind = rng.random()
+    if kind < 0.4:
+        return content[:pos] + rng.choice(SNIPPETS) + content[pos:]
+    end = min(len(content), pos + rng.randrange(1, 400))
+    if kind < 0.7:
+        return content[:pos] + content[end:]
+    return content[:pos] + rng.choice(SNIPPETS) + content[end:]
+
+
+@pytest.fixture(params=PAGES)
+def page(request):
+    path = os.path.join(DEPLOY_DIR, request.param)
+    if not os.path.exists(path):
+        pytest.skip(f"{request.param} not in deploy/")
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("chunk_size", [7, 100, 4096, validate_html.STREAM_CHUNK_SIZE])
+def test_stream_matches_full_read(page, chunk_size):
+    chunks = validate_html.iter_stream_chunks(io.StringIO(page), chunk_size)
+    assert messages(validate_html.run_parser("page.html", chunks)) == messages(full_result(page))
+
+
+def split_marker_page(chunk_size):
+    # The first chunk_size characters end inside the '=======' line; cutting
+    # after the '>' in the text used to leave '\n=======\n' as a text node of
+    # its own (a false conflict marker).
+    return "<p>" + "x" * (chunk_size - 10) + " a >\n=======\n</p>\n<p>a\n-->\n</p>\n"
+
+
+def test_stream_keeps_text_nodes_whole():
+    content = split_marker_page(validate_html.STREAM_CHUNK_SIZE)
+    chunks = validate_html.iter_stream_chunks(io.StringIO(content))
+    result = validate_html.run_parser("page.html", chunks)
+    assert messages(result) == messages(full_result(content))
+    assert result["errors"] == []
+    assert result["warnings"] == ["Line 4: Suspicious text '-->' found. usage of arrow or broken comment?"]
+
+
+def test_incremental_keeps_text_nodes_whole(tmp_path, monkeypatch):
+    monkeypatch.setattr(validate_html, "SNAPSHOT_DIR", str(tmp_path / "snapshots"))
+    path = tmp_path / "page.html"
+    content = split_marker_page(validate_html.CHECKPOINT_INTERVAL) * 3
+    for version in (content, content.replace("<p>a", "<p>b", 1)):
+        path.write_text(version, encoding="utf-8")
+        result, _ = validate_html.check_file_incremental(str(path))
+        assert messages(result) == messages(validate_html.check_file(str(path)))
+
+
+def test_incremental_matches_full_read(page, tmp_path, monkeypatch):
+    monkeypatch.setattr(validate_html, "SNAPSHOT_DIR", str(tmp_path / "snapshots"))
+    path = tmp_path / "page.html"
+    rng = random.Random(len(page))
+    content = page
+    for step in range(150):
+        path.write_text(content, encoding="utf-8")
+        expected = messages(validate_html.check_file(str(path)))
+        result, _ = validate_html.check_file_incremental(str(path))
+        assert messages(result) == expected, f"edit {step}"
+        assert messages(validate_html.check_file(str(path), stream=True)) == expected, f"edit {step}"
+        content = random_edit(rng, content)
+
+
+def test_duplicate_id_rule_records_every_use(tmp_path):
+    path = tmp_path / "page.html"
+    path.write_text('<div id="a">\n<span id="b"></span>\n<p id="a"></p>\n</div>\n', encoding="utf-8")
+    result = validate_html.check_file(str(path), rules=validate_html.DEFAULT_RULES + ("duplicate-id",))
+    assert result["ids"] == {"a": [[1, "div"], [3, "p"]], "b": [[2, "span"]]}
+    assert any('Duplicate id="a"' in e for e in result["errors"])